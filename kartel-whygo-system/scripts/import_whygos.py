@@ -3,11 +3,20 @@
 Import WhyGOs from Markdown Files
 
 Main script to parse all WhyGO markdown files and generate JSON data files
+
+Usage:
+  python scripts/import_whygos.py
+  python scripts/import_whygos.py --individual-dir "../INDIVIDUAL WHYGOS" --workers 8
+
+Files are parsed in parallel across a process pool (--workers 1 parses
+them one after another in this process).
 """
 
+import argparse
 import sys
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -21,7 +30,40 @@ from src.parsers.reference_parser import parse_employees_from_reference, parse_d
 from src.models.whygo import whygo_to_dict, person_to_dict, department_to_dict
 
 
+def _parse_job(job):
+    """Run one (parse function, args) job; returns (result, None) or (None, error)"""
+    parse, parse_args = job
+    try:
+        return parse(*parse_args), None
+    except Exception as e:
+        return None, e
+
+
+def parse_files(jobs, workers):
+    """
+    Run parse jobs, in parallel across worker processes when workers > 1
+
+    Returns: (result, error) per job, in job order
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [_parse_job(job) for job in jobs]
+
+    # Hand each worker a few jobs at a time so hundreds of small files
+    # don't pay a round trip each
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_job, jobs, chunksize=chunksize))
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Import WhyGO markdown files into the JSON data files')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes parsing files in parallel (default: CPU count; 1 = no pool)')
+    parser.add_argument('--individual-dir', type=Path,
+                        help='Also import every *Individual_WhyGO*.md in this directory '
+                             '(person read from the Employee field)')
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Kartel WhyGO Import Script")
     print("=" * 60)
@@ -42,10 +84,35 @@ def main():
         "Platform": base_dir / "Company WhyGos" / "Platform_Department_WhyGOs__2026(Final).md"
     }
 
-    # Individual files
+    # Individual files: label -> (file, person name or None to read it from the file)
     individual_files = {
-        "Wayan Palmieri": base_dir / "INDIVIDUAL WHYGOS" / "Wayan_Individual_WhyGOs_2026_DRAFT.md"
+        "Wayan Palmieri": (base_dir / "INDIVIDUAL WHYGOS" / "Wayan_Individual_WhyGOs_2026_DRAFT.md", "Wayan Palmieri")
+    }
+    if args.individual_dir:
+        known = {path.resolve() for path, _ in individual_files.values()}
+        for path in sorted(args.individual_dir.glob("*Individual_WhyGO*.md")):
+            if path.resolve() not in known:
+                individual_files[path.name] = (path, None)
+
+    # =============================================
+    # Parse all markdown files
+    # =============================================
+    jobs = []
+
+    def add_job(parse, *parse_args) -> int:
+        jobs.append((parse, parse_args))
+        return len(jobs) - 1
+
+    company_job = add_job(parse_company_whygos, str(company_md))
+    dept_jobs = {
+        dept_name: add_job(parse_department_whygos, str(dept_file))
+        for dept_name, dept_file in dept_files.items() if dept_file.exists()
+    }
+    indiv_jobs = {
+        label: add_job(parse_individual_whygos, str(indiv_file), person_name)
+        for label, (indiv_file, person_name) in individual_files.items() if indiv_file.exists()
     }
+    results = parse_files(jobs, args.workers)
 
     # =============================================
     # Parse Company WhyGOs
@@ -54,7 +121,9 @@ def main():
     print(f"   File: {company_md.name}")
 
     try:
-        company_whygos = parse_company_whygos(str(company_md))
+        company_whygos, error = results[company_job]
+        if error:
+            raise error
         print(f"   ✓ Found {len(company_whygos)} Company WhyGOs")
 
         total_outcomes = sum(len(w.outcomes) for w in company_whygos)
@@ -82,7 +151,9 @@ def main():
             continue
 
         try:
-            dept_whygos = parse_department_whygos(str(dept_file))
+            dept_whygos, error = results[dept_jobs[dept_name]]
+            if error:
+                raise error
             all_dept_whygos.extend(dept_whygos)
 
             outcomes_count = sum(len(w.outcomes) for w in dept_whygos)
@@ -103,15 +174,17 @@ def main():
 
     all_individual_whygos = []
 
-    for person_name, indiv_file in individual_files.items():
-        print(f"   {person_name}: ", end="")
+    for label, (indiv_file, _) in individual_files.items():
+        print(f"   {label}: ", end="")
 
         if not indiv_file.exists():
             print(f"✗ File not found: {indiv_file}")
             continue
 
         try:
-            indiv_whygos = parse_individual_whygos(str(indiv_file), person_name)
+            indiv_whygos, error = results[indiv_jobs[label]]
+            if error:
+                raise error
             all_individual_whygos.extend(indiv_whygos)
 
             outcomes_count = sum(len(w.outcomes) for w in indiv_whygos)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Migrate JSON data files into a SQLite database
+
+Usage:
+  python scripts/migrate_to_sqlite.py
+  python scripts/migrate_to_sqlite.py --data-dir data --db data/whygo.db
+
+After migrating, set STORAGE_BACKEND=sqlite (and optionally SQLITE_PATH)
+in .env to serve the API from the database.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.repositories.sqlite_repository import migrate_json_to_sqlite
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Migrate data/*.json into a SQLite database')
+    parser.add_argument('--data-dir', default='data', help='Directory containing the JSON data files')
+    parser.add_argument('--db', default='data/whygo.db', help='SQLite database file to create')
+
+    args = parser.parse_args()
+
+    print(f"\n🗄️  Migrating {args.data_dir}/*.json -> {args.db}")
+
+    counts = migrate_json_to_sqlite(args.data_dir, args.db)
+
+    for table, count in counts.items():
+        print(f"   ✓ {table}: {count}")
+
+    print(f"\n✅ Migration complete!")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Recompute every outcome status, e.g. after changing status thresholds
+
+Usage:
+  python scripts/recompute_statuses.py
+  python scripts/recompute_statuses.py --threshold currency=95,75 --dry-run
+
+Thresholds are "<metric_type>=<on-pace %>,<slightly-off %>"; metric types
+not given use 100,80.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.repositories.json_repository import JsonWhygoRepository, JsonProgressRepository
+from src.services.progress_service import ProgressService
+from src.services.status_engine import StatusEngine
+
+
+def parse_threshold(value: str):
+    """Parse 'currency=95,75' into ('currency', (95.0, 75.0))"""
+    try:
+        metric_type, limits = value.split('=', 1)
+        on_pace, slightly_off = (float(v) for v in limits.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected <metric_type>=<on-pace>,<slightly-off>, got '{value}'")
+    return metric_type.strip(), (on_pace, slightly_off)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recompute outcome statuses for the whole org')
+    parser.add_argument('--data-dir', default='data', help='Directory containing the JSON data files')
+    parser.add_argument('--threshold', action='append', type=parse_threshold, default=[],
+                        help='Per metric type thresholds, e.g. currency=95,75 (repeatable)')
+    parser.add_argument('--dry-run', action='store_true', help='List changes without saving')
+
+    args = parser.parse_args()
+    thresholds = dict(args.threshold)
+
+    whygo_repo = JsonWhygoRepository(data_dir=args.data_dir)
+    progress_repo = JsonProgressRepository(data_dir=args.data_dir)
+    service = ProgressService(whygo_repo, progress_repo, status_thresholds=thresholds)
+
+    started = time.perf_counter()
+    engine = StatusEngine.from_repository(whygo_repo, thresholds)
+    changes = engine.changed_statuses()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print(f"\n📊 Computed {len(engine.columns)} outcomes x 4 quarters in {elapsed_ms:.1f} ms")
+    for outcome_id, quarter, status in changes:
+        print(f"   {outcome_id} {quarter}: [{status or ' '}]")
+
+    if args.dry_run or not changes:
+        print(f"\n{len(changes)} status change(s){' (dry run, nothing saved)' if args.dry_run else ''}")
+        return
+
+    changed = service.recompute_statuses(engine)
+    if changed < 0:
+        print("\n❌ Failed to save recomputed statuses")
+        sys.exit(1)
+
+    print(f"\n✅ Updated {changed} status(es)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ FastAPI Configuration using Pydantic Settings
 """
 
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Tuple
 
 
 class Settings(BaseSettings):
@@ -19,12 +19,46 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 10080  # 1 week default
 
+    # Verified JWTs are cached for up to this long (never past their exp)
+    token_cache_ttl_seconds: float = 300
+    token_cache_size: int = 4096
+
     # CORS settings
     allowed_origins: List[str] = ["http://localhost:3000"]
 
     # Data paths
     data_dir: str = "data"
 
+    # Storage backend: "json" (data/*.json files) or "sqlite"
+    storage_backend: str = "json"
+    sqlite_path: str = "data/whygo.db"
+
+    # Seconds between checks for data files changed by other processes
+    # (JSON backend only); 0 disables hot reload
+    reload_interval_seconds: float = 2.0
+
+    # Write-behind: request handlers only update memory and a background
+    # flusher writes changes at most write_behind_ms later, or as soon as
+    # write_behind_max_mutations are pending; 0 saves within each request
+    write_behind_ms: float = 200
+    write_behind_max_mutations: int = 100
+    # Retries (with exponential backoff) of a failing flush before giving
+    # up on it; /health reports "degraded" meanwhile
+    write_behind_max_retries: int = 5
+
+    # fsync data files on every write; turning this off trades durability
+    # across power loss for faster flushes
+    fsync_writes: bool = True
+
+    # Live status stream (/api/stream): seconds between keepalive comments
+    # and status deltas buffered per connection before it must resync
+    stream_keepalive_seconds: float = 15
+    stream_queue_size: int = 256
+
+    # Status thresholds per numeric metric type as (on-pace %, slightly-off %),
+    # e.g. STATUS_THRESHOLDS='{"currency": [95, 75]}'; unset types use 100/80
+    status_thresholds: Dict[str, Tuple[float, float]] = {}
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -8,74 +8,363 @@ plus authentication/authorization dependencies.
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from typing import Optional
+from typing import List, Optional
+import threading
 
+from ..repositories.interfaces import IWhygoRepository, IProgressRepository
 from ..repositories.json_repository import JsonWhygoRepository, JsonProgressRepository
+from ..repositories.sqlite_repository import SqliteWhygoRepository, SqliteProgressRepository
+from ..repositories.reloader import RepositoryReloader, WatchedRepository
+from ..repositories.async_repository import AsyncWhygoRepository, AsyncProgressRepository
+from ..repositories.write_behind import WriteBehindFlusher
+from ..repositories.login_log import LoginLog
+from ..repositories.events import EventBus, REPOSITORY_RELOADED
 from ..services.whygo_service import WhygoService
-from ..services.progress_service import ProgressService
-from ..services.user_service import UserService
-from ..services.onboarding_service import OnboardingService
+from ..services.progress_service import AsyncProgressService
+from ..services.user_service import AsyncUserService, UserContext
+from ..services.onboarding_service import AsyncOnboardingService
 from ..services.validation_service import ValidationService
+from ..services.rollup_cache import StatusRollupCache
+from ..services.cascade_rollup import CascadeRollupEngine
+from ..services.org_chart import OrgChart
+from ..services.approval_queue import ApprovalQueue
+from ..services.status_feed import StatusFeed
 from ..models.api_models import TokenData
 from .config import settings
+from .response_cache import ResponseCache
+from .token_cache import TokenCache
 
 
 # HTTP Bearer token security
 security = HTTPBearer()
 
 # Repository singletons (load data once, reuse in memory)
-_whygo_repo: Optional[JsonWhygoRepository] = None
-_progress_repo: Optional[JsonProgressRepository] = None
-
-
-def get_whygo_repository() -> JsonWhygoRepository:
-    """Get or create the WhyGO repository singleton"""
+_whygo_repo: Optional[IWhygoRepository] = None
+_progress_repo: Optional[IProgressRepository] = None
+_repo_swap_lock = threading.Lock()
+_reloader: Optional[RepositoryReloader] = None
+_write_behind: Optional[WriteBehindFlusher] = None
+_login_log: Optional[LoginLog] = None
+# Shared by the repositories and their hot-reloaded replacements
+_event_bus = EventBus()
+_rollup_cache: Optional[StatusRollupCache] = None
+_cascade_engine: Optional[CascadeRollupEngine] = None
+_org_chart: Optional[OrgChart] = None
+_approval_queue: Optional[ApprovalQueue] = None
+_status_feed: Optional[StatusFeed] = None
+_response_cache = ResponseCache()
+_token_cache: TokenCache[TokenData] = TokenCache(
+    max_entries=settings.token_cache_size,
+    ttl_seconds=settings.token_cache_ttl_seconds
+)
+
+
+def get_whygo_repository() -> IWhygoRepository:
+    """Get or create the WhyGO repository singleton for the configured backend"""
     global _whygo_repo
     if _whygo_repo is None:
-        _whygo_repo = JsonWhygoRepository(data_dir=settings.data_dir)
+        if settings.storage_backend == "sqlite":
+            _whygo_repo = SqliteWhygoRepository(db_path=settings.sqlite_path, events=_event_bus)
+        else:
+            _whygo_repo = _load_json_whygo_repository()
     return _whygo_repo
 
 
-def get_progress_repository() -> JsonProgressRepository:
-    """Get or create the Progress repository singleton"""
+def get_login_log() -> Optional[LoginLog]:
+    """
+    Get or create the login log (last-login timestamps, kept out of employees.json)
+
+    JSON backend only: SQLite records a login as a single-row update.
+    """
+    global _login_log
+    if settings.storage_backend == "sqlite":
+        return None
+    if _login_log is None:
+        _login_log = LoginLog(data_dir=settings.data_dir)
+    return _login_log
+
+
+def _load_json_whygo_repository() -> JsonWhygoRepository:
+    """Load the JSON WhyGO repository with logged last-login times applied"""
+    repo = JsonWhygoRepository(data_dir=settings.data_dir, fsync=settings.fsync_writes, events=_event_bus)
+    get_login_log().apply_to(repo)
+    return repo
+
+
+def get_progress_repository() -> IProgressRepository:
+    """Get or create the Progress repository singleton for the configured backend"""
     global _progress_repo
     if _progress_repo is None:
-        _progress_repo = JsonProgressRepository(data_dir=settings.data_dir)
+        if settings.storage_backend == "sqlite":
+            _progress_repo = SqliteProgressRepository(db_path=settings.sqlite_path, events=_event_bus)
+        else:
+            _progress_repo = _load_json_progress_repository()
     return _progress_repo
 
 
-# Service factories
-def get_whygo_service(
-    repo: JsonWhygoRepository = Depends(get_whygo_repository)
+def _load_json_progress_repository() -> JsonProgressRepository:
+    return JsonProgressRepository(data_dir=settings.data_dir, fsync=settings.fsync_writes, events=_event_bus)
+
+
+def get_event_bus() -> EventBus:
+    """Change events from the current (and any reloaded) repositories"""
+    return _event_bus
+
+
+async def get_async_whygo_repository(
+    repo: IWhygoRepository = Depends(get_whygo_repository)
+) -> AsyncWhygoRepository:
+    """Current WhyGO repository with an awaitable save_all()"""
+    return AsyncWhygoRepository(repo, _write_behind)
+
+
+async def get_async_progress_repository(
+    repo: IProgressRepository = Depends(get_progress_repository)
+) -> AsyncProgressRepository:
+    """Current Progress repository with an awaitable save_all()"""
+    return AsyncProgressRepository(repo, _write_behind)
+
+
+def _swap_whygo_repository(old: IWhygoRepository, new: IWhygoRepository) -> bool:
+    """Replace the WhyGO repository singleton if it is still `old`"""
+    global _whygo_repo
+    with _repo_swap_lock:
+        if _whygo_repo is not old:
+            return False
+        _whygo_repo = new
+    _event_bus.publish(REPOSITORY_RELOADED, new, new.version)
+    return True
+
+
+def _swap_progress_repository(old: IProgressRepository, new: IProgressRepository) -> bool:
+    """Replace the Progress repository singleton if it is still `old`"""
+    global _progress_repo
+    with _repo_swap_lock:
+        if _progress_repo is not old:
+            return False
+        _progress_repo = new
+    _event_bus.publish(REPOSITORY_RELOADED, new)
+    return True
+
+
+def start_repository_reloader():
+    """Start hot reload of the JSON data files (no-op for SQLite or when disabled)"""
+    global _reloader
+    if settings.storage_backend != "json" or settings.reload_interval_seconds <= 0:
+        return
+    if _reloader is not None:
+        return
+
+    _reloader = RepositoryReloader(interval_seconds=settings.reload_interval_seconds)
+    _reloader.watch(WatchedRepository(
+        name="WhyGO",
+        get_current=lambda: _whygo_repo,
+        load=_load_json_whygo_repository,
+        swap=_swap_whygo_repository
+    ))
+    _reloader.watch(WatchedRepository(
+        name="progress",
+        get_current=lambda: _progress_repo,
+        load=_load_json_progress_repository,
+        swap=_swap_progress_repository
+    ))
+    _reloader.start()
+
+
+def stop_repository_reloader():
+    """Stop the hot reload poller"""
+    global _reloader
+    if _reloader is not None:
+        _reloader.stop()
+        _reloader = None
+
+
+def start_write_behind():
+    """Start the background flusher (no-op when write_behind_ms is 0)"""
+    global _write_behind
+    if settings.write_behind_ms <= 0 or _write_behind is not None:
+        return
+
+    _write_behind = WriteBehindFlusher(
+        interval_ms=settings.write_behind_ms,
+        max_mutations=settings.write_behind_max_mutations,
+        max_retries=settings.write_behind_max_retries
+    )
+    _write_behind.start()
+
+
+def stop_write_behind():
+    """Flush pending changes and stop the background flusher"""
+    global _write_behind
+    if _write_behind is not None:
+        flusher, _write_behind = _write_behind, None
+        flusher.stop()
+
+
+def get_storage_health() -> dict:
+    """
+    Flush failures and cross-process save conflicts for the health check
+
+    Returns:
+        {'healthy': bool, 'write_behind': [failing repositories],
+        'conflicts': int, 'last_conflict': str or None}; unhealthy while
+        the write-behind flusher has changes it could not write
+    """
+    flusher = _write_behind.health() if _write_behind is not None else {'healthy': True, 'failing': []}
+    return {
+        'healthy': flusher['healthy'],
+        'write_behind': flusher['failing'],
+        # Saves that had to merge (or discard) another process's changes
+        'conflicts': getattr(_whygo_repo, 'conflicts', 0),
+        'last_conflict': getattr(_whygo_repo, 'last_conflict', None)
+    }
+
+
+# Derived caches (rebuilt when the repository they were built from is swapped)
+def get_rollup_cache(
+    repo: IWhygoRepository = Depends(get_whygo_repository)
+) -> StatusRollupCache:
+    """Get or create the dashboard rollup cache for the current repository"""
+    global _rollup_cache
+    with _repo_swap_lock:
+        # The singleton, in case a reload swapped it since repo was resolved
+        repo = _whygo_repo or repo
+        if _rollup_cache is None or _rollup_cache.repo is not repo:
+            if _rollup_cache is not None:
+                _rollup_cache.close()
+            _rollup_cache = StatusRollupCache(repo)
+        return _rollup_cache
+
+
+def get_cascade_engine(
+    repo: IWhygoRepository = Depends(get_whygo_repository)
+) -> CascadeRollupEngine:
+    """Get or create the goal cascade rollup engine for the current repository"""
+    global _cascade_engine
+    with _repo_swap_lock:
+        repo = _whygo_repo or repo
+        if _cascade_engine is None or _cascade_engine.repo is not repo:
+            if _cascade_engine is not None:
+                _cascade_engine.close()
+            _cascade_engine = CascadeRollupEngine(repo)
+        return _cascade_engine
+
+
+def get_org_chart(
+    repo: IWhygoRepository = Depends(get_whygo_repository)
+) -> OrgChart:
+    """Get or create the org chart for the current repository"""
+    global _org_chart
+    if _org_chart is None or _org_chart.repo is not repo:
+        _org_chart = OrgChart(repo)
+    return _org_chart
+
+
+def get_approval_queue(
+    repo: IWhygoRepository = Depends(get_whygo_repository)
+) -> ApprovalQueue:
+    """Get or create the pending-approval queue for the current repository"""
+    global _approval_queue
+    with _repo_swap_lock:
+        repo = _whygo_repo or repo
+        if _approval_queue is None or _approval_queue.repo is not repo:
+            if _approval_queue is not None:
+                _approval_queue.repo.remove_transition_listener(_approval_queue.goal_transitioned)
+            _approval_queue = ApprovalQueue(repo)
+            repo.add_transition_listener(_approval_queue.goal_transitioned)
+        return _approval_queue
+
+
+def get_status_feed(
+    repo: IWhygoRepository = Depends(get_whygo_repository)
+) -> StatusFeed:
+    """Get or create the status delta feed (follows repository reloads on its own)"""
+    global _status_feed
+    with _repo_swap_lock:
+        if _status_feed is None:
+            # The singleton, in case a reload swapped it since repo was resolved
+            _status_feed = StatusFeed(_event_bus, _whygo_repo or repo)
+    return _status_feed
+
+
+def _reset_derived_caches(event):
+    """
+    Drop the structures derived from repository data after a reload or a
+    save that merged another process's changes; rebuilt from the current
+    repository on next use (the status feed follows reloads itself)
+    """
+    global _rollup_cache, _cascade_engine, _org_chart, _approval_queue
+    # Same lock as the getters, so a structure being built for the old
+    # repository isn't installed (and left subscribed) after the reset
+    with _repo_swap_lock:
+        if _approval_queue is not None:
+            _approval_queue.repo.remove_transition_listener(_approval_queue.goal_transitioned)
+        if _rollup_cache is not None:
+            _rollup_cache.close()
+        if _cascade_engine is not None:
+            _cascade_engine.close()
+        _rollup_cache = _cascade_engine = _org_chart = _approval_queue = None
+
+
+_event_bus.subscribe(_reset_derived_caches, kinds=(REPOSITORY_RELOADED,))
+
+
+def get_status_observers(
+    rollups: StatusRollupCache = Depends(get_rollup_cache),
+    cascade: CascadeRollupEngine = Depends(get_cascade_engine),
+    approvals: ApprovalQueue = Depends(get_approval_queue)
+) -> List:
+    """Derived structures to notify when outcomes change or goals are created"""
+    return [rollups, cascade, approvals]
+
+
+# Service factories (async endpoints: services get repositories whose
+# save_all() is awaited instead of blocking)
+async def get_whygo_service(
+    repo: AsyncWhygoRepository = Depends(get_async_whygo_repository),
+    rollups: StatusRollupCache = Depends(get_rollup_cache)
 ) -> WhygoService:
-    """Create WhygoService with injected repository"""
-    return WhygoService(repo)
+    """Create WhygoService with injected repository and rollup cache"""
+    return WhygoService(repo, rollups)
+
 
+async def get_progress_service(
+    whygo_repo: AsyncWhygoRepository = Depends(get_async_whygo_repository),
+    progress_repo: AsyncProgressRepository = Depends(get_async_progress_repository),
+    status_observers: List = Depends(get_status_observers)
+) -> AsyncProgressService:
+    """Create AsyncProgressService with injected repositories"""
+    return AsyncProgressService(
+        whygo_repo,
+        progress_repo,
+        status_observers=status_observers,
+        status_thresholds=settings.status_thresholds
+    )
 
-def get_progress_service(
-    whygo_repo: JsonWhygoRepository = Depends(get_whygo_repository),
-    progress_repo: JsonProgressRepository = Depends(get_progress_repository)
-) -> ProgressService:
-    """Create ProgressService with injected repositories"""
-    return ProgressService(whygo_repo, progress_repo)
 
+async def get_user_service(
+    repo: AsyncWhygoRepository = Depends(get_async_whygo_repository),
+    login_log: Optional[LoginLog] = Depends(get_login_log)
+) -> AsyncUserService:
+    """Create AsyncUserService with injected repository and login log"""
+    return AsyncUserService(repo, login_log)
 
-def get_user_service(
-    repo: JsonWhygoRepository = Depends(get_whygo_repository)
-) -> UserService:
-    """Create UserService with injected repository"""
-    return UserService(repo)
 
+async def get_response_cache() -> ResponseCache:
+    """Get the shared cache of serialized read-endpoint responses"""
+    return _response_cache
 
-def get_onboarding_service(
-    repo: JsonWhygoRepository = Depends(get_whygo_repository)
-) -> OnboardingService:
-    """Create OnboardingService with injected repository"""
-    return OnboardingService(repo)
 
+async def get_onboarding_service(
+    repo: AsyncWhygoRepository = Depends(get_async_whygo_repository),
+    approval_queue: ApprovalQueue = Depends(get_approval_queue)
+) -> AsyncOnboardingService:
+    """Create AsyncOnboardingService with injected repository and approval queue"""
+    return AsyncOnboardingService(repo, approval_queue)
 
-def get_validation_service(
-    repo: JsonWhygoRepository = Depends(get_whygo_repository)
+
+async def get_validation_service(
+    repo: IWhygoRepository = Depends(get_whygo_repository)
 ) -> ValidationService:
     """Create ValidationService with injected repository"""
     return ValidationService(repo)
@@ -86,6 +375,9 @@ def decode_token(token: str) -> TokenData:
     """
     Decode and validate JWT token
 
+    Verified tokens are cached until the earlier of their exp claim and
+    token_cache_ttl_seconds, so repeat requests skip the signature check.
+
     Args:
         token: JWT token string
 
@@ -95,6 +387,10 @@ def decode_token(token: str) -> TokenData:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    token_data = _token_cache.get(token)
+    if token_data is not None:
+        return token_data
+
     try:
         payload = jwt.decode(
             token,
@@ -109,11 +405,12 @@ def decode_token(token: str) -> TokenData:
                 detail="Invalid token: missing subject"
             )
 
-        return TokenData(
+        exp = payload.get("exp")
+        token_data = TokenData(
             person_id=person_id,
             email=payload.get("email"),
             level=payload.get("level"),
-            exp=payload.get("exp")
+            exp=exp
         )
     except JWTError as e:
         raise HTTPException(
@@ -121,11 +418,14 @@ def decode_token(token: str) -> TokenData:
             detail=f"Invalid token: {str(e)}"
         )
 
+    _token_cache.put(token, token_data, exp)
+    return token_data
+
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    user_service: UserService = Depends(get_user_service)
-) -> dict:
+    user_service: AsyncUserService = Depends(get_user_service)
+) -> UserContext:
     """
     Get current authenticated user from JWT token
 
@@ -134,14 +434,16 @@ def get_current_user(
         user_service: UserService for fetching user profile
 
     Returns:
-        dict with 'person', 'department', 'manager', 'direct_reports'
+        UserContext read like the get_user_profile() dict ('person',
+        'department', 'manager', 'direct_reports'); everything except the
+        person is only looked up when first accessed
 
     Raises:
         HTTPException: If token invalid or user not found
     """
     token_data = decode_token(credentials.credentials)
 
-    user_profile = user_service.get_user_profile(token_data.person_id)
+    user_profile = user_service.get_user_context(token_data.person_id)
     if not user_profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -164,7 +466,7 @@ def require_level(required_level: str):
     Returns:
         Dependency function that checks user level
     """
-    def level_checker(current_user: dict = Depends(get_current_user)):
+    async def level_checker(current_user: dict = Depends(get_current_user)):
         levels = ['ic', 'manager', 'department_head', 'executive']
 
         user_level = current_user['person'].level
@@ -4,12 +4,33 @@ Main FastAPI Application
 Entry point for the Kartel WhyGO Management API.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .config import settings
+from .dependencies import (
+    start_repository_reloader,
+    stop_repository_reloader,
+    start_write_behind,
+    stop_write_behind,
+    get_whygo_repository,
+    get_storage_health
+)
+from .serializers import precompute_fragments
 
 # Import routers (we'll create these next)
-from .routers import auth, users, onboarding, company, departments, individuals, outcomes
+from .routers import auth, users, onboarding, company, departments, individuals, outcomes, stream
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background workers with the application"""
+    precompute_fragments(get_whygo_repository())
+    start_write_behind()
+    start_repository_reloader()
+    yield
+    stop_repository_reloader()
+    stop_write_behind()
 
 
 # Create FastAPI app
@@ -17,7 +38,8 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     debug=settings.debug,
-    description="REST API for Kartel WhyGO Management System"
+    description="REST API for Kartel WhyGO Management System",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -37,10 +59,11 @@ app.include_router(company.router, prefix="/api/company", tags=["Company Goals"]
 app.include_router(departments.router, prefix="/api/departments", tags=["Departments"])
 app.include_router(individuals.router, prefix="/api/individuals", tags=["Individual Goals"])
 app.include_router(outcomes.router, prefix="/api/outcomes", tags=["Outcomes & Progress"])
+app.include_router(stream.router, prefix="/api/stream", tags=["Live Updates"])
 
 
 @app.get("/", tags=["Root"])
-def root():
+async def root():
     """API root - returns basic info"""
     return {
         "message": "Kartel WhyGO Management API",
@@ -51,9 +74,11 @@ def root():
 
 
 @app.get("/health", tags=["Health"])
-def health_check():
-    """Health check endpoint"""
+async def health_check():
+    """Health check endpoint ("degraded" while saved changes can't be written to disk)"""
+    storage = get_storage_health()
     return {
-        "status": "healthy",
-        "version": settings.version
+        "status": "healthy" if storage['healthy'] else "degraded",
+        "version": settings.version,
+        "storage": storage
     }
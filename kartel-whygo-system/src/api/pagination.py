@@ -0,0 +1,196 @@
+"""
+Cursor pagination, field projection and filters for list endpoints
+
+List endpoints accept:
+- limit / cursor: page through results. With either parameter the body is
+  {"items": [...], "next_cursor": "..."} (next_cursor is null on the last
+  page); without them the full list is returned as before.
+- fields: comma-separated fields to return, e.g.
+  fields=id,status,outcomes.status_q1 ("outcomes" alone keeps every
+  outcome field).
+- Goal lists also take status, owner, quarter and quarter_status filters.
+"""
+
+import base64
+import json
+from typing import Callable, Dict, List, Literal, Optional, Tuple
+
+from fastapi import HTTPException, Query
+
+from . import serializers
+from ..services.whygo_service import ANY_STATUS
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# quarter_status values -> status symbol (None = not recorded)
+QUARTER_STATUS_VALUES = {
+    '+': '+', 'on_pace': '+',
+    '~': '~', 'slightly_off': '~',
+    '-': '-', 'off_pace': '-',
+    'none': None, 'not_recorded': None,
+}
+
+
+class ListParams:
+    """Pagination and projection query parameters"""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description="Page size"),
+        fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. id,status,outcomes.status_q1")
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.fields = fields
+
+    @property
+    def paginated(self) -> bool:
+        return self.cursor is not None or self.limit is not None
+
+
+class GoalFilters:
+    """Goal list filter query parameters"""
+
+    def __init__(
+        self,
+        status: Optional[Literal['draft', 'pending_approval', 'approved', 'archived']] = Query(
+            None, description="Goal status"
+        ),
+        owner: Optional[str] = Query(None, description="Person owning the goal or one of its outcomes"),
+        quarter: Optional[Literal['Q1', 'Q2', 'Q3', 'Q4']] = Query(None, description="Quarter for quarter_status"),
+        quarter_status: Optional[str] = Query(
+            None, description="Outcome status in the quarter: on_pace (+), slightly_off (~), off_pace (-) or none"
+        )
+    ):
+        if quarter_status is not None and quarter_status not in QUARTER_STATUS_VALUES:
+            raise HTTPException(status_code=400, detail=f"Invalid quarter_status: {quarter_status}")
+        if quarter_status is not None and quarter is None:
+            raise HTTPException(status_code=400, detail="quarter_status requires quarter")
+
+        self.status = status
+        self.owner = owner
+        self.quarter = quarter
+        self.quarter_status = QUARTER_STATUS_VALUES[quarter_status] if quarter_status is not None else ANY_STATUS
+
+    def apply(self, whygo_service, goals: List) -> List:
+        return whygo_service.filter_goals(
+            goals,
+            status=self.status,
+            owner_id=self.owner,
+            quarter=self.quarter,
+            quarter_status=self.quarter_status
+        )
+
+
+def encode_cursor(item_id: str, position: int) -> str:
+    raw = json.dumps({'after': item_id, 'pos': position}, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return str(data['after']), int(data['pos'])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(items: List, cursor: Optional[str], limit: Optional[int]) -> Tuple[List, Optional[str]]:
+    """
+    Slice one page out of an ordered list of items with an `id`
+
+    The cursor remembers the last item's ID and position, so a page still
+    continues after the right item if earlier items were added or removed.
+
+    Returns:
+        (page, cursor for the next page or None)
+    """
+    start = 0
+    if cursor:
+        after_id, position = decode_cursor(cursor)
+        if position < len(items) and items[position].id == after_id:
+            start = position + 1
+        else:
+            start = next(
+                (idx + 1 for idx, item in enumerate(items) if item.id == after_id),
+                min(position + 1, len(items))
+            )
+
+    limit = limit or DEFAULT_LIMIT
+    page = items[start:start + limit]
+    end = start + len(page)
+    next_cursor = encode_cursor(page[-1].id, end - 1) if page and end < len(items) else None
+    return page, next_cursor
+
+
+def parse_fields(
+    fields: str,
+    allowed: Tuple[str, ...],
+    nested_allowed: Optional[Tuple[str, ...]] = None
+) -> Dict[str, Optional[tuple]]:
+    """
+    Turn "id,status,outcomes.status_q1" into a projection for serializers.project
+
+    Raises:
+        HTTPException 400 for unknown fields
+    """
+    projection: Dict[str, Optional[tuple]] = {}
+    nested: Dict[str, List[str]] = {}
+
+    for field in (f.strip() for f in fields.split(',')):
+        if not field:
+            continue
+        name, _, sub_field = field.partition('.')
+        if name not in allowed:
+            raise HTTPException(status_code=400, detail=f"Unknown field: {field}")
+
+        projection[name] = None
+        if name == 'outcomes' and nested_allowed is not None:
+            sub_fields = nested.setdefault(name, [])
+            if sub_field:
+                if sub_field not in nested_allowed:
+                    raise HTTPException(status_code=400, detail=f"Unknown field: {field}")
+                if sub_field not in sub_fields:
+                    sub_fields.append(sub_field)
+        elif sub_field:
+            raise HTTPException(status_code=400, detail=f"Unknown field: {field}")
+
+    for name, sub_fields in nested.items():
+        projection[name] = tuple(sub_fields) if sub_fields else tuple(nested_allowed)
+
+    return projection
+
+
+def render_list(
+    items: List,
+    params: ListParams,
+    encode: Callable[[List], bytes],
+    allowed_fields: Tuple[str, ...],
+    nested_fields: Optional[Tuple[str, ...]] = None
+) -> bytes:
+    """
+    Encode one page of items (or all of them) with optional projection
+
+    Args:
+        items: Filtered items in display order
+        params: Pagination/projection parameters
+        encode: Serializer for the full representation of a list of items
+        allowed_fields: Fields that may be requested with ?fields=
+        nested_fields: Fields allowed under "outcomes."
+    """
+    if params.paginated:
+        page, next_cursor = paginate(items, params.cursor, params.limit)
+    else:
+        page, next_cursor = items, None
+
+    if params.fields:
+        body = serializers.projected(page, parse_fields(params.fields, allowed_fields, nested_fields))
+    else:
+        body = encode(page)
+
+    if not params.paginated:
+        return body
+    return b'{"items":' + body + b',"next_cursor":' + serializers.dumps(next_cursor) + b'}'
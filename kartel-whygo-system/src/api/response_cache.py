@@ -0,0 +1,94 @@
+"""
+Response cache for read endpoints
+
+Serialized JSON bodies are cached per (endpoint, query params, scope,
+data version) with a strong ETag. A request whose If-None-Match already
+names the current ETag gets a 304 without the body being rebuilt, so
+polling dashboards cost a dictionary lookup while nothing changes.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from .serializers import dumps
+
+
+class ResponseCache:
+    """LRU map of cache key -> (ETag, serialized body)"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, body: bytes) -> Tuple[str, bytes]:
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return etag, body
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    return etag in (tag.strip() for tag in header.split(','))
+
+
+def cached_response(
+    request: Request,
+    cache: ResponseCache,
+    version: int,
+    build: Callable[[], Any],
+    scope: tuple = ()
+) -> Response:
+    """
+    Serve a GET endpoint's body from the cache, honouring If-None-Match
+
+    Args:
+        request: Incoming request (path, query params, If-None-Match)
+        cache: Response cache to use
+        version: Data version the body is derived from (repo.version,
+            which also moves when another worker commits to a shared
+            SQLite database; JSON workers pick up each other's saves
+            through the reloader)
+        build: Builds the response content when it isn't cached, either
+            JSON bytes (see serializers) or a JSON-compatible object
+        scope: Extra key parts for per-user content (e.g. person ID)
+
+    Returns:
+        304 if the client's copy is current, otherwise the JSON body
+    """
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())), scope, version)
+    entry = cache.get(key)
+    if entry is None:
+        content = build()
+        body = content if isinstance(content, bytes) else dumps(jsonable_encoder(content))
+        entry = cache.put(key, body)
+
+    etag, body = entry
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type='application/json', headers=headers)
@@ -9,7 +9,7 @@ from jose import jwt
 from datetime import datetime, timedelta
 
 from ..dependencies import get_user_service, settings
-from ...services.user_service import UserService
+from ...services.user_service import AsyncUserService
 from ...models.api_models import LoginRequest, Token
 
 
@@ -17,9 +17,9 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     request: LoginRequest,
-    user_service: UserService = Depends(get_user_service)
+    user_service: AsyncUserService = Depends(get_user_service)
 ):
     """
     Simple email-based login (no password for MVP)
@@ -36,7 +36,7 @@ def login(
         )
 
     # Record login timestamp
-    user_service.record_login(person.id)
+    await user_service.record_login(person.id)
 
     # Create JWT token
     expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
@@ -65,7 +65,7 @@ def login(
 
 
 @router.post("/logout")
-def logout():
+async def logout():
     """
     Logout endpoint
 
@@ -2,48 +2,56 @@
 Company Goals Router - Basic implementation
 """
 
-from fastapi import APIRouter, Depends
-from ..dependencies import get_current_user, get_whygo_service
+from fastapi import APIRouter, Depends, HTTPException, Request
+from ..dependencies import get_current_user, get_whygo_service, get_cascade_engine, get_response_cache
+from ..response_cache import ResponseCache, cached_response
+from .. import serializers
+from ..pagination import ListParams, GoalFilters, render_list
 
 router = APIRouter()
 
 @router.get("/goals")
-def get_company_goals(
+async def get_company_goals(
+    request: Request,
+    params: ListParams = Depends(),
+    filters: GoalFilters = Depends(),
     current_user: dict = Depends(get_current_user),
-    whygo_service = Depends(get_whygo_service)
+    whygo_service = Depends(get_whygo_service),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
-    """Get all company goals"""
-    goals = whygo_service.repo.get_all_company_goals()
-    return [
-        {
-            "id": g.id,
-            "why": g.why,
-            "goal": g.goal,
-            "status": g.status,
-            "owner_id": g.owner_id,
-            "fiscal_year": g.fiscal_year,
-            "outcomes": [
-                {
-                    "id": o.id,
-                    "description": o.description,
-                    "metric_type": o.metric_type,
-                    "owner_id": o.owner_id,
-                    "target_q1": o.target_q1,
-                    "target_q2": o.target_q2,
-                    "target_q3": o.target_q3,
-                    "target_q4": o.target_q4,
-                }
-                for o in g.outcomes
-            ]
-        }
-        for g in goals
-    ]
+    """Get company goals (filterable, paginated with limit/cursor, projected with fields)"""
+    def build():
+        goals = filters.apply(whygo_service, whygo_service.repo.get_all_company_goals())
+        return render_list(
+            goals, params, serializers.goal_summaries,
+            serializers.GOAL_SUMMARY_FIELDS, serializers.OUTCOME_LIST_FIELDS
+        )
+
+    return cached_response(request, cache, whygo_service.repo.version, build)
 
 
 @router.get("/dashboard")
-def get_company_dashboard(
+async def get_company_dashboard(
+    request: Request,
     current_user: dict = Depends(get_current_user),
-    whygo_service = Depends(get_whygo_service)
+    whygo_service = Depends(get_whygo_service),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
     """Get company dashboard with summary stats"""
-    return whygo_service.get_company_dashboard_data()
+    return cached_response(
+        request, cache, whygo_service.repo.version,
+        whygo_service.get_company_dashboard_data
+    )
+
+
+@router.get("/goals/{goal_id}/health")
+async def get_goal_health(
+    goal_id: str,
+    current_user: dict = Depends(get_current_user),
+    cascade = Depends(get_cascade_engine)
+):
+    """Get health and coverage of a goal including every goal that ladders up to it"""
+    health = cascade.get_goal_health(goal_id)
+    if not health:
+        raise HTTPException(status_code=404, detail="Goal not found")
+    return health
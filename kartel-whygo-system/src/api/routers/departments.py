@@ -2,94 +2,72 @@
 Departments Router - Basic implementation
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from ..dependencies import get_current_user, get_whygo_service
+from fastapi import APIRouter, Depends, HTTPException, Request
+from ..dependencies import get_current_user, get_whygo_service, get_response_cache
+from ..response_cache import ResponseCache, cached_response
+from .. import serializers
+from ..pagination import ListParams, GoalFilters, render_list
 
 router = APIRouter()
 
 @router.get("/me/goals")
-def get_my_department_goals(
+async def get_my_department_goals(
+    request: Request,
+    params: ListParams = Depends(),
+    filters: GoalFilters = Depends(),
     current_user: dict = Depends(get_current_user),
-    whygo_service = Depends(get_whygo_service)
+    whygo_service = Depends(get_whygo_service),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
-    """Get goals for current user's department"""
+    """Get goals for current user's department (same parameters as /{dept_id}/goals)"""
     dept_id = current_user['person'].department_id
     if not dept_id:
         return []
 
-    goals = whygo_service.repo.get_department_goals_by_department(dept_id)
-    return [
-        {
-            "id": g.id,
-            "department_id": g.department_id,
-            "parent_goal_ids": g.parent_goal_ids,
-            "why": g.why,
-            "goal": g.goal,
-            "status": g.status,
-            "fiscal_year": g.fiscal_year,
-            "outcomes": [
-                {
-                    "id": o.id,
-                    "description": o.description,
-                    "metric_type": o.metric_type,
-                    "owner_id": o.owner_id,
-                    "target_annual": o.target_annual,
-                    "target_q1": o.target_q1,
-                    "target_q2": o.target_q2,
-                    "target_q3": o.target_q3,
-                    "target_q4": o.target_q4,
-                }
-                for o in g.outcomes
-            ]
-        }
-        for g in goals
-    ]
+    def build():
+        goals = filters.apply(whygo_service, whygo_service.repo.get_department_goals_by_department(dept_id))
+        return render_list(
+            goals, params, serializers.goal_summaries,
+            serializers.GOAL_SUMMARY_FIELDS, serializers.OUTCOME_LIST_FIELDS
+        )
+
+    return cached_response(request, cache, whygo_service.repo.version, build, scope=(dept_id,))
 
 
 @router.get("/{dept_id}/goals")
-def get_department_goals(
+async def get_department_goals(
     dept_id: str,
+    request: Request,
+    params: ListParams = Depends(),
+    filters: GoalFilters = Depends(),
     current_user: dict = Depends(get_current_user),
-    whygo_service = Depends(get_whygo_service)
+    whygo_service = Depends(get_whygo_service),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
-    """Get all goals for a department"""
-    goals = whygo_service.repo.get_department_goals_by_department(dept_id)
-    return [
-        {
-            "id": g.id,
-            "department_id": g.department_id,
-            "parent_goal_ids": g.parent_goal_ids,
-            "why": g.why,
-            "goal": g.goal,
-            "status": g.status,
-            "fiscal_year": g.fiscal_year,
-            "outcomes": [
-                {
-                    "id": o.id,
-                    "description": o.description,
-                    "metric_type": o.metric_type,
-                    "owner_id": o.owner_id,
-                    "target_annual": o.target_annual,
-                    "target_q1": o.target_q1,
-                    "target_q2": o.target_q2,
-                    "target_q3": o.target_q3,
-                    "target_q4": o.target_q4,
-                }
-                for o in g.outcomes
-            ]
-        }
-        for g in goals
-    ]
+    """Get goals for a department (filterable, paginated with limit/cursor, projected with fields)"""
+    def build():
+        goals = filters.apply(whygo_service, whygo_service.repo.get_department_goals_by_department(dept_id))
+        return render_list(
+            goals, params, serializers.goal_summaries,
+            serializers.GOAL_SUMMARY_FIELDS, serializers.OUTCOME_LIST_FIELDS
+        )
+
+    return cached_response(request, cache, whygo_service.repo.version, build)
 
 
 @router.get("/{dept_id}/dashboard")
-def get_department_dashboard(
+async def get_department_dashboard(
     dept_id: str,
+    request: Request,
     current_user: dict = Depends(get_current_user),
-    whygo_service = Depends(get_whygo_service)
+    whygo_service = Depends(get_whygo_service),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
     """Get department dashboard"""
-    dashboard = whygo_service.get_department_dashboard_data(dept_id)
-    if not dashboard:
-        raise HTTPException(status_code=404, detail="Department not found")
-    return dashboard
+    def build():
+        dashboard = whygo_service.get_department_dashboard_data(dept_id)
+        if not dashboard:
+            raise HTTPException(status_code=404, detail="Department not found")
+        return dashboard
+
+    return cached_response(request, cache, whygo_service.repo.version, build)
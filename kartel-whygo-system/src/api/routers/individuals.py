@@ -2,12 +2,19 @@
 Individual Goals Router - Basic implementation
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
-from ..dependencies import get_current_user, get_whygo_service
-from ...models.whygo import IndividualWhyGO, Outcome
+from ..dependencies import (
+    get_current_user, get_whygo_service, get_status_observers, get_approval_queue, get_validation_service
+)
+from .. import serializers
+from ..pagination import ListParams, GoalFilters, render_list
+from ...models.whygo import IndividualWhyGO, Outcome, can_transition
+from ...models.api_models import GoalStatusChange
+from ...services.approval_queue import ApprovalQueue
+from ...services.validation_service import ValidationService
 
 router = APIRouter()
 
@@ -31,60 +38,51 @@ class CreateGoalRequest(BaseModel):
 
 
 @router.get("/me")
-def get_my_goals(
+async def get_my_goals(
+    params: ListParams = Depends(),
+    filters: GoalFilters = Depends(),
     current_user: dict = Depends(get_current_user),
     whygo_service = Depends(get_whygo_service)
 ):
-    """Get current user's individual goals"""
+    """Get current user's individual goals (filterable, paginated with limit/cursor, projected with fields)"""
     person_id = current_user['person'].id
-    goals = whygo_service.repo.get_individual_goals_by_person(person_id)
+    goals = filters.apply(whygo_service, whygo_service.repo.get_individual_goals_by_person(person_id))
 
     # Return full goal details with outcomes (outcomes are already embedded in goal object)
-    result = []
-    for g in goals:
-        result.append({
-            "id": g.id,
-            "person_id": g.person_id,
-            "parent_goal_ids": g.parent_goal_ids,
-            "why": g.why,
-            "goal": g.goal,
-            "status": g.status,
-            "approved_by": g.approved_by,
-            "fiscal_year": g.fiscal_year,
-            "outcomes": [
-                {
-                    "id": o.id,
-                    "goal_id": o.goal_id,
-                    "description": o.description,
-                    "metric_type": o.metric_type,
-                    "owner_id": o.owner_id,
-                    "target_annual": o.target_annual,
-                    "target_q1": o.target_q1,
-                    "target_q2": o.target_q2,
-                    "target_q3": o.target_q3,
-                    "target_q4": o.target_q4,
-                    "actual_q1": o.actual_q1,
-                    "actual_q2": o.actual_q2,
-                    "actual_q3": o.actual_q3,
-                    "actual_q4": o.actual_q4,
-                    "status_q1": o.status_q1,
-                    "status_q2": o.status_q2,
-                    "status_q3": o.status_q3,
-                    "status_q4": o.status_q4
-                }
-                for o in g.outcomes
-            ],
-            "created_at": g.created_at,
-            "updated_at": g.updated_at
-        })
-    return result
+    return serializers.json_response(render_list(
+        goals, params, serializers.goal_details,
+        serializers.GOAL_DETAIL_FIELDS, serializers.OUTCOME_DETAIL_FIELDS
+    ))
+
+
+@router.get("/pending-approvals")
+async def get_pending_approvals(
+    params: ListParams = Depends(),
+    current_user: dict = Depends(get_current_user),
+    approval_queue: ApprovalQueue = Depends(get_approval_queue)
+):
+    """
+    Get goals awaiting approval that the current user may approve
+
+    Executives see all, department heads their department's, managers
+    their direct reports'. Paginated with limit/cursor and projected with
+    fields; see ListParams.
+    """
+    goals = approval_queue.pending_for(current_user['person'].id)
+
+    return serializers.json_response(render_list(
+        goals, params, serializers.goal_details,
+        serializers.GOAL_DETAIL_FIELDS, serializers.OUTCOME_DETAIL_FIELDS
+    ))
 
 
 @router.post("/create", status_code=201)
-def create_my_goal(
+async def create_my_goal(
     request: CreateGoalRequest,
+    durable: bool = Query(False, description="Wait until the change is written to disk"),
     current_user: dict = Depends(get_current_user),
-    whygo_service = Depends(get_whygo_service)
+    whygo_service = Depends(get_whygo_service),
+    status_observers: List = Depends(get_status_observers)
 ):
     """Create a new individual goal for the current user"""
     person_id = current_user['person'].id
@@ -146,9 +144,13 @@ def create_my_goal(
     success = whygo_service.repo.create_individual_goal(goal)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to create goal")
+    for observer in status_observers:
+        observer.goal_added(goal)
 
     # Save to disk
-    whygo_service.repo.save_all()
+    await whygo_service.repo.save_all()
+    if durable and not await whygo_service.repo.wait_durable():
+        raise HTTPException(status_code=500, detail="Failed to save goal")
 
     # Return the created goal
     return {
@@ -186,3 +188,49 @@ def create_my_goal(
         "created_at": goal.created_at,
         "updated_at": goal.updated_at
     }
+
+
+@router.post("/{goal_id}/status")
+async def change_goal_status(
+    goal_id: str,
+    request: GoalStatusChange,
+    durable: bool = Query(False, description="Wait until the change is written to disk"),
+    current_user: dict = Depends(get_current_user),
+    whygo_service = Depends(get_whygo_service),
+    validation_service: ValidationService = Depends(get_validation_service)
+):
+    """
+    Move an individual goal through its lifecycle
+
+    draft -> pending_approval -> approved -> archived; a pending goal can
+    also be sent back to draft. Owners submit and archive their own goals;
+    approving or sending back requires approval rights over the goal.
+    """
+    person_id = current_user['person'].id
+    goal = whygo_service.repo.get_goal(goal_id)
+    if not isinstance(goal, IndividualWhyGO):
+        raise HTTPException(status_code=404, detail="Goal not found")
+
+    if not can_transition(goal.status, request.status):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Cannot move goal from {goal.status} to {request.status}"
+        )
+
+    sent_back = goal.status == 'pending_approval' and request.status == 'draft'
+    if request.status == 'approved' or sent_back:
+        allowed, reason = validation_service.can_approve_goal(person_id, goal_id)
+        if not allowed:
+            raise HTTPException(status_code=403, detail=reason)
+    elif goal.person_id != person_id:
+        raise HTTPException(status_code=403, detail="Only the goal owner can change its status")
+
+    # The repository re-checks the transition under its lock
+    if not whygo_service.repo.transition_goal_status(goal_id, request.status, person_id):
+        raise HTTPException(status_code=409, detail="Goal status changed concurrently")
+
+    await whygo_service.repo.save_all()
+    if durable and not await whygo_service.repo.wait_durable():
+        raise HTTPException(status_code=500, detail="Failed to save goal")
+
+    return serializers.json_response(serializers.goal_detail(whygo_service.repo.get_goal(goal_id)))
@@ -2,13 +2,59 @@
 Outcomes & Progress Router - Basic implementation
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from ..dependencies import get_current_user, get_whygo_service, get_progress_service
+from fastapi import APIRouter, Depends, HTTPException, Query
+from ..dependencies import get_current_user, get_whygo_service, get_progress_service, get_validation_service
+from ...models.api_models import RecordProgressBatch, RecordProgressBatchResponse
+from ...services.validation_service import ValidationService
 
 router = APIRouter()
 
+
+@router.post("/progress:batch", response_model=RecordProgressBatchResponse)
+async def record_progress_batch(
+    batch: RecordProgressBatch,
+    durable: bool = Query(False, description="Wait until the change is written to disk"),
+    current_user: dict = Depends(get_current_user),
+    progress_service = Depends(get_progress_service),
+    validation_service: ValidationService = Depends(get_validation_service)
+):
+    """
+    Record actuals for several outcomes at once
+
+    Every outcome must be owned by the current user or by someone they
+    manage (403 otherwise); updates are recorded as made by the current
+    user. All items are validated first; if any is invalid nothing is
+    recorded and the response is 422 with per-item errors. Otherwise
+    everything is saved in a single flush. With durable=true the response
+    waits until the batch is on disk.
+    """
+    person_id = current_user['person'].id
+    for outcome_id in dict.fromkeys(item.outcome_id for item in batch.items):
+        outcome = validation_service.repo.get_outcome(outcome_id)
+        # Unknown outcomes are reported per item by the validation below
+        if outcome is None:
+            continue
+        allowed, reason = validation_service.can_record_progress(person_id, outcome)
+        if not allowed:
+            raise HTTPException(status_code=403, detail=reason)
+
+    result = await progress_service.record_actuals(
+        [item.model_dump() for item in batch.items],
+        recorded_by=person_id
+    )
+
+    if not result['applied']:
+        raise HTTPException(status_code=422, detail=result['results'])
+    if result['saved'] and durable:
+        result['saved'] = await progress_service.whygo_repo.wait_durable()
+    if not result['saved']:
+        raise HTTPException(status_code=500, detail="Failed to save progress")
+
+    return result
+
+
 @router.get("/{outcome_id}")
-def get_outcome_details(
+async def get_outcome_details(
     outcome_id: str,
     current_user: dict = Depends(get_current_user),
     whygo_service = Depends(get_whygo_service)
@@ -0,0 +1,109 @@
+"""
+Stream Router - Live status updates over Server-Sent Events
+
+GET /api/stream keeps the response open and pushes a `status` event
+whenever recording progress changes an outcome's status, so dashboards
+update without polling. Each event carries one StatusFeed delta:
+
+    event: status
+    id: <data version>
+    data: {"outcome_id": ..., "goal_id": ..., "level": ..., "status": {"q1": "+"}, ...}
+
+Only changes within the user's scope are sent: company goals, goals of
+the user's department (all departments for executives) and the individual
+goals of the user and everyone under them. A `resync` event means deltas
+were missed (the data was reloaded or the client fell behind); the client
+should refetch its dashboards, and the stream then ends so a reconnect
+picks up the current scope.
+
+The endpoint takes the usual Bearer token, so read it with fetch() rather
+than EventSource (which can't send headers).
+"""
+
+import asyncio
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from ..config import settings
+from ..dependencies import get_current_user, get_event_bus, get_status_feed, get_org_chart
+from .. import serializers
+from ...models.whygo import Person
+from ...repositories.events import EventBus, QueueSubscription, REPOSITORY_RELOADED
+from ...services.org_chart import OrgChart
+from ...services.status_feed import StatusFeed, STATUS_CHANGED
+
+router = APIRouter()
+
+
+class _Scope:
+    """Which status deltas a user receives"""
+
+    def __init__(self, person: Person, org_chart: OrgChart):
+        self.person_id = person.id
+        self.org_chart = org_chart
+        self.everything = person.level == 'executive'
+        # Department heads see every individual goal in their department
+        self.department_id = person.department_id
+        self.whole_department = person.level == 'department_head'
+
+    def covers(self, delta: dict) -> bool:
+        if self.everything or delta['level'] == 'company':
+            return True
+        if delta['level'] == 'department':
+            return delta['department_id'] == self.department_id
+
+        owner_id = delta['person_id']
+        if owner_id == self.person_id:
+            return True
+        if self.whole_department and delta['department_id'] == self.department_id:
+            return True
+        return self.org_chart.is_under(owner_id, self.person_id)
+
+
+def _sse(event: str, data: bytes, event_id=None) -> bytes:
+    lines = [b'event: ' + event.encode()]
+    if event_id is not None:
+        lines.append(f'id: {event_id}'.encode())
+    lines.append(b'data: ' + data)
+    return b'\n'.join(lines) + b'\n\n'
+
+
+async def _status_events(subscription: QueueSubscription, scope: _Scope):
+    try:
+        # Reconnect quickly after a resync or a dropped connection
+        yield b'retry: 2000\n\n'
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), settings.stream_keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield b': keepalive\n\n'
+                continue
+
+            if subscription.dropped or event.kind == REPOSITORY_RELOADED:
+                yield _sse('resync', serializers.dumps({'version': event.version}))
+                return
+            if scope.covers(event.data):
+                yield _sse('status', serializers.dumps(event.data), event.version)
+    finally:
+        subscription.close()
+
+
+@router.get("")
+async def stream_status_changes(
+    current_user: dict = Depends(get_current_user),
+    bus: EventBus = Depends(get_event_bus),
+    # Not used directly: makes sure deltas are being published
+    feed: StatusFeed = Depends(get_status_feed),
+    org_chart: OrgChart = Depends(get_org_chart)
+):
+    """Server-Sent Events stream of outcome status changes within the user's scope"""
+    subscription = bus.subscribe_queue(
+        kinds=(STATUS_CHANGED, REPOSITORY_RELOADED),
+        maxsize=settings.stream_queue_size
+    )
+    scope = _Scope(current_user['person'], org_chart)
+
+    return StreamingResponse(
+        _status_events(subscription, scope),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
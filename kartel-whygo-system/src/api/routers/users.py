@@ -4,11 +4,14 @@ Users Router
 Handles user profile and team endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
-
-from ..dependencies import get_current_user, get_user_service
-from ...services.user_service import UserService
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Literal, Optional
+
+from ..dependencies import get_current_user, get_user_service, get_org_chart
+from .. import serializers
+from ..pagination import ListParams, render_list
+from ...services.user_service import AsyncUserService
+from ...services.org_chart import OrgChart
 from ...models.api_models import PersonResponse, PersonProfileUpdate
 
 
@@ -16,7 +19,7 @@ router = APIRouter()
 
 
 @router.get("/me", response_model=PersonResponse)
-def get_my_profile(current_user: dict = Depends(get_current_user)):
+async def get_my_profile(current_user: dict = Depends(get_current_user)):
     """Get current user's profile"""
     person = current_user['person']
     return PersonResponse(
@@ -37,10 +40,11 @@ def get_my_profile(current_user: dict = Depends(get_current_user)):
 
 
 @router.put("/me", response_model=PersonResponse)
-def update_my_profile(
+async def update_my_profile(
     updates: PersonProfileUpdate,
+    durable: bool = Query(False, description="Wait until the change is written to disk"),
     current_user: dict = Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service)
+    user_service: AsyncUserService = Depends(get_user_service)
 ):
     """Update current user's profile"""
     person_id = current_user['person'].id
@@ -48,7 +52,12 @@ def update_my_profile(
     # Only update fields that were provided (exclude None values)
     update_dict = updates.model_dump(exclude_none=True)
 
-    success = user_service.update_profile(person_id, **update_dict)
+    success = await user_service.update_profile(person_id, **update_dict)
+    if success and durable and not await user_service.repo.wait_durable():
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save profile"
+        )
 
     if not success:
         raise HTTPException(
@@ -78,29 +87,45 @@ def update_my_profile(
 
 
 @router.get("/me/team", response_model=List[PersonResponse])
-def get_my_team(
+async def get_my_team(
+    params: ListParams = Depends(),
+    status_filter: Optional[Literal['active', 'trial', 'searching']] = Query(None, alias="status"),
     current_user: dict = Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service)
+    user_service: AsyncUserService = Depends(get_user_service)
 ):
-    """Get current user's team members (same department)"""
+    """
+    Get current user's team members (same department)
+
+    Paginated with limit/cursor and projected with fields; see ListParams.
+    """
     person_id = current_user['person'].id
     team_members = user_service.get_team_members(person_id)
+    if status_filter is not None:
+        team_members = [p for p in team_members if p.status == status_filter]
 
-    return [
-        PersonResponse(
-            id=p.id,
-            name=p.name,
-            title=p.title,
-            email=p.email,
-            department_id=p.department_id,
-            manager_id=p.manager_id,
-            level=p.level,
-            employment_type=p.employment_type,
-            status=p.status,
-            onboarding_status=p.onboarding_status,
-            last_login=p.last_login,
-            timezone=p.timezone,
-            notification_enabled=p.notification_enabled
-        )
-        for p in team_members
-    ]
+    return serializers.json_response(render_list(
+        team_members, params, serializers.people, serializers.PERSON_FIELDS
+    ))
+
+
+@router.get("/me/reports", response_model=List[PersonResponse])
+async def get_my_reports(
+    params: ListParams = Depends(),
+    scope: Literal['direct', 'all'] = Query('direct', description="direct reports only, or everyone under you"),
+    current_user: dict = Depends(get_current_user),
+    org_chart: OrgChart = Depends(get_org_chart)
+):
+    """
+    Get the people reporting to the current user
+
+    Paginated with limit/cursor and projected with fields; see ListParams.
+    """
+    person_id = current_user['person'].id
+    if scope == 'all':
+        reports = org_chart.all_reports(person_id)
+    else:
+        reports = org_chart.direct_reports(person_id)
+
+    return serializers.json_response(render_list(
+        reports, params, serializers.people, serializers.PERSON_FIELDS
+    ))
@@ -0,0 +1,353 @@
+"""
+Fast JSON serialization for goal, outcome and person responses
+
+Encodes domain dataclasses straight to JSON bytes (with orjson when it is
+installed) instead of building per-field dicts or Pydantic models that
+FastAPI would validate and encode again. Return the bytes with
+json_response(), or from a cached_response() build function.
+
+The parts of a goal or outcome that rarely change (IDs, text, targets)
+are encoded once and reused as pre-encoded fragments, keyed by their
+values so an edit never serves stale JSON; only status, actuals and
+timestamps are encoded per request. precompute_fragments() fills the
+fragment cache for a repository up front.
+"""
+
+import json
+import threading
+from typing import Callable, Dict, Iterable, Optional
+
+from fastapi import Response
+
+from ..models.whygo import CompanyWhyGO, DepartmentWhyGO, Outcome, Person, Department
+from ..utils.metric_values import numeric_value
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the standard library
+    orjson = None
+
+_MAX_FRAGMENTS = 50_000
+_fragments: Dict[tuple, bytes] = {}
+_fragments_lock = threading.Lock()
+
+
+def dumps(obj) -> bytes:
+    """Encode a JSON-compatible object to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def json_response(content: bytes, status_code: int = 200) -> Response:
+    """Raw JSON response that skips FastAPI's validation and encoding"""
+    return Response(content=content, status_code=status_code, media_type='application/json')
+
+
+def _typed(value) -> tuple:
+    # 1, 1.0 and True are equal as dict keys but encode differently
+    return (value.__class__, value)
+
+
+def _members(obj: dict) -> bytes:
+    """Object members without the surrounding braces, for splicing"""
+    return dumps(obj)[1:-1]
+
+
+def _fragment(key: tuple, build: Callable[[], dict]) -> bytes:
+    """Encoded members of the static part of an object, cached by its values"""
+    fragment = _fragments.get(key)
+    if fragment is None:
+        fragment = _members(build())
+        with _fragments_lock:
+            if len(_fragments) >= _MAX_FRAGMENTS:
+                _fragments.clear()
+            _fragments[key] = fragment
+    return fragment
+
+
+def _array(items: Iterable[bytes]) -> bytes:
+    return b'[' + b','.join(items) + b']'
+
+
+def _object(*parts: bytes) -> bytes:
+    return b'{' + b','.join(part for part in parts if part) + b'}'
+
+
+def _goal_owner_fields(goal) -> dict:
+    """Level-specific ownership fields of a goal"""
+    if isinstance(goal, CompanyWhyGO):
+        return {'owner_id': goal.owner_id}
+    if isinstance(goal, DepartmentWhyGO):
+        return {'department_id': goal.department_id, 'parent_goal_ids': goal.parent_goal_ids}
+    return {'person_id': goal.person_id, 'parent_goal_ids': goal.parent_goal_ids}
+
+
+def _goal_key(view: str, goal) -> tuple:
+    owner = tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in _goal_owner_fields(goal).items()
+    )
+    return (view, goal.level, goal.id, goal.why, goal.goal, goal.fiscal_year, owner)
+
+
+# Summary view: goal lists (/api/company/goals, /api/departments/{id}/goals)
+
+def outcome_summary(outcome: Outcome) -> bytes:
+    """Outcome with its targets, as listed under a goal"""
+    key = (
+        'outcome_summary', outcome.id, outcome.description, outcome.metric_type, outcome.owner_id,
+        _typed(outcome.target_annual), _typed(outcome.target_q1), _typed(outcome.target_q2),
+        _typed(outcome.target_q3), _typed(outcome.target_q4)
+    )
+    return _object(_fragment(key, lambda: {
+        'id': outcome.id,
+        'description': outcome.description,
+        'metric_type': outcome.metric_type,
+        'owner_id': outcome.owner_id,
+        'target_annual': outcome.target_annual,
+        'target_q1': outcome.target_q1,
+        'target_q2': outcome.target_q2,
+        'target_q3': outcome.target_q3,
+        'target_q4': outcome.target_q4,
+    }))
+
+
+def goal_summary(goal) -> bytes:
+    """Goal with its outcome summaries"""
+    static = _fragment(_goal_key('goal_summary', goal), lambda: {
+        'id': goal.id,
+        **_goal_owner_fields(goal),
+        'why': goal.why,
+        'goal': goal.goal,
+        'fiscal_year': goal.fiscal_year,
+    })
+    return _object(
+        static,
+        _members({'status': goal.status}),
+        b'"outcomes":' + _array(outcome_summary(o) for o in goal.outcomes)
+    )
+
+
+def goal_summaries(goals: Iterable) -> bytes:
+    return _array(goal_summary(g) for g in goals)
+
+
+# Detail view: stored values as-is (/api/individuals/me)
+
+def outcome_detail(outcome: Outcome) -> bytes:
+    """Outcome with targets, actuals and statuses as stored"""
+    key = (
+        'outcome_detail', outcome.id, outcome.goal_id, outcome.description, outcome.metric_type,
+        outcome.owner_id, _typed(outcome.target_annual), _typed(outcome.target_q1),
+        _typed(outcome.target_q2), _typed(outcome.target_q3), _typed(outcome.target_q4)
+    )
+    static = _fragment(key, lambda: {
+        'id': outcome.id,
+        'goal_id': outcome.goal_id,
+        'description': outcome.description,
+        'metric_type': outcome.metric_type,
+        'owner_id': outcome.owner_id,
+        'target_annual': outcome.target_annual,
+        'target_q1': outcome.target_q1,
+        'target_q2': outcome.target_q2,
+        'target_q3': outcome.target_q3,
+        'target_q4': outcome.target_q4,
+    })
+    return _object(static, _members({
+        'actual_q1': outcome.actual_q1,
+        'actual_q2': outcome.actual_q2,
+        'actual_q3': outcome.actual_q3,
+        'actual_q4': outcome.actual_q4,
+        'status_q1': outcome.status_q1,
+        'status_q2': outcome.status_q2,
+        'status_q3': outcome.status_q3,
+        'status_q4': outcome.status_q4,
+    }))
+
+
+def goal_detail(goal) -> bytes:
+    """Goal with full outcome details and timestamps"""
+    return _goal_with_outcomes(goal, 'goal_detail', outcome_detail)
+
+
+def goal_details(goals: Iterable) -> bytes:
+    return _array(goal_detail(g) for g in goals)
+
+
+# Full view: OutcomeResponse / *GoalResponse shapes (onboarding context)
+
+def outcome_response(outcome: Outcome) -> bytes:
+    """Outcome in the OutcomeResponse shape (numeric targets/actuals)"""
+    key = (
+        'outcome_response', outcome.id, outcome.goal_id, outcome.description, outcome.metric_type,
+        outcome.owner_id, _typed(outcome.target_annual), _typed(outcome.target_q1),
+        _typed(outcome.target_q2), _typed(outcome.target_q3), _typed(outcome.target_q4)
+    )
+    static = _fragment(key, lambda: {
+        'id': outcome.id,
+        'goal_id': outcome.goal_id,
+        'description': outcome.description,
+        'metric_type': outcome.metric_type,
+        'owner_id': outcome.owner_id,
+        'target_annual': numeric_value(outcome.target_annual),
+        'target_q1': numeric_value(outcome.target_q1),
+        'target_q2': numeric_value(outcome.target_q2),
+        'target_q3': numeric_value(outcome.target_q3),
+        'target_q4': numeric_value(outcome.target_q4),
+    })
+    return _object(static, _members({
+        'actual_q1': numeric_value(outcome.actual_q1),
+        'actual_q2': numeric_value(outcome.actual_q2),
+        'actual_q3': numeric_value(outcome.actual_q3),
+        'actual_q4': numeric_value(outcome.actual_q4),
+        'status_q1': outcome.status_q1,
+        'status_q2': outcome.status_q2,
+        'status_q3': outcome.status_q3,
+        'status_q4': outcome.status_q4,
+    }))
+
+
+def goal_response(goal) -> bytes:
+    """Goal in the Company/Department/IndividualGoalResponse shape"""
+    return _goal_with_outcomes(goal, 'goal_response', outcome_response)
+
+
+def _goal_with_outcomes(goal, view: str, encode_outcome: Callable[[Outcome], bytes]) -> bytes:
+    static = _fragment(_goal_key(view, goal) + (goal.created_at,), lambda: {
+        'id': goal.id,
+        **_goal_owner_fields(goal),
+        'why': goal.why,
+        'goal': goal.goal,
+        'fiscal_year': goal.fiscal_year,
+        'created_at': goal.created_at,
+    })
+    dynamic = {'status': goal.status, 'updated_at': goal.updated_at}
+    if not isinstance(goal, CompanyWhyGO):
+        dynamic['approved_by'] = goal.approved_by
+    return _object(
+        static,
+        _members(dynamic),
+        b'"outcomes":' + _array(encode_outcome(o) for o in goal.outcomes)
+    )
+
+
+def person_response(person: Optional[Person]) -> bytes:
+    """Person in the PersonResponse shape (null if None)"""
+    if person is None:
+        return b'null'
+    return dumps({
+        'id': person.id,
+        'name': person.name,
+        'title': person.title,
+        'email': person.email,
+        'department_id': person.department_id,
+        'manager_id': person.manager_id,
+        'level': person.level,
+        'employment_type': person.employment_type,
+        'status': person.status,
+        'onboarding_status': person.onboarding_status,
+        'last_login': person.last_login,
+        'timezone': person.timezone,
+        'notification_enabled': person.notification_enabled,
+    })
+
+
+def department_response(department: Optional[Department]) -> bytes:
+    """Department in the DepartmentResponse shape (null if None)"""
+    if department is None:
+        return b'null'
+    return dumps({
+        'id': department.id,
+        'name': department.name,
+        'head_id': department.head_id,
+        'primary_company_goal_ids': department.primary_company_goal_ids,
+        'secondary_company_goal_ids': department.secondary_company_goal_ids,
+        'reports_to': department.reports_to,
+    })
+
+
+def onboarding_context(context: dict) -> bytes:
+    """OnboardingContext built by OnboardingService.get_onboarding_context()"""
+    return _object(
+        b'"person":' + person_response(context['person']),
+        b'"department":' + department_response(context['department']),
+        b'"manager":' + person_response(context['manager']),
+        b'"company_goals":' + _array(goal_response(g) for g in context['company_goals']),
+        b'"department_goals":' + _array(goal_response(g) for g in context['department_goals']),
+        b'"individual_goals":' + _array(goal_response(g) for g in context['individual_goals']),
+        b'"pending_approvals":' + _array(goal_response(g) for g in context['pending_approvals']),
+    )
+
+
+# Projection (?fields=): only the requested attributes, stored values as-is
+
+QUARTER_TARGETS = ('target_q1', 'target_q2', 'target_q3', 'target_q4')
+QUARTER_ACTUALS = ('actual_q1', 'actual_q2', 'actual_q3', 'actual_q4')
+QUARTER_STATUSES = ('status_q1', 'status_q2', 'status_q3', 'status_q4')
+
+OUTCOME_SUMMARY_FIELDS = (
+    'id', 'description', 'metric_type', 'owner_id', 'target_annual'
+) + QUARTER_TARGETS
+OUTCOME_DETAIL_FIELDS = (
+    ('id', 'goal_id') + OUTCOME_SUMMARY_FIELDS[1:] + QUARTER_ACTUALS + QUARTER_STATUSES
+)
+# Outcome fields goal lists can project: the summary plus the statuses they filter on
+OUTCOME_LIST_FIELDS = OUTCOME_SUMMARY_FIELDS + QUARTER_STATUSES
+GOAL_SUMMARY_FIELDS = (
+    'id', 'owner_id', 'department_id', 'person_id', 'parent_goal_ids',
+    'why', 'goal', 'status', 'fiscal_year', 'outcomes'
+)
+GOAL_DETAIL_FIELDS = GOAL_SUMMARY_FIELDS + ('approved_by', 'created_at', 'updated_at')
+PERSON_FIELDS = (
+    'id', 'name', 'title', 'email', 'department_id', 'manager_id', 'level',
+    'employment_type', 'status', 'onboarding_status', 'last_login',
+    'timezone', 'notification_enabled'
+)
+
+
+def project(obj, projection: Dict[str, Optional[tuple]]) -> dict:
+    """
+    Selected attributes of a dataclass as a dict
+
+    Args:
+        obj: Goal, outcome or person
+        projection: field -> None, or for a list field (outcomes) the
+            fields to keep on each item. Fields the object doesn't have
+            (e.g. owner_id on a department goal) are left out.
+    """
+    result = {}
+    for name, nested in projection.items():
+        if not hasattr(obj, name):
+            continue
+        value = getattr(obj, name)
+        if nested is not None:
+            value = [{field: getattr(item, field) for field in nested} for item in value]
+        result[name] = value
+    return result
+
+
+def projected(items: Iterable, projection: Dict[str, Optional[tuple]]) -> bytes:
+    return dumps([project(item, projection) for item in items])
+
+
+def people(persons: Iterable[Person]) -> bytes:
+    return _array(person_response(p) for p in persons)
+
+
+def precompute_fragments(repo) -> int:
+    """
+    Encode the static parts of every goal and outcome ahead of the first request
+
+    Returns:
+        Number of goals processed
+    """
+    goals = (
+        repo.get_all_company_goals()
+        + repo.get_all_department_goals()
+        + repo.get_all_individual_goals()
+    )
+    for goal in goals:
+        goal_summary(goal)
+        goal_response(goal)
+    return len(goals)
@@ -0,0 +1,64 @@
+"""
+Verified token cache
+
+Each authenticated request carries the same bearer token until it
+expires, so the result of verifying it (HMAC check plus claim parsing)
+is cached. Entries live for at most ttl_seconds and never past the
+token's own exp claim; the least recently used entries are dropped once
+max_entries is reached.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class TokenCache(Generic[T]):
+    """Bounded TTL/LRU map of raw token -> verified claims"""
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[T, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[T]:
+        """Cached claims for a token, or None if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return claims
+
+    def put(self, token: str, claims: T, exp: Optional[float] = None):
+        """
+        Cache verified claims
+
+        Args:
+            token: Raw token string
+            claims: Result of verifying it
+            exp: Token expiry (seconds since the epoch), if it has one
+        """
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+
+        with self._lock:
+            self._entries[token] = (claims, expires_at)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -3,7 +3,7 @@ Pydantic models for FastAPI request/response validation
 """
 
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Union
 from datetime import datetime
 
 
@@ -147,6 +147,10 @@ class CreateIndividualGoal(BaseModel):
     outcomes: List[CreateOutcome] = Field(..., min_length=2, max_length=3)
 
 
+class GoalStatusChange(BaseModel):
+    status: Literal['draft', 'pending_approval', 'approved', 'archived']
+
+
 # Progress Tracking Models
 class RecordProgress(BaseModel):
     quarter: Literal['Q1', 'Q2', 'Q3', 'Q4']
@@ -155,6 +159,33 @@ class RecordProgress(BaseModel):
     blocker: Optional[str] = None
 
 
+class BatchProgressItem(BaseModel):
+    outcome_id: str
+    quarter: Literal['Q1', 'Q2', 'Q3', 'Q4']
+    actual_value: Union[float, str]
+    notes: Optional[str] = None
+    blocker: Optional[str] = None
+
+
+class RecordProgressBatch(BaseModel):
+    items: List[BatchProgressItem] = Field(..., min_length=1, max_length=1000)
+
+
+class BatchProgressItemResult(BaseModel):
+    index: int
+    outcome_id: Optional[str]
+    quarter: Optional[str]
+    success: bool
+    status: Optional[Literal['+', '~', '-']] = None
+    error: Optional[str] = None
+
+
+class RecordProgressBatchResponse(BaseModel):
+    applied: bool
+    saved: bool
+    results: List[BatchProgressItemResult]
+
+
 # Department Model
 class DepartmentResponse(BaseModel):
     id: str
@@ -0,0 +1,189 @@
+"""
+Outcome Columns - Columnar view of quarterly outcome data
+
+Holds every outcome's quarterly targets, actuals and statuses in typed
+arrays (one array per quarter and field), with a row index by outcome ID.
+Numbers are stored as doubles with NaN for missing or non-numeric values
+(milestones), alongside a flags column recording which values are present,
+which parsed as numbers and whether actual matches target as text;
+statuses are stored as small integer codes. This is far more compact than
+the per-outcome objects for large orgs and lets status and percentage
+computations run as a single pass over contiguous arrays.
+
+The store is optional: it is built from a repository on demand and kept
+in sync by calling outcome_updated() (the same observer hook the rollup
+caches use). Its one consumer is the batch StatusEngine behind
+scripts/recompute_statuses.py; API requests work on the (slotted) model
+objects and the rollup caches and never build it.
+"""
+
+import math
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from .whygo import Outcome
+from ..utils.metric_values import numeric_value
+
+QUARTERS = ('Q1', 'Q2', 'Q3', 'Q4')
+
+# Status symbol <-> code stored in the status arrays
+STATUS_NONE = 0
+STATUS_CODES = {None: STATUS_NONE, '+': 1, '~': 2, '-': 3}
+STATUS_SYMBOLS = {code: symbol for symbol, code in STATUS_CODES.items()}
+
+METRIC_TYPE_CODES = {'number': 0, 'percentage': 1, 'currency': 2, 'boolean': 3, 'milestone': 4}
+METRIC_TYPES = {code: metric_type for metric_type, code in METRIC_TYPE_CODES.items()}
+UNKNOWN_METRIC_TYPE = -1
+
+MISSING = float('nan')
+
+# Bits of the per-quarter flags column
+TARGET_PRESENT = 1
+ACTUAL_PRESENT = 2
+TARGET_NUMERIC = 4
+ACTUAL_NUMERIC = 8
+TEXT_MATCH = 16
+
+
+def to_number(value: Union[int, float, str, None]) -> float:
+    """Numeric form of a target/actual, NaN if missing or not a number"""
+    number = numeric_value(value)
+    return MISSING if number is None else number
+
+
+def parse_quarter_values(target, actual) -> Tuple[int, float, float]:
+    """(flags, target number, actual number) for one quarter's target/actual"""
+    target_num = to_number(target)
+    actual_num = to_number(actual)
+    flags = 0
+    if target is not None:
+        flags |= TARGET_PRESENT
+    if actual is not None:
+        flags |= ACTUAL_PRESENT
+    if not math.isnan(target_num):
+        flags |= TARGET_NUMERIC
+    if not math.isnan(actual_num):
+        flags |= ACTUAL_NUMERIC
+    if target is not None and actual is not None and (
+        str(target).strip().lower() == str(actual).strip().lower()
+    ):
+        flags |= TEXT_MATCH
+    return flags, target_num, actual_num
+
+
+class OutcomeColumns:
+    """
+    Typed-array store of quarterly targets, actuals and statuses
+
+    Row i of every column belongs to outcome_ids[i]; use row(outcome_id)
+    to find it. Columns are exposed per quarter through targets(),
+    actuals(), flags() and statuses() and can be wrapped without copying
+    (e.g. numpy.frombuffer) for vectorized passes; hold `lock` while such
+    views are alive, since a resize would invalidate them.
+    """
+
+    def __init__(self, outcomes: Iterable[Outcome] = ()):
+        self.lock = threading.RLock()
+        self.outcome_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.metric_types = array('b')
+        self._targets = [array('d') for _ in QUARTERS]
+        self._actuals = [array('d') for _ in QUARTERS]
+        self._flags = [array('b') for _ in QUARTERS]
+        self._statuses = [array('b') for _ in QUARTERS]
+
+        for outcome in outcomes:
+            self._append(outcome)
+
+    @classmethod
+    def from_repository(cls, repo) -> 'OutcomeColumns':
+        """Build the store from every outcome in a WhyGO repository"""
+        goals = (
+            repo.get_all_company_goals()
+            + repo.get_all_department_goals()
+            + repo.get_all_individual_goals()
+        )
+        return cls(outcome for goal in goals for outcome in goal.outcomes)
+
+    def __len__(self) -> int:
+        return len(self.outcome_ids)
+
+    def __contains__(self, outcome_id: str) -> bool:
+        return outcome_id in self._rows
+
+    def row(self, outcome_id: str) -> Optional[int]:
+        """Row of an outcome in every column, or None if not stored"""
+        return self._rows.get(outcome_id)
+
+    def _append(self, outcome: Outcome):
+        self._rows[outcome.id] = len(self.outcome_ids)
+        self.outcome_ids.append(outcome.id)
+        self.metric_types.append(METRIC_TYPE_CODES.get(outcome.metric_type, UNKNOWN_METRIC_TYPE))
+        for q in range(4):
+            self._targets[q].append(MISSING)
+            self._actuals[q].append(MISSING)
+            self._flags[q].append(0)
+            self._statuses[q].append(STATUS_NONE)
+        self._write(len(self.outcome_ids) - 1, outcome)
+
+    def _write(self, row: int, outcome: Outcome):
+        quarterly = (
+            (outcome.target_q1, outcome.actual_q1, outcome.status_q1),
+            (outcome.target_q2, outcome.actual_q2, outcome.status_q2),
+            (outcome.target_q3, outcome.actual_q3, outcome.status_q3),
+            (outcome.target_q4, outcome.actual_q4, outcome.status_q4),
+        )
+        self.metric_types[row] = METRIC_TYPE_CODES.get(outcome.metric_type, UNKNOWN_METRIC_TYPE)
+        for q, (target, actual, status) in enumerate(quarterly):
+            flags, target_num, actual_num = parse_quarter_values(target, actual)
+            self._targets[q][row] = target_num
+            self._actuals[q][row] = actual_num
+            self._flags[q][row] = flags
+            self._statuses[q][row] = STATUS_CODES.get(status, STATUS_NONE)
+
+    def outcome_updated(self, outcome: Outcome):
+        """Refresh (or add) one outcome's row"""
+        with self.lock:
+            row = self._rows.get(outcome.id)
+            if row is None:
+                self._append(outcome)
+            else:
+                self._write(row, outcome)
+
+    def goal_added(self, goal):
+        """Add rows for a newly created goal's outcomes"""
+        for outcome in goal.outcomes:
+            self.outcome_updated(outcome)
+
+    def targets(self, quarter: str) -> array:
+        """Target column for a quarter (NaN where missing or non-numeric)"""
+        return self._targets[QUARTERS.index(quarter)]
+
+    def actuals(self, quarter: str) -> array:
+        """Actual column for a quarter (NaN where missing or non-numeric)"""
+        return self._actuals[QUARTERS.index(quarter)]
+
+    def flags(self, quarter: str) -> array:
+        """Flags column for a quarter (TARGET_PRESENT, ACTUAL_NUMERIC, ...)"""
+        return self._flags[QUARTERS.index(quarter)]
+
+    def statuses(self, quarter: str) -> array:
+        """Status code column for a quarter (see STATUS_CODES)"""
+        return self._statuses[QUARTERS.index(quarter)]
+
+    def status(self, outcome_id: str, quarter: str) -> Optional[str]:
+        """Status symbol of one outcome in a quarter"""
+        row = self._rows.get(outcome_id)
+        if row is None:
+            return None
+        return STATUS_SYMBOLS.get(self.statuses(quarter)[row])
+
+    def percentages(self, quarter: str) -> List[Optional[float]]:
+        """Actual as a percentage of target per row, None where not computable"""
+        result = []
+        for target, actual in zip(self.targets(quarter), self.actuals(quarter)):
+            if math.isnan(target) or math.isnan(actual) or target == 0:
+                result.append(None)
+            else:
+                result.append(actual / target * 100)
+        return result
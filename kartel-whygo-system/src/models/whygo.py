@@ -2,14 +2,19 @@
 WhyGO Data Models
 
 Python dataclasses matching the TypeScript schemas from DATA_STRUCTURES.md
+
+The dataclasses are slotted (no per-instance __dict__) to keep large orgs
+cheap to hold in memory; see outcome_columns.py for a columnar view of
+quarterly targets, actuals and statuses.
 """
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Literal, Union
 from datetime import datetime
+from ..utils.metric_values import numeric_value
 
 
-@dataclass
+@dataclass(slots=True)
 class Outcome:
     """Outcome with quarterly targets and actuals"""
     id: str
@@ -38,7 +43,7 @@ class Outcome:
     status_q4: Optional[Literal['+', '~', '-']] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressUpdate:
     """Progress update record for tracking changes to outcomes"""
     id: str
@@ -52,7 +57,22 @@ class ProgressUpdate:
     recorded_at: str = ""  # ISO timestamp
 
 
-@dataclass
+# Goal lifecycle: status -> statuses a goal may move to from it
+GOAL_TRANSITIONS = {
+    'draft': ('pending_approval', 'archived'),
+    'pending_approval': ('approved', 'draft', 'archived'),
+    'approved': ('archived',),
+    'archived': (),
+}
+GOAL_STATUSES = tuple(GOAL_TRANSITIONS)
+
+
+def can_transition(from_status: str, to_status: str) -> bool:
+    """True if the goal lifecycle allows moving from from_status to to_status"""
+    return to_status in GOAL_TRANSITIONS.get(from_status, ())
+
+
+@dataclass(slots=True)
 class CompanyWhyGO:
     """Company-level WhyGO"""
     id: str
@@ -67,7 +87,7 @@ class CompanyWhyGO:
     updated_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DepartmentWhyGO:
     """Department-level WhyGO"""
     id: str
@@ -84,7 +104,7 @@ class DepartmentWhyGO:
     updated_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IndividualWhyGO:
     """Individual-level WhyGO"""
     id: str
@@ -101,7 +121,17 @@ class IndividualWhyGO:
     updated_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class GoalTransition:
+    """A goal's move from one lifecycle status to another"""
+    goal: Union['CompanyWhyGO', 'DepartmentWhyGO', 'IndividualWhyGO']
+    from_status: str
+    to_status: str
+    actor_id: Optional[str] = None  # Person.id
+    at: str = ""  # ISO timestamp
+
+
+@dataclass(slots=True)
 class Person:
     """Employee/Person"""
     id: str
@@ -125,7 +155,7 @@ class Person:
     notification_enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Department:
     """Department"""
     id: str
@@ -237,3 +267,135 @@ def progress_update_to_dict(update: ProgressUpdate) -> dict:
         "recorded_by": update.recorded_by,
         "recorded_at": update.recorded_at
     }
+
+
+OUTCOME_VALUE_FIELDS = (
+    'target_annual', 'target_q1', 'target_q2', 'target_q3', 'target_q4',
+    'actual_q1', 'actual_q2', 'actual_q3', 'actual_q4'
+)
+
+
+def outcome_from_dict(data: dict) -> Outcome:
+    """Build an Outcome from its dictionary representation"""
+    # Parse numeric targets/actuals now so request paths only hit the cache
+    for key in OUTCOME_VALUE_FIELDS:
+        numeric_value(data.get(key))
+
+    return Outcome(
+        id=data["id"],
+        goal_id=data["goal_id"],
+        description=data["description"],
+        metric_type=data["metric_type"],
+        owner_id=data["owner_id"],
+        target_annual=data["target_annual"],
+        target_q1=data.get("target_q1"),
+        target_q2=data.get("target_q2"),
+        target_q3=data.get("target_q3"),
+        target_q4=data.get("target_q4"),
+        actual_q1=data.get("actual_q1"),
+        actual_q2=data.get("actual_q2"),
+        actual_q3=data.get("actual_q3"),
+        actual_q4=data.get("actual_q4"),
+        status_q1=data.get("status_q1"),
+        status_q2=data.get("status_q2"),
+        status_q3=data.get("status_q3"),
+        status_q4=data.get("status_q4")
+    )
+
+
+def whygo_from_dict(data: dict) -> Union[CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO]:
+    """Build a WhyGO of the right level from its dictionary representation"""
+    outcomes = [outcome_from_dict(o) for o in data.get("outcomes", [])]
+
+    if data["level"] == 'company':
+        return CompanyWhyGO(
+            id=data["id"],
+            level=data["level"],
+            why=data.get("why", ""),
+            goal=data.get("goal", ""),
+            status=data.get("status", "draft"),
+            owner_id=data.get("owner_id", ""),
+            fiscal_year=data.get("fiscal_year", 2026),
+            outcomes=outcomes,
+            created_at=data.get("created_at", ""),
+            updated_at=data.get("updated_at", "")
+        )
+
+    if data["level"] == 'department':
+        return DepartmentWhyGO(
+            id=data["id"],
+            level=data["level"],
+            department_id=data["department_id"],
+            parent_goal_ids=data.get("parent_goal_ids", []),
+            why=data.get("why", ""),
+            goal=data.get("goal", ""),
+            status=data.get("status", "draft"),
+            approved_by=data.get("approved_by"),
+            fiscal_year=data.get("fiscal_year", 2026),
+            outcomes=outcomes,
+            created_at=data.get("created_at", ""),
+            updated_at=data.get("updated_at", "")
+        )
+
+    return IndividualWhyGO(
+        id=data["id"],
+        level=data["level"],
+        person_id=data["person_id"],
+        parent_goal_ids=data.get("parent_goal_ids", []),
+        why=data.get("why", ""),
+        goal=data.get("goal", ""),
+        status=data.get("status", "draft"),
+        approved_by=data.get("approved_by"),
+        fiscal_year=data.get("fiscal_year", 2026),
+        outcomes=outcomes,
+        created_at=data.get("created_at", ""),
+        updated_at=data.get("updated_at", "")
+    )
+
+
+def person_from_dict(data: dict) -> Person:
+    """Build a Person from its dictionary representation"""
+    return Person(
+        id=data["id"],
+        name=data["name"],
+        title=data["title"],
+        department_id=data["department_id"],
+        manager_id=data.get("manager_id"),
+        level=data["level"],
+        employment_type=data.get("employment_type", "w2"),
+        status=data.get("status", "active"),
+        email=data.get("email"),
+        onboarding_status=data.get("onboarding_status", "not_started"),
+        onboarding_started_at=data.get("onboarding_started_at"),
+        onboarding_completed_at=data.get("onboarding_completed_at"),
+        last_login=data.get("last_login"),
+        timezone=data.get("timezone", "America/New_York"),
+        notification_enabled=data.get("notification_enabled", True)
+    )
+
+
+def department_from_dict(data: dict) -> Department:
+    """Build a Department from its dictionary representation"""
+    return Department(
+        id=data["id"],
+        name=data["name"],
+        head_id=data["head_id"],
+        primary_company_goal_ids=data.get("primary_company_goal_ids", []),
+        secondary_company_goal_ids=data.get("secondary_company_goal_ids", []),
+        reports_to=data.get("reports_to")
+    )
+
+
+def progress_update_from_dict(data: dict) -> ProgressUpdate:
+    """Build a ProgressUpdate from its dictionary representation"""
+    return ProgressUpdate(
+        id=data["id"],
+        outcome_id=data["outcome_id"],
+        quarter=data["quarter"],
+        actual_value=data.get("actual_value"),
+        status=data.get("status"),
+        notes=data.get("notes"),
+        blocker=data.get("blocker"),
+        recorded_by=data.get("recorded_by", ""),
+        recorded_at=data.get("recorded_at", "")
+    )
@@ -9,7 +9,7 @@ from typing import List
 from ..models.whygo import CompanyWhyGO, Outcome
 from ..utils.id_generator import generate_company_goal_id, generate_outcome_id, generate_person_id, extract_owner_name
 from .markdown_parser import (
-    extract_section,
+    split_numbered_sections,
     extract_table_section,
     parse_markdown_table,
     extract_why_goal_from_table,
@@ -27,36 +27,37 @@ def parse_company_whygos(file_path: str) -> List[CompanyWhyGO]:
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    # Split the document into its WhyGO sections once
+    sections = split_numbered_sections(content, r'## (?:WhyGO #(\d+):|Tracking & Governance)')
+
+    # Extract status from overall document
+    status = extract_status_field(content)
+
     whygos = []
 
     # Find all WhyGO sections (should be 4)
     for whygo_num in range(1, 5):  # Company has 4 WhyGOs
-        whygo = parse_single_company_whygo(content, whygo_num)
+        section_content = sections.get(whygo_num)
+        if not section_content:
+            continue
+        whygo = parse_single_company_whygo(section_content, whygo_num, status)
         if whygo:
             whygos.append(whygo)
 
     return whygos
 
 
-def parse_single_company_whygo(content: str, whygo_number: int) -> CompanyWhyGO:
+def parse_single_company_whygo(section_content: str, whygo_number: int, status: str) -> CompanyWhyGO:
     """
     Parse a single Company WhyGO section
 
     Args:
-        content: Full markdown content
+        section_content: Content of the WhyGO section (after its heading)
         whygo_number: WhyGO number (1-4)
+        status: Status from markdown
 
     Returns: CompanyWhyGO object or None
     """
-    # Extract the WhyGO section
-    section_pattern = rf'## WhyGO #{whygo_number}:'
-    next_section = rf'## WhyGO #{whygo_number + 1}:' if whygo_number < 4 else r'## Tracking & Governance'
-
-    section_content = extract_section(content, section_pattern, next_section)
-
-    if not section_content:
-        return None
-
     # Extract WHY - company format uses: | WHY | text |
     why_match = re.search(r'\|\s*WHY\s*\|\s*([^\|]+)\|', section_content, re.IGNORECASE)
     if why_match:
@@ -88,9 +89,6 @@ def parse_single_company_whygo(content: str, whygo_number: int) -> CompanyWhyGO:
     # Parse outcomes table
     outcomes = parse_company_outcomes(section_content, goal_id)
 
-    # Extract status from overall document
-    status = extract_status_field(content)
-
     # Company WhyGOs are owned by CEO
     owner_id = generate_person_id("Kevin Reilly")
 
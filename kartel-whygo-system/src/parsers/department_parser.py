@@ -15,7 +15,7 @@ from ..utils.id_generator import (
     extract_owner_name
 )
 from .markdown_parser import (
-    extract_section,
+    split_numbered_sections,
     extract_table_section,
     parse_markdown_table,
     extract_why_goal_from_table,
@@ -50,12 +50,18 @@ def parse_department_whygos(file_path: str) -> List[DepartmentWhyGO]:
     # Extract status
     status = extract_status_field(content)
 
+    # Split the document into its WhyGO sections once
+    sections = split_numbered_sections(content, r'#(?:#? WhyGO #(\d+):|#? Addendum)')
+
     whygos = []
 
     # Find all WhyGO sections (typically 2-3 per department)
     for whygo_num in range(1, 5):  # Check up to 4 WhyGOs
+        section_content = sections.get(whygo_num)
+        if not section_content:
+            continue
         whygo = parse_single_department_whygo(
-            content,
+            section_content,
             whygo_num,
             dept_name,
             dept_id,
@@ -69,7 +75,7 @@ def parse_department_whygos(file_path: str) -> List[DepartmentWhyGO]:
 
 
 def parse_single_department_whygo(
-    content: str,
+    section_content: str,
     whygo_number: int,
     dept_name: str,
     dept_id: str,
@@ -80,7 +86,7 @@ def parse_single_department_whygo(
     Parse a single Department WhyGO section
 
     Args:
-        content: Full markdown content
+        section_content: Content of the WhyGO section (after its heading)
         whygo_number: WhyGO number (1-3)
         dept_name: Department name (e.g., "Sales", "Production")
         dept_id: Department ID (e.g., "dept_sales")
@@ -89,15 +95,6 @@ def parse_single_department_whygo(
 
     Returns: DepartmentWhyGO object or None
     """
-    # Extract the WhyGO section
-    section_pattern = rf'# WhyGO #{whygo_number}:|## WhyGO #{whygo_number}:'
-    next_section = rf'# WhyGO #{whygo_number + 1}:|## WhyGO #{whygo_number + 1}:|# Addendum|## Addendum'
-
-    section_content = extract_section(content, section_pattern, next_section)
-
-    if not section_content:
-        return None
-
     # Extract WHY
     why_text = extract_why_goal_from_table(section_content, 'WHY')
     if not why_text:
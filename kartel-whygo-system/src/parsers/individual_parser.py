@@ -5,7 +5,7 @@ Parses Individual WhyGOs from markdown files
 """
 
 import re
-from typing import List
+from typing import List, Optional
 from ..models.whygo import IndividualWhyGO, Outcome
 from ..utils.id_generator import (
     generate_individual_goal_id,
@@ -14,38 +14,51 @@ from ..utils.id_generator import (
     extract_owner_name
 )
 from .markdown_parser import (
-    extract_section,
+    split_numbered_sections,
     extract_table_section,
     parse_markdown_table,
     extract_why_goal_from_table,
     normalize_value,
-    extract_status_field
+    extract_status_field,
+    extract_employee_name
 )
 from .company_parser import infer_metric_type
 
 
-def parse_individual_whygos(file_path: str, person_name: str) -> List[IndividualWhyGO]:
+def parse_individual_whygos(file_path: str, person_name: Optional[str] = None) -> List[IndividualWhyGO]:
     """
     Parse all Individual WhyGOs from a markdown file
 
     Args:
         file_path: Path to markdown file
-        person_name: Name of the person (e.g., "Wayan Palmieri")
+        person_name: Name of the person (e.g., "Wayan Palmieri"); read from
+            the document's Employee field if not given
 
     Returns: List of IndividualWhyGO objects
     """
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    person_name = person_name or extract_employee_name(content)
+    if not person_name:
+        print(f"Warning: Could not extract employee name from {file_path}")
+        return []
+
     # Extract status
     status = extract_status_field(content)
 
+    # Split the document into its WhyGO sections once
+    sections = split_numbered_sections(content, r'#(?:#? Individual WhyGO #(\d+):|#? Addendum)|—\s*End')
+
     whygos = []
 
     # Find all WhyGO sections (typically 2-3)
     for whygo_num in range(1, 5):
+        section_content = sections.get(whygo_num)
+        if not section_content:
+            continue
         whygo = parse_single_individual_whygo(
-            content,
+            section_content,
             whygo_num,
             person_name,
             status
@@ -57,7 +70,7 @@ def parse_individual_whygos(file_path: str, person_name: str) -> List[Individual
 
 
 def parse_single_individual_whygo(
-    content: str,
+    section_content: str,
     whygo_number: int,
     person_name: str,
     status: str
@@ -66,22 +79,13 @@ def parse_single_individual_whygo(
     Parse a single Individual WhyGO section
 
     Args:
-        content: Full markdown content
+        section_content: Content of the WhyGO section (after its heading)
         whygo_number: WhyGO number (1-3)
         person_name: Person's name
         status: Status from markdown
 
     Returns: IndividualWhyGO object or None
     """
-    # Extract the WhyGO section
-    section_pattern = rf'# Individual WhyGO #{whygo_number}:|## Individual WhyGO #{whygo_number}:'
-    next_section = rf'# Individual WhyGO #{whygo_number + 1}:|## Individual WhyGO #{whygo_number + 1}:|# Addendum|## Addendum|—\s*End'
-
-    section_content = extract_section(content, section_pattern, next_section)
-
-    if not section_content:
-        return None
-
     # Extract WHY
     why_text = extract_why_goal_from_table(section_content, 'WHY')
     if not why_text:
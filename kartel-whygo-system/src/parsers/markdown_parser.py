@@ -6,6 +6,7 @@ Core utilities for parsing markdown WhyGO documents
 
 import re
 from typing import List, Dict, Optional, Tuple
+from ..utils.metric_values import is_null_marker, parse_number
 
 
 def parse_markdown_table(table_text: str) -> List[Dict[str, str]]:
@@ -68,6 +69,45 @@ def extract_section(content: str, section_pattern: str, end_pattern: Optional[st
     return content[start_pos:].strip()
 
 
+def split_numbered_sections(content: str, marker_pattern: str) -> Dict[int, str]:
+    """
+    Split a document into its numbered sections in a single pass
+
+    Equivalent to calling extract_section() once per number with
+    "heading N+1 or an end marker" as the end pattern, but the document
+    is scanned once instead of twice per section.
+
+    Args:
+        content: Full markdown content
+        marker_pattern: Regex matching section headings, with the section
+            number as group 1, and markers that end a section without
+            starting one (group 1 unmatched), e.g.
+            r'#(?:#? WhyGO #(\\d+):|#? Addendum)'. Starting every
+            alternative with the same literal keeps the scan fast.
+
+    Returns: {section number: content after its heading, stripped}; the
+    first heading wins if a number repeats
+    """
+    # (section number, or None for an end marker; marker start; marker end)
+    markers = []
+    for match in re.finditer(marker_pattern, content, re.IGNORECASE | re.MULTILINE):
+        number = match.group(1)
+        markers.append((int(number) if number else None, match.start(), match.end()))
+
+    sections = {}
+    for idx, (number, _, body_start) in enumerate(markers):
+        if number is None or number in sections:
+            continue
+        body_end = len(content)
+        for next_number, next_start, _ in markers[idx + 1:]:
+            if next_number is None or next_number == number + 1:
+                body_end = next_start
+                break
+        sections[number] = content[body_start:body_end].strip()
+
+    return sections
+
+
 def extract_table_section(content: str, before_pattern: str) -> Optional[str]:
     """
     Extract markdown table that appears after a specific pattern
@@ -87,13 +127,8 @@ def extract_table_section(content: str, before_pattern: str) -> Optional[str]:
     content_after = content[match.end():]
 
     # Find the start of the table (first line with |)
-    table_start = None
-    for i, char in enumerate(content_after):
-        if char == '|':
-            table_start = i
-            break
-
-    if table_start is None:
+    table_start = content_after.find('|')
+    if table_start == -1:
         return None
 
     # Find the end of the table (first empty line or next heading)
@@ -221,46 +256,24 @@ def normalize_value(value: str) -> Optional[any]:
 
     - "Baseline" -> None
     - "—" or "TBD" -> None
-    - Numeric strings -> try to convert to int/float
+    - Numeric strings -> int/float ("18+" -> 18, "$7M" -> 7000000.0)
     - Keep other strings as-is
     """
     value = value.strip()
 
     # Handle baseline/TBD/empty markers
-    if value.lower() in ['baseline', 'tbd', '—', '-', '']:
+    if is_null_marker(value):
         return None
 
-    # Try to parse as number
-    # Remove common suffixes like "+" or "M" or "%"
-    clean_value = re.sub(r'[+%$]', '', value).strip()
-
-    # Handle "18+" format
-    if clean_value.endswith('+'):
-        clean_value = clean_value[:-1]
-
-    # Handle "$7M" format
-    if 'M' in clean_value or 'm' in clean_value:
-        clean_value = re.sub(r'[Mm]', '', clean_value)
-        try:
-            return float(clean_value) * 1_000_000
-        except:
-            pass
+    number = parse_number(value)
+    if number is None:
+        # Return original value if can't parse
+        return value
 
-    # Try int
-    try:
-        if '.' not in clean_value:
-            return int(clean_value)
-    except:
-        pass
-
-    # Try float
-    try:
-        return float(clean_value)
-    except:
-        pass
-
-    # Return original value if can't parse
-    return value
+    # Keep whole numbers written without a decimal point or scale as int
+    if number.is_integer() and '.' not in value and not re.search(r'[KkMmBb]', value):
+        return int(number)
+    return number
 
 
 def extract_status_field(content: str) -> str:
@@ -304,3 +317,18 @@ def extract_department_name(content: str) -> Optional[str]:
         return match2.group(1).strip()
 
     return None
+
+
+def extract_employee_name(content: str) -> Optional[str]:
+    """
+    Extract the employee's name from an individual WhyGO header table
+
+    Example: | Employee | Wayan Palmieri, SVP Head of Production | -> "Wayan Palmieri"
+    """
+    pattern = r'\|\s*Employee\s*\|\s*([^\|,]+)'
+    match = re.search(pattern, content, re.IGNORECASE)
+
+    if match:
+        return match.group(1).strip()
+
+    return None
@@ -4,10 +4,22 @@ Repository layer for data access abstraction
 
 from .interfaces import IWhygoRepository, IProgressRepository
 from .json_repository import JsonWhygoRepository, JsonProgressRepository
+from .async_repository import AsyncWhygoRepository, AsyncProgressRepository
+from .write_behind import WriteBehindFlusher
+from .events import EventBus, ChangeEvent
+from .sqlite_repository import SqliteWhygoRepository, SqliteProgressRepository, migrate_json_to_sqlite
 
 __all__ = [
     'IWhygoRepository',
     'IProgressRepository',
     'JsonWhygoRepository',
-    'JsonProgressRepository'
+    'JsonProgressRepository',
+    'AsyncWhygoRepository',
+    'AsyncProgressRepository',
+    'WriteBehindFlusher',
+    'EventBus',
+    'ChangeEvent',
+    'SqliteWhygoRepository',
+    'SqliteProgressRepository',
+    'migrate_json_to_sqlite'
 ]
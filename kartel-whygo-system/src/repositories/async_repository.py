@@ -0,0 +1,91 @@
+"""
+Async adapters for repository implementations
+
+Reads on the JSON repositories are in-memory lookups, so the async
+adapters pass them straight through and they run on the event loop. Only
+save_all(), which writes and fsyncs files, is awaited: it runs on a small
+dedicated I/O executor, so slow disk flushes neither block the event loop
+nor tie up the threadpool FastAPI uses for sync endpoints and
+dependencies. Flushes (and progress journal compaction) run one at a
+time, in submission order.
+
+Given a WriteBehindFlusher, save_all() doesn't write at all: it queues
+the repository for the flusher's next coalesced write and returns True
+at once. wait_durable() then waits until queued changes are on disk.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from .interfaces import IWhygoRepository, IProgressRepository
+from .write_behind import WriteBehindFlusher
+
+
+# Disk flushes from every async repository (one writer thread keeps them ordered)
+_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whygo-io")
+
+
+async def run_io(func: Callable, *args):
+    """Run a blocking storage call on the I/O executor and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, func, *args)
+
+
+class _AsyncRepositoryAdapter:
+    """Passes reads and in-memory mutators through to the wrapped repository"""
+
+    def __init__(self, repo, flusher: Optional[WriteBehindFlusher] = None):
+        self.repo = repo
+        self.flusher = flusher
+
+    def __getattr__(self, name):
+        return getattr(self.repo, name)
+
+    async def save_all(self) -> bool:
+        """Persist all changes (or queue them with the write-behind flusher)"""
+        if self.flusher is not None:
+            self.flusher.submit(self.repo)
+            return True
+        return await run_io(self.repo.save_all)
+
+    async def wait_durable(self) -> bool:
+        """
+        Wait until every change saved so far is on disk
+
+        Returns:
+            False if the write-behind flush failed
+        """
+        if self.flusher is None:
+            # save_all() already wrote synchronously
+            return True
+        return await self.flusher.wait_durable_async()
+
+
+class AsyncWhygoRepository(_AsyncRepositoryAdapter):
+    """
+    Async view of an IWhygoRepository
+
+    Every IWhygoRepository method is available unchanged except
+    save_all(), which is a coroutine.
+    """
+
+    def __init__(self, repo: IWhygoRepository, flusher: Optional[WriteBehindFlusher] = None):
+        super().__init__(repo, flusher)
+
+
+class AsyncProgressRepository(_AsyncRepositoryAdapter):
+    """
+    Async view of an IProgressRepository
+
+    Every IProgressRepository method is available unchanged except
+    save_all() and, where the repository has one, compact(), which are
+    coroutines.
+    """
+
+    def __init__(self, repo: IProgressRepository, flusher: Optional[WriteBehindFlusher] = None):
+        super().__init__(repo, flusher)
+
+    async def compact(self):
+        """Fold the progress journal into its snapshot on the I/O executor"""
+        return await run_io(self.repo.compact)
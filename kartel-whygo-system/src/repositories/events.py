@@ -0,0 +1,164 @@
+"""
+Change events for repository mutations
+
+Repositories publish a ChangeEvent on their EventBus after each in-memory
+mutation (before save_all() persists it), once their lock is released, so
+subscribers may read the repository again. Two ways to subscribe:
+
+- subscribe(callback): called synchronously in the mutating thread; keep
+  it cheap (update an index, bump a counter)
+- subscribe_queue(): events are handed to a bounded asyncio.Queue on the
+  subscriber's event loop; when a slow consumer lets it fill up, the
+  oldest events are dropped and counted so the consumer knows to resync
+
+The bus outlives any single repository: dependencies share one bus
+between the repositories and their hot-reloaded replacements, publishing
+REPOSITORY_RELOADED when one is swapped in.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+
+# Event kinds and their data
+OUTCOME_UPDATED = 'outcome_updated'  # Outcome
+GOAL_CREATED = 'goal_created'  # IndividualWhyGO
+GOAL_UPDATED = 'goal_updated'  # IndividualWhyGO (replaced by update_individual_goal)
+GOAL_TRANSITIONED = 'goal_transitioned'  # GoalTransition
+PERSON_UPDATED = 'person_updated'  # Person
+PROGRESS_RECORDED = 'progress_recorded'  # ProgressUpdate
+REPOSITORY_RELOADED = 'repository_reloaded'  # the new repository
+
+
+@dataclass(slots=True)
+class ChangeEvent:
+    """A mutation published by a repository"""
+    kind: str
+    data: object
+    version: int = 0  # Repository version after the change (0 if unversioned)
+    at: str = ""  # ISO timestamp
+
+
+class Subscription:
+    """A synchronous subscriber"""
+
+    __slots__ = ('bus', 'callback', 'kinds')
+
+    def __init__(self, bus: 'EventBus', callback: Callable[[ChangeEvent], None], kinds: Optional[frozenset]):
+        self.bus = bus
+        self.callback = callback
+        self.kinds = kinds
+
+    def wants(self, kind: str) -> bool:
+        return self.kinds is None or kind in self.kinds
+
+    def _deliver(self, event: ChangeEvent):
+        self.callback(event)
+
+    def close(self):
+        """Stop receiving events"""
+        self.bus.unsubscribe(self)
+
+
+class QueueSubscription(Subscription):
+    """A subscriber reading events from a bounded asyncio queue"""
+
+    __slots__ = ('queue', 'loop', 'dropped')
+
+    def __init__(self, bus: 'EventBus', kinds: Optional[frozenset], maxsize: int, loop: asyncio.AbstractEventLoop):
+        super().__init__(bus, None, kinds)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.loop = loop
+        # Events discarded because the queue was full
+        self.dropped = 0
+
+    def _deliver(self, event: ChangeEvent):
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The subscriber's event loop is closed
+            self.close()
+
+    def _put(self, event: ChangeEvent):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self) -> ChangeEvent:
+        """Wait for the next event"""
+        return await self.queue.get()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> ChangeEvent:
+        return await self.queue.get()
+
+
+class EventBus:
+    """In-process publish/subscribe for repository change events"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Replaced (never mutated) so publish() can iterate without locking
+        self._subscriptions: tuple = ()
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None], kinds: Optional[Iterable[str]] = None) -> Subscription:
+        """
+        Call callback(event) synchronously for every published event
+
+        Args:
+            callback: Receives each ChangeEvent in the publishing thread
+            kinds: Event kinds to receive (default: all)
+        """
+        return self._add(Subscription(self, callback, _kinds(kinds)))
+
+    def subscribe_queue(self, kinds: Optional[Iterable[str]] = None, maxsize: int = 1000) -> QueueSubscription:
+        """
+        Queue events for a coroutine on the running event loop
+
+        Args:
+            kinds: Event kinds to receive (default: all)
+            maxsize: Events held before the oldest are dropped
+        """
+        loop = asyncio.get_running_loop()
+        return self._add(QueueSubscription(self, _kinds(kinds), maxsize, loop))
+
+    def _add(self, subscription: Subscription) -> Subscription:
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def publish(self, kind: str, data: object, version: int = 0) -> Optional[ChangeEvent]:
+        """
+        Deliver an event to every interested subscriber
+
+        Returns:
+            The published event (None if nobody subscribed to its kind)
+        """
+        subscriptions = [s for s in self._subscriptions if s.wants(kind)]
+        if not subscriptions:
+            return None
+
+        event = ChangeEvent(kind, data, version, datetime.now().isoformat())
+        for subscription in subscriptions:
+            try:
+                subscription._deliver(event)
+            except Exception as e:
+                print(f"⚠️  Event subscriber failed on {kind}: {e}")
+        return event
+
+
+def _kinds(kinds: Optional[Iterable[str]]) -> Optional[frozenset]:
+    return frozenset(kinds) if kinds is not None else None
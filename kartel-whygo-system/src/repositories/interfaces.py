@@ -5,8 +5,9 @@ These interfaces define the contract for data operations.
 Implementations can use JSON files, databases, or any other storage backend.
 """
 
+import itertools
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, List, Optional, Union
 from ..models.whygo import (
     CompanyWhyGO,
     DepartmentWhyGO,
@@ -14,13 +15,64 @@ from ..models.whygo import (
     Outcome,
     ProgressUpdate,
     Person,
-    Department
+    Department,
+    GoalTransition
 )
+from .events import EventBus, GOAL_TRANSITIONED
+
+# Process-wide, so a reloaded repository never reuses an older version
+_data_versions = itertools.count(1)
+
+
+def next_data_version() -> int:
+    """Next value of the monotonically increasing data version"""
+    return next(_data_versions)
 
 
 class IWhygoRepository(ABC):
     """Abstract interface for WhyGO data operations"""
 
+    # Changes whenever data held by the repository changes (always increasing);
+    # on a shared backend this includes changes committed by other processes
+    version: int = 0
+
+    # Receives a ChangeEvent after each mutation (see events.py)
+    events: Optional[EventBus] = None
+
+    # Called with a GoalTransition after each goal status change
+    _transition_listeners: tuple = ()
+
+    def touch(self) -> int:
+        """Move the data version forward after a change"""
+        self.version = next_data_version()
+        return self.version
+
+    def external_version(self) -> int:
+        """
+        Counter that changes when another process changes the stored data
+
+        0 for backends whose data only changes through this object (the
+        JSON repositories are replaced on reload instead).
+        """
+        return 0
+
+    def add_transition_listener(self, listener: Callable[[GoalTransition], None]):
+        """Call listener(transition) after every goal status change"""
+        self._transition_listeners = self._transition_listeners + (listener,)
+
+    def remove_transition_listener(self, listener: Callable[[GoalTransition], None]):
+        """Stop calling a listener added with add_transition_listener()"""
+        self._transition_listeners = tuple(l for l in self._transition_listeners if l != listener)
+
+    def _emit_transition(self, transition: GoalTransition):
+        for listener in self._transition_listeners:
+            try:
+                listener(transition)
+            except Exception as e:
+                print(f"⚠️  Goal transition listener failed: {e}")
+        if self.events is not None:
+            self.events.publish(GOAL_TRANSITIONED, transition, self.version)
+
     @abstractmethod
     def get_all_company_goals(self) -> List[CompanyWhyGO]:
         """Get all company-level WhyGOs"""
@@ -51,11 +103,21 @@ class IWhygoRepository(ABC):
         """Get all WhyGOs for a specific person"""
         pass
 
+    @abstractmethod
+    def get_goal(self, goal_id: str) -> Optional[Union[CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO]]:
+        """Get a WhyGO of any level by ID"""
+        pass
+
     @abstractmethod
     def get_outcome(self, outcome_id: str) -> Optional[Outcome]:
         """Find an outcome by ID across all goals"""
         pass
 
+    @abstractmethod
+    def get_outcomes_by_owner(self, owner_id: str) -> List[Outcome]:
+        """Get all outcomes owned by a person across all goals"""
+        pass
+
     @abstractmethod
     def update_outcome(self, outcome: Outcome) -> bool:
         """Update an outcome (typically after recording progress)"""
@@ -87,6 +149,11 @@ class IWhygoRepository(ABC):
         """Get all people in a specific department"""
         pass
 
+    @abstractmethod
+    def get_direct_reports(self, manager_id: str) -> List[Person]:
+        """Get all people whose manager is manager_id"""
+        pass
+
     @abstractmethod
     def update_person(self, person: Person) -> bool:
         """Update a person's information"""
@@ -119,10 +186,28 @@ class IWhygoRepository(ABC):
         """Get goals filtered by status (returns dict with company, department, individual)"""
         pass
 
+    @abstractmethod
+    def count_goals_by_status(self, status: str) -> dict:
+        """Count goals with a status (returns dict with company, department, individual)"""
+        pass
+
+    @abstractmethod
+    def transition_goal_status(self, goal_id: str, to_status: str, actor_id: Optional[str] = None) -> bool:
+        """
+        Move a goal to a new lifecycle status
+
+        Only moves allowed by GOAL_TRANSITIONS succeed. Approving records
+        actor_id as approved_by. Listeners get a GoalTransition afterwards.
+        """
+        pass
+
 
 class IProgressRepository(ABC):
     """Abstract interface for progress update operations"""
 
+    # Receives a ChangeEvent after each recorded update (see events.py)
+    events: Optional[EventBus] = None
+
     @abstractmethod
     def record_progress(self, update: ProgressUpdate) -> bool:
         """Record a progress update"""
@@ -2,14 +2,34 @@
 JSON file implementation of repository interfaces
 
 Loads all data into memory on init, operates on in-memory objects,
-and writes back to JSON files on save_all().
+and writes modified collections back to JSON files on save_all().
 """
 
 import json
+import os
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from .interfaces import IWhygoRepository, IProgressRepository
+from .events import (
+    EventBus,
+    OUTCOME_UPDATED,
+    GOAL_CREATED,
+    GOAL_UPDATED,
+    PERSON_UPDATED,
+    PROGRESS_RECORDED,
+    REPOSITORY_RELOADED
+)
+from .locking import (
+    RWLock,
+    FileLock,
+    ConcurrencyConflictError,
+    atomic_write_json,
+    file_stamp,
+    exclusive,
+    shared
+)
 from ..models.whygo import (
     CompanyWhyGO,
     DepartmentWhyGO,
@@ -18,226 +38,194 @@ from ..models.whygo import (
     ProgressUpdate,
     Person,
     Department,
+    GoalTransition,
+    GOAL_STATUSES,
+    can_transition,
     whygo_to_dict,
+    whygo_from_dict,
     progress_update_to_dict,
+    progress_update_from_dict,
     person_to_dict,
-    department_to_dict
+    person_from_dict,
+    department_from_dict
 )
 
 
+# Advisory lock file serializing writers across processes
+LOCK_FILE = ".whygo.lock"
+
+# Persisted collections: name -> (file name, top-level list key)
+WHYGO_COLLECTIONS = {
+    'company': ("company_whygos.json", "company_goals"),
+    'department': ("department_goals.json", "department_goals"),
+    'individual': ("individual_goals.json", "individual_goals"),
+    'people': ("employees.json", "employees"),
+}
+
+
+def _envelope_without(data: dict, list_key: str) -> dict:
+    """Keep everything in a loaded JSON document except its record list"""
+    return {key: value for key, value in data.items() if key != list_key}
+
+
 class JsonWhygoRepository(IWhygoRepository):
     """JSON file-based implementation of WhyGO repository"""
 
-    def __init__(self, data_dir: str = "data/"):
+    def __init__(self, data_dir: str = "data/", fsync: bool = True, events: Optional[EventBus] = None):
         self.data_dir = Path(data_dir)
+        # fsync each written file (off: faster saves, not power-loss safe)
+        self.fsync = fsync
+        self.events = events if events is not None else EventBus()
+        # Cached metadata envelopes so saves don't need to re-read each file
+        self._envelopes: Dict[str, dict] = {}
+        # Collections modified in memory since the last save_all(): the IDs
+        # of the records changed, or None if the whole collection was flagged
+        self._dirty: Dict[str, Optional[set]] = {}
+        # Saves that found a dirty file changed by another process
+        self.conflicts = 0
+        self.last_conflict: Optional[str] = None
+        # On-disk version stamps of each data file as last loaded/written
+        self._stamps: Dict[str, tuple] = {}
+        self._lock = RWLock()
+        # Serializes save_all() calls (disk writes happen outside self._lock)
+        self._save_lock = threading.Lock()
         self._people = self._load_people()
         self._departments = self._load_departments()
         self._company_goals = self._load_company_goals()
         self._department_goals = self._load_department_goals()
         self._individual_goals = self._load_individual_goals()
+        self._build_indexes()
+        self.touch()
 
     def _load_people(self) -> dict:
         """Load people/employees from JSON"""
         file_path = self.data_dir / "employees.json"
         with open(file_path, 'r') as f:
             data = json.load(f)
+            self._stamps["employees.json"] = file_stamp(f.fileno())
+        self._envelopes['people'] = _envelope_without(data, "employees")
 
-        people = {}
-        for person_data in data.get("employees", []):
-            person = Person(
-                id=person_data["id"],
-                name=person_data["name"],
-                title=person_data["title"],
-                department_id=person_data["department_id"],
-                manager_id=person_data.get("manager_id"),
-                level=person_data["level"],
-                employment_type=person_data.get("employment_type", "w2"),
-                status=person_data.get("status", "active"),
-                email=person_data.get("email"),
-                onboarding_status=person_data.get("onboarding_status", "not_started"),
-                onboarding_started_at=person_data.get("onboarding_started_at"),
-                onboarding_completed_at=person_data.get("onboarding_completed_at"),
-                last_login=person_data.get("last_login"),
-                timezone=person_data.get("timezone", "America/New_York"),
-                notification_enabled=person_data.get("notification_enabled", True)
-            )
-            people[person.id] = person
-
-        return people
+        return {p["id"]: person_from_dict(p) for p in data.get("employees", [])}
 
     def _load_departments(self) -> dict:
         """Load departments from JSON"""
         file_path = self.data_dir / "departments.json"
         with open(file_path, 'r') as f:
             data = json.load(f)
+            self._stamps["departments.json"] = file_stamp(f.fileno())
 
-        departments = {}
-        for dept_data in data.get("departments", []):
-            dept = Department(
-                id=dept_data["id"],
-                name=dept_data["name"],
-                head_id=dept_data["head_id"],
-                primary_company_goal_ids=dept_data.get("primary_company_goal_ids", []),
-                secondary_company_goal_ids=dept_data.get("secondary_company_goal_ids", []),
-                reports_to=dept_data.get("reports_to")
-            )
-            departments[dept.id] = dept
-
-        return departments
+        return {d["id"]: department_from_dict(d) for d in data.get("departments", [])}
 
     def _load_company_goals(self) -> List[CompanyWhyGO]:
         """Load company WhyGOs from JSON"""
         file_path = self.data_dir / "company_whygos.json"
         with open(file_path, 'r') as f:
             data = json.load(f)
+            self._stamps["company_whygos.json"] = file_stamp(f.fileno())
+        self._envelopes['company'] = _envelope_without(data, "company_goals")
 
-        goals = []
-        for goal_data in data.get("company_goals", []):
-            # Parse outcomes
-            outcomes = []
-            for outcome_data in goal_data.get("outcomes", []):
-                outcome = Outcome(
-                    id=outcome_data["id"],
-                    goal_id=outcome_data["goal_id"],
-                    description=outcome_data["description"],
-                    metric_type=outcome_data["metric_type"],
-                    owner_id=outcome_data["owner_id"],
-                    target_annual=outcome_data["target_annual"],
-                    target_q1=outcome_data.get("target_q1"),
-                    target_q2=outcome_data.get("target_q2"),
-                    target_q3=outcome_data.get("target_q3"),
-                    target_q4=outcome_data.get("target_q4"),
-                    actual_q1=outcome_data.get("actual_q1"),
-                    actual_q2=outcome_data.get("actual_q2"),
-                    actual_q3=outcome_data.get("actual_q3"),
-                    actual_q4=outcome_data.get("actual_q4"),
-                    status_q1=outcome_data.get("status_q1"),
-                    status_q2=outcome_data.get("status_q2"),
-                    status_q3=outcome_data.get("status_q3"),
-                    status_q4=outcome_data.get("status_q4")
-                )
-                outcomes.append(outcome)
-
-            # Parse company WhyGO
-            goal = CompanyWhyGO(
-                id=goal_data["id"],
-                level=goal_data["level"],
-                why=goal_data.get("why", ""),
-                goal=goal_data.get("goal", ""),
-                status=goal_data.get("status", "draft"),
-                owner_id=goal_data.get("owner_id", ""),
-                fiscal_year=goal_data.get("fiscal_year", 2026),
-                outcomes=outcomes,
-                created_at=goal_data.get("created_at", ""),
-                updated_at=goal_data.get("updated_at", "")
-            )
-            goals.append(goal)
-
-        return goals
+        return [whygo_from_dict(g) for g in data.get("company_goals", [])]
 
     def _load_department_goals(self) -> List[DepartmentWhyGO]:
         """Load department WhyGOs from JSON"""
         file_path = self.data_dir / "department_goals.json"
         with open(file_path, 'r') as f:
             data = json.load(f)
+            self._stamps["department_goals.json"] = file_stamp(f.fileno())
+        self._envelopes['department'] = _envelope_without(data, "department_goals")
 
-        goals = []
-        for goal_data in data.get("department_goals", []):
-            # Parse outcomes
-            outcomes = []
-            for outcome_data in goal_data.get("outcomes", []):
-                outcome = Outcome(
-                    id=outcome_data["id"],
-                    goal_id=outcome_data["goal_id"],
-                    description=outcome_data["description"],
-                    metric_type=outcome_data["metric_type"],
-                    owner_id=outcome_data["owner_id"],
-                    target_annual=outcome_data["target_annual"],
-                    target_q1=outcome_data.get("target_q1"),
-                    target_q2=outcome_data.get("target_q2"),
-                    target_q3=outcome_data.get("target_q3"),
-                    target_q4=outcome_data.get("target_q4"),
-                    actual_q1=outcome_data.get("actual_q1"),
-                    actual_q2=outcome_data.get("actual_q2"),
-                    actual_q3=outcome_data.get("actual_q3"),
-                    actual_q4=outcome_data.get("actual_q4"),
-                    status_q1=outcome_data.get("status_q1"),
-                    status_q2=outcome_data.get("status_q2"),
-                    status_q3=outcome_data.get("status_q3"),
-                    status_q4=outcome_data.get("status_q4")
-                )
-                outcomes.append(outcome)
-
-            # Parse department WhyGO
-            goal = DepartmentWhyGO(
-                id=goal_data["id"],
-                level=goal_data["level"],
-                department_id=goal_data["department_id"],
-                parent_goal_ids=goal_data.get("parent_goal_ids", []),
-                why=goal_data.get("why", ""),
-                goal=goal_data.get("goal", ""),
-                status=goal_data.get("status", "draft"),
-                approved_by=goal_data.get("approved_by"),
-                fiscal_year=goal_data.get("fiscal_year", 2026),
-                outcomes=outcomes,
-                created_at=goal_data.get("created_at", ""),
-                updated_at=goal_data.get("updated_at", "")
-            )
-            goals.append(goal)
-
-        return goals
+        return [whygo_from_dict(g) for g in data.get("department_goals", [])]
 
     def _load_individual_goals(self) -> List[IndividualWhyGO]:
         """Load individual WhyGOs from JSON"""
         file_path = self.data_dir / "individual_goals.json"
         with open(file_path, 'r') as f:
             data = json.load(f)
+            self._stamps["individual_goals.json"] = file_stamp(f.fileno())
+        self._envelopes['individual'] = _envelope_without(data, "individual_goals")
+
+        return [whygo_from_dict(g) for g in data.get("individual_goals", [])]
+
+    def _build_indexes(self):
+        """Build in-memory lookup indexes over the loaded goals and people"""
+        self._goal_index: Dict[str, Union[CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO]] = {}
+        self._outcome_index: Dict[str, Tuple[Union[CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO], int]] = {}
+        self._outcome_owners: Dict[str, str] = {}
+        self._owner_outcome_index: Dict[str, Dict[str, Outcome]] = {}
+        self._dept_goal_index: Dict[str, List[DepartmentWhyGO]] = {}
+        self._person_goal_index: Dict[str, List[IndividualWhyGO]] = {}
+        self._email_index: Dict[str, Person] = {}
+        self._person_emails: Dict[str, str] = {}
+        self._reports_index: Dict[str, Dict[str, Person]] = {}
+        self._person_managers: Dict[str, str] = {}
+        # (level, status) -> goals with that status, keyed by goal ID
+        self._status_index: Dict[Tuple[str, str], Dict[str, Union[CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO]]] = {}
+
+        for goal in self._company_goals + self._department_goals + self._individual_goals:
+            self._index_goal(goal)
 
-        goals = []
-        for goal_data in data.get("individual_goals", []):
-            # Parse outcomes
-            outcomes = []
-            for outcome_data in goal_data.get("outcomes", []):
-                outcome = Outcome(
-                    id=outcome_data["id"],
-                    goal_id=outcome_data["goal_id"],
-                    description=outcome_data["description"],
-                    metric_type=outcome_data["metric_type"],
-                    owner_id=outcome_data["owner_id"],
-                    target_annual=outcome_data["target_annual"],
-                    target_q1=outcome_data.get("target_q1"),
-                    target_q2=outcome_data.get("target_q2"),
-                    target_q3=outcome_data.get("target_q3"),
-                    target_q4=outcome_data.get("target_q4"),
-                    actual_q1=outcome_data.get("actual_q1"),
-                    actual_q2=outcome_data.get("actual_q2"),
-                    actual_q3=outcome_data.get("actual_q3"),
-                    actual_q4=outcome_data.get("actual_q4"),
-                    status_q1=outcome_data.get("status_q1"),
-                    status_q2=outcome_data.get("status_q2"),
-                    status_q3=outcome_data.get("status_q3"),
-                    status_q4=outcome_data.get("status_q4")
-                )
-                outcomes.append(outcome)
-
-            # Parse individual WhyGO
-            goal = IndividualWhyGO(
-                id=goal_data["id"],
-                level=goal_data["level"],
-                person_id=goal_data["person_id"],
-                parent_goal_ids=goal_data.get("parent_goal_ids", []),
-                why=goal_data.get("why", ""),
-                goal=goal_data.get("goal", ""),
-                status=goal_data.get("status", "draft"),
-                approved_by=goal_data.get("approved_by"),
-                fiscal_year=goal_data.get("fiscal_year", 2026),
-                outcomes=outcomes,
-                created_at=goal_data.get("created_at", ""),
-                updated_at=goal_data.get("updated_at", "")
-            )
-            goals.append(goal)
-
-        return goals
+        for person in self._people.values():
+            self._index_person(person)
+
+    def _index_goal(self, goal):
+        """Add a goal and its outcomes to the lookup indexes"""
+        self._goal_index[goal.id] = goal
+        self._status_index.setdefault((goal.level, goal.status), {})[goal.id] = goal
+        if isinstance(goal, DepartmentWhyGO):
+            self._dept_goal_index.setdefault(goal.department_id, []).append(goal)
+        elif isinstance(goal, IndividualWhyGO):
+            self._person_goal_index.setdefault(goal.person_id, []).append(goal)
+
+        for position, outcome in enumerate(goal.outcomes):
+            self._index_outcome(goal, position, outcome)
+
+    def _unindex_goal(self, goal):
+        """Remove a goal and its outcomes from the lookup indexes"""
+        self._goal_index.pop(goal.id, None)
+        self._status_index.get((goal.level, goal.status), {}).pop(goal.id, None)
+        if isinstance(goal, DepartmentWhyGO):
+            bucket = self._dept_goal_index.get(goal.department_id, [])
+            bucket[:] = [g for g in bucket if g.id != goal.id]
+        elif isinstance(goal, IndividualWhyGO):
+            bucket = self._person_goal_index.get(goal.person_id, [])
+            bucket[:] = [g for g in bucket if g.id != goal.id]
+
+        for outcome in goal.outcomes:
+            self._outcome_index.pop(outcome.id, None)
+            owner_id = self._outcome_owners.pop(outcome.id, None)
+            self._owner_outcome_index.get(owner_id, {}).pop(outcome.id, None)
+
+    def _index_outcome(self, goal, position: int, outcome: Outcome):
+        """Point the outcome and owner indexes at an outcome's current location"""
+        self._outcome_index[outcome.id] = (goal, position)
+
+        # Outcome objects are mutated in place, so track the previously
+        # indexed owner separately to detect reassignment
+        previous_owner = self._outcome_owners.get(outcome.id)
+        if previous_owner is not None and previous_owner != outcome.owner_id:
+            self._owner_outcome_index.get(previous_owner, {}).pop(outcome.id, None)
+
+        self._outcome_owners[outcome.id] = outcome.owner_id
+        self._owner_outcome_index.setdefault(outcome.owner_id, {})[outcome.id] = outcome
+
+    def _index_person(self, person: Person):
+        """Point the email and manager indexes at a person's current record"""
+        previous_manager = self._person_managers.pop(person.id, None)
+        if previous_manager is not None:
+            self._reports_index.get(previous_manager, {}).pop(person.id, None)
+        if person.manager_id:
+            self._reports_index.setdefault(person.manager_id, {})[person.id] = person
+            self._person_managers[person.id] = person.manager_id
+
+        previous_email = self._person_emails.pop(person.id, None)
+        indexed = self._email_index.get(previous_email)
+        if indexed is not None and indexed.id == person.id:
+            del self._email_index[previous_email]
+
+        if person.email:
+            email = person.email.lower()
+            self._email_index[email] = person
+            self._person_emails[person.id] = email
 
     def get_all_company_goals(self) -> List[CompanyWhyGO]:
         """Get all company-level WhyGOs"""
@@ -245,80 +233,63 @@ class JsonWhygoRepository(IWhygoRepository):
 
     def get_company_goal(self, goal_id: str) -> Optional[CompanyWhyGO]:
         """Get a specific company WhyGO by ID"""
-        for goal in self._company_goals:
-            if goal.id == goal_id:
-                return goal
-        return None
+        goal = self._goal_index.get(goal_id)
+        return goal if isinstance(goal, CompanyWhyGO) else None
 
     def get_all_department_goals(self) -> List[DepartmentWhyGO]:
         """Get all department-level WhyGOs"""
         return self._department_goals
 
+    @shared
     def get_department_goals_by_department(self, dept_id: str) -> List[DepartmentWhyGO]:
         """Get all WhyGOs for a specific department"""
-        return [g for g in self._department_goals if g.department_id == dept_id]
+        return list(self._dept_goal_index.get(dept_id, []))
 
     def get_all_individual_goals(self) -> List[IndividualWhyGO]:
         """Get all individual-level WhyGOs"""
         return self._individual_goals
 
+    @shared
     def get_individual_goals_by_person(self, person_id: str) -> List[IndividualWhyGO]:
         """Get all WhyGOs for a specific person"""
-        return [g for g in self._individual_goals if g.person_id == person_id]
+        return list(self._person_goal_index.get(person_id, []))
+
+    def get_goal(self, goal_id: str) -> Optional[Union[CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO]]:
+        """Get a WhyGO of any level by ID"""
+        return self._goal_index.get(goal_id)
 
     def get_outcome(self, outcome_id: str) -> Optional[Outcome]:
         """Find an outcome by ID across all goals"""
-        # Search company goals
-        for goal in self._company_goals:
-            for outcome in goal.outcomes:
-                if outcome.id == outcome_id:
-                    return outcome
-
-        # Search department goals
-        for goal in self._department_goals:
-            for outcome in goal.outcomes:
-                if outcome.id == outcome_id:
-                    return outcome
-
-        # Search individual goals
-        for goal in self._individual_goals:
-            for outcome in goal.outcomes:
-                if outcome.id == outcome_id:
-                    return outcome
-
-        return None
+        entry = self._outcome_index.get(outcome_id)
+        if entry is None:
+            return None
+        goal, position = entry
+        return goal.outcomes[position]
+
+    @shared
+    def get_outcomes_by_owner(self, owner_id: str) -> List[Outcome]:
+        """Get all outcomes owned by a person across all goals"""
+        return list(self._owner_outcome_index.get(owner_id, {}).values())
 
     def update_outcome(self, outcome: Outcome) -> bool:
         """Update an outcome (in-memory only, call save_all() to persist)"""
-        # Find and update the outcome in the appropriate goal
-        # The outcome object is already updated in memory since Python passes by reference
-        # We just need to update the updated_at timestamp on the parent goal
-
-        # Search company goals
-        for goal in self._company_goals:
-            for idx, existing_outcome in enumerate(goal.outcomes):
-                if existing_outcome.id == outcome.id:
-                    goal.outcomes[idx] = outcome
-                    goal.updated_at = datetime.now().isoformat()
-                    return True
-
-        # Search department goals
-        for goal in self._department_goals:
-            for idx, existing_outcome in enumerate(goal.outcomes):
-                if existing_outcome.id == outcome.id:
-                    goal.outcomes[idx] = outcome
-                    goal.updated_at = datetime.now().isoformat()
-                    return True
-
-        # Search individual goals
-        for goal in self._individual_goals:
-            for idx, existing_outcome in enumerate(goal.outcomes):
-                if existing_outcome.id == outcome.id:
-                    goal.outcomes[idx] = outcome
-                    goal.updated_at = datetime.now().isoformat()
-                    return True
-
-        return False
+        # The outcome object is usually already updated in memory since Python
+        # passes by reference; replace it in its goal and touch the goal's
+        # updated_at timestamp
+        with self._lock.write():
+            entry = self._outcome_index.get(outcome.id)
+            if entry is None:
+                return False
+
+            goal, position = entry
+            goal.outcomes[position] = outcome
+            goal.updated_at = datetime.now().isoformat()
+            self._index_outcome(goal, position, outcome)
+            self._mark(goal.level, goal.id)
+            version = self.touch()
+
+        self.events.publish(OUTCOME_UPDATED, outcome, version)
+        return True
 
     # Person/User methods
     def get_person(self, person_id: str) -> Optional[Person]:
@@ -329,24 +300,34 @@ class JsonWhygoRepository(IWhygoRepository):
         """Get a person by email address"""
         if not email:
             return None
-        for person in self._people.values():
-            if person.email and person.email.lower() == email.lower():
-                return person
-        return None
+        return self._email_index.get(email.lower())
 
+    @shared
     def get_all_people(self) -> List[Person]:
         """Get all people/employees"""
         return list(self._people.values())
 
+    @shared
     def get_people_by_department(self, dept_id: str) -> List[Person]:
         """Get all people in a specific department"""
         return [p for p in self._people.values() if p.department_id == dept_id]
 
+    @shared
+    def get_direct_reports(self, manager_id: str) -> List[Person]:
+        """Get all people whose manager is manager_id"""
+        return list(self._reports_index.get(manager_id, {}).values())
+
     def update_person(self, person: Person) -> bool:
         """Update a person's information"""
-        if person.id not in self._people:
-            return False
-        self._people[person.id] = person
+        with self._lock.write():
+            if person.id not in self._people:
+                return False
+            self._people[person.id] = person
+            self._index_person(person)
+            self._mark('people', person.id)
+            version = self.touch()
+
+        self.events.publish(PERSON_UPDATED, person, version)
         return True
 
     # Department methods
@@ -361,140 +342,497 @@ class JsonWhygoRepository(IWhygoRepository):
     # Goal creation/update methods
     def create_individual_goal(self, goal: IndividualWhyGO) -> bool:
         """Create a new individual goal"""
-        if goal.id in [g.id for g in self._individual_goals]:
-            return False
-        goal.created_at = datetime.now().isoformat()
-        goal.updated_at = goal.created_at
-        self._individual_goals.append(goal)
+        with self._lock.write():
+            if goal.id in self._goal_index:
+                return False
+            goal.created_at = datetime.now().isoformat()
+            goal.updated_at = goal.created_at
+            self._individual_goals.append(goal)
+            self._index_goal(goal)
+            self._mark('individual', goal.id)
+            version = self.touch()
+
+        self.events.publish(GOAL_CREATED, goal, version)
         return True
 
     def update_individual_goal(self, goal: IndividualWhyGO) -> bool:
-        """Update an existing individual goal"""
-        for idx, existing_goal in enumerate(self._individual_goals):
-            if existing_goal.id == goal.id:
-                goal.updated_at = datetime.now().isoformat()
-                self._individual_goals[idx] = goal
-                return True
-        return False
+        """Update an existing individual goal (a status change must be a valid transition)"""
+        with self._lock.write():
+            existing_goal = self._goal_index.get(goal.id)
+            if not isinstance(existing_goal, IndividualWhyGO):
+                return False
+
+            # existing_goal may be the same object, already edited in place
+            from_status = self._indexed_status(existing_goal)
+            if goal.status != from_status and not can_transition(from_status, goal.status):
+                print(f"❌ Invalid status transition for {goal.id}: {from_status} -> {goal.status}")
+                return False
+
+            for idx, candidate in enumerate(self._individual_goals):
+                if candidate is existing_goal:
+                    goal.updated_at = datetime.now().isoformat()
+                    self._status_index.get(('individual', from_status), {}).pop(goal.id, None)
+                    self._unindex_goal(existing_goal)
+                    self._individual_goals[idx] = goal
+                    self._index_goal(goal)
+                    self._mark('individual', goal.id)
+                    version = self.touch()
+                    break
+            else:
+                return False
+
+        self.events.publish(GOAL_UPDATED, goal, version)
+        if goal.status != from_status:
+            self._emit_transition(GoalTransition(goal, from_status, goal.status, at=goal.updated_at))
+        return True
+
+    def _indexed_status(self, goal) -> str:
+        """Status a goal is currently filed under in the status index"""
+        for status in GOAL_STATUSES:
+            if goal.id in self._status_index.get((goal.level, status), {}):
+                return status
+        return goal.status
+
+    def transition_goal_status(self, goal_id: str, to_status: str, actor_id: Optional[str] = None) -> bool:
+        """Move a goal to a new lifecycle status (in-memory only, call save_all() to persist)"""
+        with self._lock.write():
+            goal = self._goal_index.get(goal_id)
+            if goal is None:
+                return False
+
+            from_status = goal.status
+            if not can_transition(from_status, to_status):
+                print(f"❌ Invalid status transition for {goal_id}: {from_status} -> {to_status}")
+                return False
+
+            self._status_index.get((goal.level, from_status), {}).pop(goal.id, None)
+            goal.status = to_status
+            if to_status == 'approved' and hasattr(goal, 'approved_by'):
+                goal.approved_by = actor_id
+            goal.updated_at = datetime.now().isoformat()
+            self._status_index.setdefault((goal.level, to_status), {})[goal.id] = goal
+            self._mark(goal.level, goal.id)
+            self.touch()
+
+        self._emit_transition(GoalTransition(goal, from_status, to_status, actor_id, goal.updated_at))
+        return True
 
+    @shared
     def get_goals_by_status(self, status: str) -> dict:
         """Get goals filtered by status"""
         return {
-            'company': [g for g in self._company_goals if g.status == status],
-            'department': [g for g in self._department_goals if g.status == status],
-            'individual': [g for g in self._individual_goals if g.status == status]
+            level: list(self._status_index.get((level, status), {}).values())
+            for level in ('company', 'department', 'individual')
         }
 
-    def save_all(self) -> bool:
-        """Write all data back to JSON files"""
-        try:
-            # Save company goals
-            company_file = self.data_dir / "company_whygos.json"
-            with open(company_file, 'r') as f:
-                company_data = json.load(f)
-
-            company_data["company_goals"] = [whygo_to_dict(g) for g in self._company_goals]
-            company_data["metadata"]["last_updated"] = datetime.now().isoformat()
-
-            with open(company_file, 'w') as f:
-                json.dump(company_data, f, indent=2)
-
-            # Save department goals
-            dept_file = self.data_dir / "department_goals.json"
-            with open(dept_file, 'r') as f:
-                dept_data = json.load(f)
-
-            dept_data["department_goals"] = [whygo_to_dict(g) for g in self._department_goals]
-            dept_data["metadata"]["last_updated"] = datetime.now().isoformat()
-
-            with open(dept_file, 'w') as f:
-                json.dump(dept_data, f, indent=2)
-
-            # Save individual goals
-            indiv_file = self.data_dir / "individual_goals.json"
-            with open(indiv_file, 'r') as f:
-                indiv_data = json.load(f)
-
-            indiv_data["individual_goals"] = [whygo_to_dict(g) for g in self._individual_goals]
-            indiv_data["metadata"]["last_updated"] = datetime.now().isoformat()
-
-            with open(indiv_file, 'w') as f:
-                json.dump(indiv_data, f, indent=2)
-
-            # Save employees
-            employees_file = self.data_dir / "employees.json"
-            with open(employees_file, 'r') as f:
-                employees_data = json.load(f)
-
-            employees_data["employees"] = [person_to_dict(p) for p in self._people.values()]
-            employees_data["metadata"]["last_updated"] = datetime.now().isoformat()
+    @shared
+    def count_goals_by_status(self, status: str) -> dict:
+        """Count goals with a status"""
+        return {
+            level: len(self._status_index.get((level, status), ()))
+            for level in ('company', 'department', 'individual')
+        }
 
-            with open(employees_file, 'w') as f:
-                json.dump(employees_data, f, indent=2)
+    def has_external_changes(self) -> bool:
+        """True if a data file changed on disk since we loaded or last wrote it"""
+        return any(
+            file_stamp(self.data_dir / file_name) != stamp
+            for file_name, stamp in self._stamps.items()
+        )
+
+    def has_unsaved_changes(self) -> bool:
+        """True if there are in-memory modifications not yet written by save_all()"""
+        return bool(self._dirty)
+
+    @exclusive
+    def mark_dirty(self, collection: str, record_id: Optional[str] = None):
+        """
+        Flag a record, or without record_id a whole collection ('company',
+        'department', 'individual', 'people'), for the next save
+        """
+        if collection not in WHYGO_COLLECTIONS:
+            raise ValueError(f"Unknown collection: {collection}")
+        self._mark(collection, record_id)
+        self.touch()
+
+    def _mark(self, collection: str, record_id: Optional[str] = None):
+        """Record an unsaved change (caller holds the write lock)"""
+        if collection in self._dirty and self._dirty[collection] is None:
+            return
+        if record_id is None:
+            self._dirty[collection] = None
+        else:
+            self._dirty.setdefault(collection, set()).add(record_id)
+
+    def _records(self, collection: str) -> list:
+        """In-memory records of a collection, in file order"""
+        if collection == 'company':
+            return self._company_goals
+        if collection == 'department':
+            return self._department_goals
+        if collection == 'individual':
+            return self._individual_goals
+        return list(self._people.values())
 
-            return True
-        except Exception as e:
-            print(f"Error saving WhyGO data: {e}")
+    def save_all(self) -> bool:
+        """
+        Write collections modified since the last save back to their JSON files
+
+        Holds the data directory's file lock while writing. If another
+        process changed a dirty collection's file since we loaded it, its
+        file is re-read first and our changed records are applied on top
+        (see _merge_external_changes), so neither side's edits are lost.
+
+        The in-memory lock is only held while the dirty collections are
+        taken, not while they are serialized and written, so readers aren't
+        stalled behind a slow flush. Locks are always taken in the order
+        save lock, file lock, in-memory lock.
+
+        Returns:
+            False if writing failed, or if a collection flagged as a whole
+            had to be replaced by the other process's version
+        """
+        with self._save_lock:
+            written = []
+            pending = []
+            try:
+                with FileLock(self.data_dir / LOCK_FILE):
+                    merged, rejected = self._merge_external_changes()
+                    pending = self._snapshot_dirty()
+                    for collection, file_name, data, _ in pending:
+                        file_path = self.data_dir / file_name
+                        atomic_write_json(file_path, data, fsync=self.fsync)
+                        self._stamps[file_name] = file_stamp(file_path)
+                        written.append(collection)
+            except ConcurrencyConflictError as e:
+                # A writer that doesn't take the file lock; merged next save
+                print(f"⚠️  Not saving WhyGO data: {e}")
+                return False
+            except Exception as e:
+                print(f"Error saving WhyGO data: {e}")
+                with self._lock.write():
+                    for collection, _, _, record_ids in pending:
+                        if collection not in written:
+                            self._remark(collection, record_ids)
+                return False
+
+        if merged or rejected:
+            # Records were replaced by the other process's versions
+            self.events.publish(REPOSITORY_RELOADED, self, self.version)
+        if rejected:
+            print(f"⚠️  Discarded unsaved changes to {', '.join(rejected)}: {self.last_conflict}")
             return False
+        return True
 
+    def _remark(self, collection: str, record_ids: Optional[set]):
+        """Flag records taken by a failed save as dirty again"""
+        if record_ids is None:
+            self._mark(collection)
+        else:
+            for record_id in record_ids:
+                self._mark(collection, record_id)
+
+    def _merge_external_changes(self) -> Tuple[List[str], List[str]]:
+        """
+        Fold other processes' writes into dirty collections before saving
+
+        For each dirty collection whose file changed on disk, the file is
+        re-read and becomes the new in-memory collection, except that the
+        records we changed (created, updated or transitioned) keep our
+        version: per record, the last writer wins. A collection flagged
+        without record IDs can't be merged, so our copy is discarded in
+        favour of the file. Caller holds the file lock.
+
+        Returns:
+            (collections merged, collections whose changes were discarded)
+        """
+        changed = []
+        for collection, (file_name, list_key) in WHYGO_COLLECTIONS.items():
+            if collection not in self._dirty:
+                continue
+            file_path = self.data_dir / file_name
+            if file_stamp(file_path) == self._stamps.get(file_name):
+                continue
+            # Read outside the in-memory lock
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+                stamp = file_stamp(f.fileno())
+            changed.append((collection, file_name, list_key, data, stamp))
+
+        if not changed:
+            return [], []
+
+        merged, rejected = [], []
+        with self._lock.write():
+            for collection, file_name, list_key, data, stamp in changed:
+                record_ids = self._dirty.get(collection, set())
+                from_dict = person_from_dict if collection == 'people' else whygo_from_dict
+                ours = {record.id: record for record in self._records(collection)}
+
+                if record_ids is None:
+                    records = [from_dict(raw) for raw in data.get(list_key, [])]
+                    del self._dirty[collection]
+                    rejected.append(collection)
+                else:
+                    on_disk = set()
+                    records = []
+                    for raw in data.get(list_key, []):
+                        on_disk.add(raw.get("id"))
+                        if raw.get("id") in record_ids:
+                            if raw["id"] in ours:
+                                records.append(ours[raw["id"]])
+                        else:
+                            records.append(from_dict(raw))
+                    # Records we created that the other process doesn't have
+                    records.extend(
+                        record for record_id, record in ours.items()
+                        if record_id in record_ids and record_id not in on_disk
+                    )
+                    merged.append(collection)
+                    print(f"⚠️  {file_name} was changed by another process; merging our changed {collection} records into it")
+
+                if collection == 'people':
+                    self._people = {p.id: p for p in records}
+                elif collection == 'company':
+                    self._company_goals = records
+                elif collection == 'department':
+                    self._department_goals = records
+                else:
+                    self._individual_goals = records
+                self._envelopes[collection] = _envelope_without(data, list_key)
+                self._stamps[file_name] = stamp
+
+                self.conflicts += 1
+                self.last_conflict = f"{file_name} was modified by another process since it was loaded"
+
+            self._build_indexes()
+            self.touch()
+
+        return merged, rejected
+
+    def _snapshot_dirty(self) -> List[Tuple[str, str, dict, Optional[set]]]:
+        """
+        Serialize the dirty collections and mark them clean
+
+        Only taking the collections holds the in-memory lock; they are
+        serialized after it is released.
+
+        Returns:
+            List of (collection, file name, JSON document, dirty record IDs)
+            to write
+
+        Raises:
+            ConcurrencyConflictError: If a dirty collection's file changed on disk
+        """
+        for collection, (file_name, _) in WHYGO_COLLECTIONS.items():
+            if collection in self._dirty and file_stamp(self.data_dir / file_name) != self._stamps.get(file_name):
+                raise ConcurrencyConflictError(
+                    f"{file_name} was modified by another process since it was loaded"
+                )
 
-class JsonProgressRepository(IProgressRepository):
-    """JSON file-based implementation of progress update repository"""
+        taken = []
+        with self._lock.write():
+            for collection, (file_name, list_key) in WHYGO_COLLECTIONS.items():
+                if collection not in self._dirty:
+                    continue
+                envelope = self._envelopes.setdefault(collection, {})
+                envelope.setdefault("metadata", {})["last_updated"] = datetime.now().isoformat()
+                taken.append((
+                    collection, file_name, list_key, dict(envelope),
+                    list(self._records(collection)), self._dirty[collection]
+                ))
+            # Changes made while the files are being written re-dirty them
+            for collection, *_ in taken:
+                del self._dirty[collection]
+
+        pending = []
+        for collection, file_name, list_key, data, records, record_ids in taken:
+            to_dict = person_to_dict if collection == 'people' else whygo_to_dict
+            data[list_key] = [to_dict(record) for record in records]
+            pending.append((collection, file_name, data, record_ids))
+        return pending
 
-    def __init__(self, data_dir: str = "data/"):
+class JsonProgressRepository(IProgressRepository):
+    """
+    JSON file-based implementation of progress update repository
+
+    Progress history is stored as a snapshot (progress_updates.json) plus an
+    append-only JSONL journal. save_all() appends only the updates recorded
+    since the last save to the journal; once the journal holds
+    compact_every entries it is folded back into the snapshot.
+    """
+
+    SNAPSHOT_FILE = "progress_updates.json"
+    JOURNAL_FILE = "progress_updates.journal.jsonl"
+
+    def __init__(
+        self,
+        data_dir: str = "data/",
+        compact_every: int = 500,
+        fsync: bool = True,
+        events: Optional[EventBus] = None
+    ):
         self.data_dir = Path(data_dir)
-        self._updates = self._load_updates()
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.events = events if events is not None else EventBus()
+        self._envelope: dict = {}
+        self._updates: List[ProgressUpdate] = []
+        self._updates_by_outcome: Dict[str, List[ProgressUpdate]] = {}
+        self._seen = set()
+        self._pending: List[ProgressUpdate] = []
+        self._journal_entries = 0
+        self._stamps: Dict[str, tuple] = {}
+        self._lock = RWLock()
+        self._save_lock = threading.Lock()
+
+        for update in self._load_updates():
+            self._add(update)
+        for update in self._replay_journal():
+            self._add(update)
+            self._journal_entries += 1
 
     def _load_updates(self) -> List[ProgressUpdate]:
-        """Load progress updates from JSON"""
-        file_path = self.data_dir / "progress_updates.json"
+        """Load progress updates from the JSON snapshot"""
+        file_path = self.data_dir / self.SNAPSHOT_FILE
         with open(file_path, 'r') as f:
             data = json.load(f)
+            self._stamps[self.SNAPSHOT_FILE] = file_stamp(f.fileno())
+        self._envelope = _envelope_without(data, "progress_updates")
 
-        updates = []
-        for update_data in data.get("progress_updates", []):
-            update = ProgressUpdate(
-                id=update_data["id"],
-                outcome_id=update_data["outcome_id"],
-                quarter=update_data["quarter"],
-                actual_value=update_data.get("actual_value"),
-                status=update_data.get("status"),
-                notes=update_data.get("notes"),
-                blocker=update_data.get("blocker"),
-                recorded_by=update_data.get("recorded_by", ""),
-                recorded_at=update_data.get("recorded_at", "")
-            )
-            updates.append(update)
+        return [progress_update_from_dict(u) for u in data.get("progress_updates", [])]
 
+    def _replay_journal(self) -> List[ProgressUpdate]:
+        """Load progress updates appended to the journal since the last compaction"""
+        journal_path = self.data_dir / self.JOURNAL_FILE
+        if not journal_path.exists():
+            self._stamps[self.JOURNAL_FILE] = None
+            return []
+
+        updates = []
+        with open(journal_path, 'r') as f:
+            self._stamps[self.JOURNAL_FILE] = file_stamp(f.fileno())
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    updates.append(progress_update_from_dict(json.loads(line)))
+                except (ValueError, KeyError):
+                    # A torn final line from an interrupted append
+                    print(f"⚠️  Skipping unreadable progress journal entry: {line[:80]}")
         return updates
 
+    def _add(self, update: ProgressUpdate) -> bool:
+        """Add an update to the in-memory history, ignoring exact duplicates"""
+        key = (update.id, update.recorded_at)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self._updates.append(update)
+        self._updates_by_outcome.setdefault(update.outcome_id, []).append(update)
+        return True
+
     def record_progress(self, update: ProgressUpdate) -> bool:
         """Record a progress update (in-memory, call save_all() to persist)"""
-        self._updates.append(update)
+        with self._lock.write():
+            added = self._add(update)
+            if added:
+                self._pending.append(update)
+
+        if added:
+            self.events.publish(PROGRESS_RECORDED, update)
         return True
 
+    @shared
     def get_updates_for_outcome(self, outcome_id: str) -> List[ProgressUpdate]:
         """Get all progress updates for a specific outcome"""
-        return [u for u in self._updates if u.outcome_id == outcome_id]
+        return list(self._updates_by_outcome.get(outcome_id, []))
 
     def get_all_updates(self) -> List[ProgressUpdate]:
         """Get all progress updates"""
         return self._updates
 
     def save_all(self) -> bool:
-        """Write all progress updates back to JSON"""
-        try:
-            file_path = self.data_dir / "progress_updates.json"
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+        """Append unsaved progress updates to the journal, compacting when it grows large"""
+        with self._save_lock:
+            pending = []
+            try:
+                with FileLock(self.data_dir / LOCK_FILE):
+                    with self._lock.write():
+                        pending, self._pending = self._pending, []
+
+                    # The journal append runs outside the in-memory lock so
+                    # readers aren't stalled behind the fsync
+                    if pending:
+                        lines = ''.join(
+                            json.dumps(progress_update_to_dict(u)) + '\n' for u in pending
+                        )
+                        journal_path = self.data_dir / self.JOURNAL_FILE
+                        # Only adopt the post-append stamp if nobody else touched
+                        # the journal since we last read it; otherwise their
+                        # entries would be hidden from has_external_changes()
+                        unchanged = file_stamp(journal_path) == self._stamps.get(self.JOURNAL_FILE)
+                        with open(journal_path, 'a') as f:
+                            f.write(lines)
+                            f.flush()
+                            if self.fsync:
+                                os.fsync(f.fileno())
+                            if unchanged:
+                                self._stamps[self.JOURNAL_FILE] = file_stamp(f.fileno())
+
+                        self._journal_entries += len(pending)
+                        pending = []
+
+                    if self._journal_entries >= self.compact_every:
+                        self._compact()
 
-            data["progress_updates"] = [progress_update_to_dict(u) for u in self._updates]
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
-
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
-
-            return True
-        except Exception as e:
-            print(f"Error saving progress updates: {e}")
-            return False
+                return True
+            except Exception as e:
+                print(f"Error saving progress updates: {e}")
+                if pending:
+                    with self._lock.write():
+                        self._pending[:0] = pending
+                return False
+
+    def compact(self):
+        """Fold the journal into the snapshot file and truncate the journal"""
+        with self._save_lock:
+            self._compact()
+
+    def _compact(self):
+        """compact() for callers holding the save lock"""
+        # Same lock order as save_all(): file lock, then the in-memory lock
+        # only while merging, so the reads and writes don't stall readers
+        with FileLock(self.data_dir / LOCK_FILE):
+            # Merge what other processes persisted since we loaded, so the
+            # rewritten snapshot doesn't drop their updates
+            on_disk = self._load_updates() + self._replay_journal()
+            with self._lock.write():
+                for update in on_disk:
+                    self._add(update)
+                history = list(self._updates)
+
+            self._envelope.setdefault("metadata", {})["last_updated"] = datetime.now().isoformat()
+
+            data = dict(self._envelope)
+            data["progress_updates"] = [progress_update_to_dict(u) for u in history]
+
+            atomic_write_json(self.data_dir / self.SNAPSHOT_FILE, data, fsync=self.fsync)
+            self._stamps[self.SNAPSHOT_FILE] = file_stamp(self.data_dir / self.SNAPSHOT_FILE)
+
+            # Replay de-duplicates, so a crash before this truncate is harmless
+            with open(self.data_dir / self.JOURNAL_FILE, 'w') as f:
+                self._stamps[self.JOURNAL_FILE] = file_stamp(f.fileno())
+            self._journal_entries = 0
+
+    def has_external_changes(self) -> bool:
+        """True if the snapshot or journal changed on disk since we last read or wrote it"""
+        return any(
+            file_stamp(self.data_dir / file_name) != stamp
+            for file_name, stamp in self._stamps.items()
+        )
+
+    def has_unsaved_changes(self) -> bool:
+        """True if there are recorded updates not yet written by save_all()"""
+        return bool(self._pending)
@@ -0,0 +1,187 @@
+"""
+Concurrency primitives for file-backed repositories
+
+- RWLock: in-process reader/writer lock guarding in-memory collections
+- FileLock: advisory lock shared by every process using a data directory
+- atomic_write_json / atomic_write_text: temp file + rename so readers
+  never see a torn file
+- file_stamp: cheap version stamp used for optimistic conflict detection
+"""
+
+import functools
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+
+class ConcurrencyConflictError(Exception):
+    """Raised when a data file changed on disk after it was loaded"""
+    pass
+
+
+class RWLock:
+    """
+    Reader/writer lock
+
+    Any number of readers may hold the lock at once; writers get exclusive
+    access. Waiting writers block new readers so writes aren't starved.
+    Write acquisition is reentrant for the owning thread.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                # Reads from inside our own write section are always safe
+                nested = True
+            else:
+                nested = False
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+                self._readers += 1
+        try:
+            yield
+        finally:
+            if not nested:
+                with self._cond:
+                    self._readers -= 1
+                    if self._readers == 0:
+                        self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+            else:
+                self._waiting_writers += 1
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+                self._waiting_writers -= 1
+                self._writer = me
+                self._writer_depth = 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    self._writer = None
+                    self._cond.notify_all()
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a lock file (fcntl.flock)
+
+    Serializes writers across processes that share a data directory. Within
+    a process, a reentrant thread lock per lock file excludes other threads
+    (flock alone doesn't) and lets the owning thread nest acquisitions
+    without re-locking the file.
+    """
+
+    # lock file path -> [thread lock, open handle, nesting depth]
+    _states = {}
+    _states_guard = threading.Lock()
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        key = str(self.path.resolve())
+        with FileLock._states_guard:
+            self._state = FileLock._states.setdefault(key, [threading.RLock(), None, 0])
+
+    def __enter__(self):
+        state = self._state
+        state[0].acquire()
+        if state[2] == 0:
+            state[1] = open(self.path, 'a')
+            if fcntl is not None:
+                fcntl.flock(state[1].fileno(), fcntl.LOCK_EX)
+        state[2] += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        state = self._state
+        state[2] -= 1
+        if state[2] == 0:
+            if fcntl is not None:
+                fcntl.flock(state[1].fileno(), fcntl.LOCK_UN)
+            state[1].close()
+            state[1] = None
+        state[0].release()
+        return False
+
+
+def file_stamp(path_or_fd: Union[str, Path, int]) -> Optional[Tuple[int, int, int]]:
+    """Version stamp (inode, mtime_ns, size) for a file, or None if it doesn't exist"""
+    try:
+        st = os.stat(path_or_fd)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def atomic_write_json(path: Union[str, Path], data, indent: Optional[int] = 2, fsync: bool = True):
+    """
+    Write JSON to a temp file in the same directory, then rename it over path
+
+    The rename is atomic, so concurrent readers see either the old or the
+    new file, never a partially written one.
+    """
+    atomic_write_text(path, json.dumps(data, indent=indent), fsync=fsync)
+
+
+def atomic_write_text(path: Union[str, Path], text: str, fsync: bool = True):
+    """atomic_write_json() for text that is already serialized"""
+    path = Path(path)
+    # A unique temp name, so concurrent writers never share a temp file
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def exclusive(method):
+    """Run a repository method while holding its RWLock for writing"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.write():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def shared(method):
+    """Run a repository method while holding its RWLock for reading"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.read():
+            return method(self, *args, **kwargs)
+    return wrapper
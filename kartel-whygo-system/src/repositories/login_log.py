@@ -0,0 +1,141 @@
+"""
+Login log
+
+Last-login timestamps are kept out of employees.json: recording a login
+appends one short line to an append-only JSONL file and updates an
+in-memory map, so a login never rewrites the data files. On startup the
+log is replayed (keeping the latest login per person). Once it holds many
+more lines than people, the next login compacts it.
+
+Appends and compaction hold the data directory's file lock. Compaction
+re-reads the log under the lock, so other processes' logins are kept, and
+an appender whose file was replaced by a compaction reopens the new one.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+from .locking import FileLock, atomic_write_text, file_stamp
+from .json_repository import LOCK_FILE
+
+
+class LoginLog:
+    """Append-only log of logins with an in-memory person_id -> last login map"""
+
+    FILE_NAME = "logins.jsonl"
+
+    def __init__(self, data_dir: str = "data/", compact_slack: int = 1000):
+        """
+        Args:
+            data_dir: Directory holding the log file
+            compact_slack: Compact once the log has this many more lines
+                than distinct people
+        """
+        self.path = Path(data_dir) / self.FILE_NAME
+        self.compact_slack = compact_slack
+        self._file_lock = FileLock(Path(data_dir) / LOCK_FILE)
+        self._last_login: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        # Lines in the log as far as we know (other processes append too)
+        self._entries = self._replay()
+
+    def _replay(self) -> int:
+        """Load the latest login per person from the log; returns lines read"""
+        if not self.path.exists():
+            return 0
+
+        entries = 0
+        with open(self.path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    person_id, at = entry['person_id'], entry['at']
+                except (ValueError, KeyError):
+                    # A torn final line from an interrupted append
+                    print(f"⚠️  Skipping unreadable login log entry: {line[:80]}")
+                    continue
+                entries += 1
+                if at > self._last_login.get(person_id, ''):
+                    self._last_login[person_id] = at
+        return entries
+
+    def record(self, person_id: str, at: Optional[str] = None) -> str:
+        """
+        Record a login
+
+        Returns:
+            The login timestamp (ISO format)
+        """
+        at = at or datetime.now().isoformat()
+        line = json.dumps({'person_id': person_id, 'at': at}) + '\n'
+        with self._file_lock:
+            with self._lock:
+                self._last_login[person_id] = at
+                self._reopen_if_replaced()
+                self._file.write(line)
+                self._entries += 1
+                needs_compaction = self._entries - len(self._last_login) >= self.compact_slack
+            if needs_compaction:
+                self.compact()
+        return at
+
+    def _reopen_if_replaced(self):
+        """Open the append handle, or reopen it if the log was replaced (caller holds both locks)"""
+        if self._file is not None:
+            stamp = file_stamp(self.path)
+            if stamp is not None and stamp[0] == os.fstat(self._file.fileno()).st_ino:
+                return
+            self._file.close()
+        self._file = open(self.path, 'a', buffering=1)
+
+    def last_login(self, person_id: str) -> Optional[str]:
+        """Most recent login of a person, or None if never logged"""
+        return self._last_login.get(person_id)
+
+    def apply_to(self, repo) -> int:
+        """
+        Copy logged logins onto the people of a freshly loaded repository
+
+        Only the in-memory Person objects change; the repository isn't
+        marked dirty.
+
+        Returns:
+            Number of people updated
+        """
+        updated = 0
+        for person_id, at in list(self._last_login.items()):
+            person = repo.get_person(person_id)
+            if person is not None and (person.last_login or '') < at:
+                person.last_login = at
+                updated += 1
+        return updated
+
+    def compact(self):
+        """Rewrite the log with one line per person"""
+        with self._file_lock:
+            with self._lock:
+                # Merge what other processes logged since we loaded, so the
+                # rewritten log doesn't drop their logins
+                self._replay()
+                lines = ''.join(
+                    json.dumps({'person_id': person_id, 'at': at}) + '\n'
+                    for person_id, at in self._last_login.items()
+                )
+                atomic_write_text(self.path, lines)
+                self._entries = len(self._last_login)
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,134 @@
+"""
+Hot reload of file-backed repositories
+
+Polls the data files of the live repositories (mtime/size/inode stamps)
+and, when another process such as scripts/import_whygos.py or
+scripts/record_progress.py has changed them, loads a fresh repository in
+the background and swaps it in. Requests already running keep the
+repository object they started with; new requests get the fresh one.
+"""
+
+import threading
+from typing import Callable, List, Optional
+
+
+class WatchedRepository:
+    """A repository slot the reloader keeps fresh"""
+
+    def __init__(
+        self,
+        name: str,
+        get_current: Callable[[], object],
+        load: Callable[[], object],
+        swap: Callable[[object, object], bool]
+    ):
+        """
+        Args:
+            name: Label used in log messages
+            get_current: Returns the repository currently being served
+            load: Builds a fresh repository from disk
+            swap: Replaces old with new if old is still current; returns success
+        """
+        self.name = name
+        self.get_current = get_current
+        self.load = load
+        self.swap = swap
+
+
+class RepositoryReloader:
+    """Background poller that swaps in freshly loaded repositories"""
+
+    def __init__(self, interval_seconds: float = 2.0):
+        self.interval_seconds = interval_seconds
+        self._watched: List[WatchedRepository] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, watched: WatchedRepository):
+        """Add a repository slot to poll"""
+        self._watched.append(watched)
+
+    def check_once(self) -> int:
+        """
+        Reload every watched repository whose files changed on disk
+
+        A repository still holding unsaved in-memory changes is saved first:
+        its save_all() merges the pending changes into the other process's
+        files (see JsonWhygoRepository.save_all), so a reload never
+        discards a pending write and a conflicted repository doesn't keep
+        serving stale data.
+
+        Returns:
+            Number of repositories swapped
+        """
+        swapped = 0
+        for watched in self._watched:
+            current = watched.get_current()
+            if current is None or not hasattr(current, 'has_external_changes'):
+                continue
+            if not current.has_external_changes():
+                continue
+
+            if current.has_unsaved_changes():
+                if not self._save_pending(watched, current):
+                    continue
+                if not current.has_external_changes():
+                    # The save merged in everything the other process wrote
+                    continue
+
+            try:
+                fresh = watched.load()
+            except Exception as e:
+                # Likely caught another process mid-write; retry next poll
+                print(f"⚠️  Could not reload {watched.name} repository: {e}")
+                continue
+
+            if current.has_unsaved_changes():
+                # Changed again while loading; save and reload next poll
+                continue
+
+            if watched.swap(current, fresh):
+                print(f"🔄 Reloaded {watched.name} repository from disk")
+                swapped += 1
+
+        return swapped
+
+    @staticmethod
+    def _save_pending(watched: WatchedRepository, current) -> bool:
+        """Write a repository's pending changes before reloading it"""
+        conflicts = getattr(current, 'conflicts', 0)
+        try:
+            saved = current.save_all()
+        except Exception as e:
+            print(f"⚠️  Could not save pending {watched.name} changes before reloading: {e}")
+            return False
+
+        if getattr(current, 'conflicts', 0) != conflicts:
+            print(f"⚠️  {watched.name} repository had a write conflict: {current.last_conflict}")
+        if not saved and current.has_unsaved_changes():
+            print(f"⚠️  Not reloading {watched.name} repository: its pending changes could not be saved")
+            return False
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.check_once()
+            except Exception as e:
+                print(f"⚠️  Repository reload check failed: {e}")
+
+    def start(self):
+        """Start polling in a daemon thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="repository-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop polling and wait for the thread to exit"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
@@ -0,0 +1,607 @@
+"""
+SQLite implementation of repository interfaces
+
+Stores each record as a JSON document alongside the indexed columns used
+for lookups, so quarterly values keep their original int/float/str types.
+The database runs in WAL mode, which lets several API worker processes
+share one consistent store. Every mutating call runs in its own short
+transaction (BEGIN IMMEDIATE ... COMMIT, rolled back on error), so one
+request never commits another's half-applied writes and the database
+write lock is never held between calls; save_all() has nothing left to
+commit. Both repositories share a connection per database file.
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Union
+from .interfaces import IWhygoRepository, IProgressRepository, next_data_version
+from .events import (
+    EventBus,
+    OUTCOME_UPDATED,
+    GOAL_CREATED,
+    GOAL_UPDATED,
+    PERSON_UPDATED,
+    PROGRESS_RECORDED
+)
+from .json_repository import JsonWhygoRepository, JsonProgressRepository
+from .login_log import LoginLog
+from ..models.whygo import (
+    CompanyWhyGO,
+    DepartmentWhyGO,
+    IndividualWhyGO,
+    Outcome,
+    ProgressUpdate,
+    Person,
+    Department,
+    GoalTransition,
+    can_transition,
+    whygo_to_dict,
+    whygo_from_dict,
+    outcome_to_dict,
+    outcome_from_dict,
+    person_to_dict,
+    person_from_dict,
+    department_to_dict,
+    department_from_dict,
+    progress_update_to_dict,
+    progress_update_from_dict
+)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS people (
+    id TEXT PRIMARY KEY,
+    email TEXT,
+    department_id TEXT,
+    manager_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_people_email ON people (lower(email));
+CREATE INDEX IF NOT EXISTS idx_people_department ON people (department_id);
+CREATE INDEX IF NOT EXISTS idx_people_manager ON people (manager_id);
+
+CREATE TABLE IF NOT EXISTS departments (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS goals (
+    id TEXT PRIMARY KEY,
+    level TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    department_id TEXT,
+    person_id TEXT,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_goals_level ON goals (level, position);
+CREATE INDEX IF NOT EXISTS idx_goals_department ON goals (department_id);
+CREATE INDEX IF NOT EXISTS idx_goals_person ON goals (person_id);
+CREATE INDEX IF NOT EXISTS idx_goals_status ON goals (status, level);
+
+CREATE TABLE IF NOT EXISTS outcomes (
+    id TEXT PRIMARY KEY,
+    goal_id TEXT NOT NULL REFERENCES goals (id),
+    position INTEGER NOT NULL,
+    owner_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outcomes_goal ON outcomes (goal_id, position);
+CREATE INDEX IF NOT EXISTS idx_outcomes_owner ON outcomes (owner_id);
+
+CREATE TABLE IF NOT EXISTS progress_updates (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    outcome_id TEXT NOT NULL,
+    recorded_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_progress_outcome ON progress_updates (outcome_id, seq);
+"""
+
+GOAL_LEVELS = ('company', 'department', 'individual')
+
+# One connection (and lock) per database file within a process, so the WhyGO
+# and progress repositories write through the same transaction
+_shared_connections = {}
+_shared_connections_lock = threading.Lock()
+
+
+# Seconds a write waits for another process's transaction before failing
+BUSY_TIMEOUT_S = 5.0
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """Open a WAL-mode connection and make sure the schema exists"""
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    # Parameterized statements are compiled once and reused from this cache
+    conn = sqlite3.connect(
+        db_path, timeout=BUSY_TIMEOUT_S, check_same_thread=False, cached_statements=256
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _shared_connection(db_path: str):
+    """Get the process-wide (connection, lock) pair for a database file"""
+    key = str(Path(db_path).resolve())
+    with _shared_connections_lock:
+        if key not in _shared_connections:
+            _shared_connections[key] = (connect(db_path), threading.RLock())
+        return _shared_connections[key]
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection, lock: threading.RLock):
+    """
+    One unit of work on the shared connection
+
+    Holds the connection lock, commits on success and rolls back on any
+    error, so nothing is left open for another caller to commit.
+    """
+    with lock:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+
+def _goal_document(goal: Union[CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO]) -> str:
+    """Serialize a goal without its outcomes (those live in their own table)"""
+    data = whygo_to_dict(goal)
+    data.pop("outcomes")
+    return json.dumps(data)
+
+
+class SqliteWhygoRepository(IWhygoRepository):
+    """SQLite-backed implementation of WhyGO repository"""
+
+    def __init__(self, db_path: str = "data/whygo.db", events: Optional[EventBus] = None):
+        self.db_path = db_path
+        self.events = events if events is not None else EventBus()
+        # Connection is shared with SqliteProgressRepository; the lock
+        # serializes access from the threadpool
+        self._conn, self._lock = _shared_connection(db_path)
+        # PRAGMA data_version as last read, and how often it has changed
+        self._data_version = None
+        self._external_version = 0
+        self.external_version()
+        self.touch()
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _build_goals(self, rows: list) -> list:
+        """Attach outcomes to goal rows of (id, data) in a single query"""
+        if not rows:
+            return []
+
+        goal_ids = [row[0] for row in rows]
+        placeholders = ",".join("?" * len(goal_ids))
+        outcome_rows = self._query(
+            f"SELECT goal_id, data FROM outcomes WHERE goal_id IN ({placeholders}) "
+            f"ORDER BY goal_id, position",
+            tuple(goal_ids)
+        )
+
+        outcomes_by_goal = {}
+        for goal_id, data in outcome_rows:
+            outcomes_by_goal.setdefault(goal_id, []).append(json.loads(data))
+
+        goals = []
+        for goal_id, data in rows:
+            goal_data = json.loads(data)
+            goal_data["outcomes"] = outcomes_by_goal.get(goal_id, [])
+            goals.append(whygo_from_dict(goal_data))
+        return goals
+
+    def _goals_where(self, where: str, params: tuple = ()) -> list:
+        rows = self._query(f"SELECT id, data FROM goals WHERE {where} ORDER BY position", params)
+        return self._build_goals(rows)
+
+    def get_all_company_goals(self) -> List[CompanyWhyGO]:
+        """Get all company-level WhyGOs"""
+        return self._goals_where("level = ?", ('company',))
+
+    def get_company_goal(self, goal_id: str) -> Optional[CompanyWhyGO]:
+        """Get a specific company WhyGO by ID"""
+        goals = self._goals_where("id = ? AND level = ?", (goal_id, 'company'))
+        return goals[0] if goals else None
+
+    def get_all_department_goals(self) -> List[DepartmentWhyGO]:
+        """Get all department-level WhyGOs"""
+        return self._goals_where("level = ?", ('department',))
+
+    def get_department_goals_by_department(self, dept_id: str) -> List[DepartmentWhyGO]:
+        """Get all WhyGOs for a specific department"""
+        return self._goals_where("department_id = ? AND level = ?", (dept_id, 'department'))
+
+    def get_all_individual_goals(self) -> List[IndividualWhyGO]:
+        """Get all individual-level WhyGOs"""
+        return self._goals_where("level = ?", ('individual',))
+
+    def get_individual_goals_by_person(self, person_id: str) -> List[IndividualWhyGO]:
+        """Get all WhyGOs for a specific person"""
+        return self._goals_where("person_id = ? AND level = ?", (person_id, 'individual'))
+
+    def get_goal(self, goal_id: str) -> Optional[Union[CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO]]:
+        """Get a WhyGO of any level by ID"""
+        goals = self._goals_where("id = ?", (goal_id,))
+        return goals[0] if goals else None
+
+    def get_outcome(self, outcome_id: str) -> Optional[Outcome]:
+        """Find an outcome by ID across all goals"""
+        rows = self._query("SELECT data FROM outcomes WHERE id = ?", (outcome_id,))
+        return outcome_from_dict(json.loads(rows[0][0])) if rows else None
+
+    def get_outcomes_by_owner(self, owner_id: str) -> List[Outcome]:
+        """Get all outcomes owned by a person across all goals"""
+        rows = self._query(
+            "SELECT o.data FROM outcomes o JOIN goals g ON g.id = o.goal_id "
+            "WHERE o.owner_id = ? "
+            "ORDER BY CASE g.level WHEN 'company' THEN 0 WHEN 'department' THEN 1 ELSE 2 END, "
+            "g.position, o.position",
+            (owner_id,)
+        )
+        return [outcome_from_dict(json.loads(data)) for (data,) in rows]
+
+    def update_outcome(self, outcome: Outcome) -> bool:
+        """Update an outcome (committed immediately)"""
+        try:
+            with _transaction(self._conn, self._lock) as conn:
+                cursor = conn.execute(
+                    "UPDATE outcomes SET owner_id = ?, data = ? WHERE id = ?",
+                    (outcome.owner_id, json.dumps(outcome_to_dict(outcome)), outcome.id)
+                )
+                if cursor.rowcount == 0:
+                    return False
+
+                row = conn.execute(
+                    "SELECT g.id, g.data FROM goals g JOIN outcomes o ON o.goal_id = g.id WHERE o.id = ?",
+                    (outcome.id,)
+                ).fetchone()
+                goal_data = json.loads(row[1])
+                goal_data["updated_at"] = datetime.now().isoformat()
+                conn.execute(
+                    "UPDATE goals SET data = ? WHERE id = ?",
+                    (json.dumps(goal_data), row[0])
+                )
+        except sqlite3.Error as e:
+            print(f"Error updating outcome {outcome.id}: {e}")
+            return False
+        version = self.touch()
+
+        self.events.publish(OUTCOME_UPDATED, outcome, version)
+        return True
+
+    def external_version(self) -> int:
+        """Changes whenever another connection, e.g. another worker process, commits"""
+        with self._lock:
+            (data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+            if data_version != self._data_version:
+                if self._data_version is not None:
+                    self._external_version += 1
+                self._data_version = data_version
+            return self._external_version
+
+    @property
+    def version(self) -> int:
+        """Data version; also moves forward when another process has committed"""
+        with self._lock:
+            seen = self._external_version
+            if self.external_version() != seen:
+                self._version = next_data_version()
+            return self._version
+
+    @version.setter
+    def version(self, value: int):
+        self._version = value
+
+    def save_all(self) -> bool:
+        """Nothing to do: every change is committed by the call that made it"""
+        return True
+
+    # Person/User methods
+    def get_person(self, person_id: str) -> Optional[Person]:
+        """Get a person by ID"""
+        rows = self._query("SELECT data FROM people WHERE id = ?", (person_id,))
+        return person_from_dict(json.loads(rows[0][0])) if rows else None
+
+    def get_person_by_email(self, email: str) -> Optional[Person]:
+        """Get a person by email address"""
+        if not email:
+            return None
+        rows = self._query("SELECT data FROM people WHERE lower(email) = ? LIMIT 1", (email.lower(),))
+        return person_from_dict(json.loads(rows[0][0])) if rows else None
+
+    def get_all_people(self) -> List[Person]:
+        """Get all people/employees"""
+        rows = self._query("SELECT data FROM people ORDER BY rowid")
+        return [person_from_dict(json.loads(data)) for (data,) in rows]
+
+    def get_people_by_department(self, dept_id: str) -> List[Person]:
+        """Get all people in a specific department"""
+        rows = self._query("SELECT data FROM people WHERE department_id = ? ORDER BY rowid", (dept_id,))
+        return [person_from_dict(json.loads(data)) for (data,) in rows]
+
+    def get_direct_reports(self, manager_id: str) -> List[Person]:
+        """Get all people whose manager is manager_id"""
+        rows = self._query("SELECT data FROM people WHERE manager_id = ? ORDER BY rowid", (manager_id,))
+        return [person_from_dict(json.loads(data)) for (data,) in rows]
+
+    def update_person(self, person: Person) -> bool:
+        """Update a person's information (committed immediately)"""
+        try:
+            with _transaction(self._conn, self._lock) as conn:
+                cursor = conn.execute(
+                    "UPDATE people SET email = ?, department_id = ?, manager_id = ?, data = ? WHERE id = ?",
+                    (person.email, person.department_id, person.manager_id,
+                     json.dumps(person_to_dict(person)), person.id)
+                )
+                if cursor.rowcount == 0:
+                    return False
+        except sqlite3.Error as e:
+            print(f"Error updating person {person.id}: {e}")
+            return False
+        version = self.touch()
+
+        self.events.publish(PERSON_UPDATED, person, version)
+        return True
+
+    # Department methods
+    def get_department(self, dept_id: str) -> Optional[Department]:
+        """Get a department by ID"""
+        rows = self._query("SELECT data FROM departments WHERE id = ?", (dept_id,))
+        return department_from_dict(json.loads(rows[0][0])) if rows else None
+
+    def get_all_departments(self) -> List[Department]:
+        """Get all departments"""
+        rows = self._query("SELECT data FROM departments ORDER BY rowid")
+        return [department_from_dict(json.loads(data)) for (data,) in rows]
+
+    # Goal creation/update methods
+    def _insert_goal(self, goal, position: int):
+        """Insert a goal row and its outcome rows"""
+        self._conn.execute(
+            "INSERT INTO goals (id, level, position, department_id, person_id, status, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (goal.id, goal.level, position,
+             getattr(goal, 'department_id', None), getattr(goal, 'person_id', None),
+             goal.status, _goal_document(goal))
+        )
+        self._conn.executemany(
+            "INSERT INTO outcomes (id, goal_id, position, owner_id, data) VALUES (?, ?, ?, ?, ?)",
+            [
+                (o.id, goal.id, idx, o.owner_id, json.dumps(outcome_to_dict(o)))
+                for idx, o in enumerate(goal.outcomes)
+            ]
+        )
+
+    def create_individual_goal(self, goal: IndividualWhyGO) -> bool:
+        """Create a new individual goal (committed immediately)"""
+        try:
+            with _transaction(self._conn, self._lock) as conn:
+                if conn.execute("SELECT 1 FROM goals WHERE id = ?", (goal.id,)).fetchone():
+                    return False
+                goal.created_at = datetime.now().isoformat()
+                goal.updated_at = goal.created_at
+                (position,) = conn.execute(
+                    "SELECT COALESCE(MAX(position), -1) + 1 FROM goals WHERE level = ?",
+                    ('individual',)
+                ).fetchone()
+                self._insert_goal(goal, position)
+        except sqlite3.Error as e:
+            print(f"Error creating goal {goal.id}: {e}")
+            return False
+        version = self.touch()
+
+        self.events.publish(GOAL_CREATED, goal, version)
+        return True
+
+    def update_individual_goal(self, goal: IndividualWhyGO) -> bool:
+        """Update an existing individual goal (committed immediately)"""
+        try:
+            with _transaction(self._conn, self._lock) as conn:
+                row = conn.execute(
+                    "SELECT position, status FROM goals WHERE id = ? AND level = ?",
+                    (goal.id, 'individual')
+                ).fetchone()
+                if row is None:
+                    return False
+                position, from_status = row
+                if goal.status != from_status and not can_transition(from_status, goal.status):
+                    print(f"❌ Invalid status transition for {goal.id}: {from_status} -> {goal.status}")
+                    return False
+                goal.updated_at = datetime.now().isoformat()
+                conn.execute("DELETE FROM outcomes WHERE goal_id = ?", (goal.id,))
+                conn.execute("DELETE FROM goals WHERE id = ?", (goal.id,))
+                self._insert_goal(goal, position)
+        except sqlite3.Error as e:
+            print(f"Error updating goal {goal.id}: {e}")
+            return False
+        version = self.touch()
+
+        self.events.publish(GOAL_UPDATED, goal, version)
+        if goal.status != from_status:
+            self._emit_transition(GoalTransition(goal, from_status, goal.status, at=goal.updated_at))
+        return True
+
+    def transition_goal_status(self, goal_id: str, to_status: str, actor_id: Optional[str] = None) -> bool:
+        """Move a goal to a new lifecycle status (committed immediately)"""
+        goal = self.get_goal(goal_id)
+        if goal is None:
+            return False
+
+        try:
+            with _transaction(self._conn, self._lock) as conn:
+                (from_status,) = conn.execute(
+                    "SELECT status FROM goals WHERE id = ?", (goal_id,)
+                ).fetchone()
+                if not can_transition(from_status, to_status):
+                    print(f"❌ Invalid status transition for {goal_id}: {from_status} -> {to_status}")
+                    return False
+
+                goal.status = to_status
+                if to_status == 'approved' and hasattr(goal, 'approved_by'):
+                    goal.approved_by = actor_id
+                goal.updated_at = datetime.now().isoformat()
+                conn.execute(
+                    "UPDATE goals SET status = ?, data = ? WHERE id = ?",
+                    (to_status, _goal_document(goal), goal_id)
+                )
+        except sqlite3.Error as e:
+            print(f"Error changing status of goal {goal_id}: {e}")
+            return False
+        self.touch()
+
+        self._emit_transition(GoalTransition(goal, from_status, to_status, actor_id, goal.updated_at))
+        return True
+
+    def get_goals_by_status(self, status: str) -> dict:
+        """Get goals filtered by status"""
+        return {
+            level: self._goals_where("status = ? AND level = ?", (status, level))
+            for level in GOAL_LEVELS
+        }
+
+    def count_goals_by_status(self, status: str) -> dict:
+        """Count goals with a status"""
+        counts = dict(self._query(
+            "SELECT level, COUNT(*) FROM goals WHERE status = ? GROUP BY level", (status,)
+        ))
+        return {level: counts.get(level, 0) for level in GOAL_LEVELS}
+
+
+class SqliteProgressRepository(IProgressRepository):
+    """SQLite-backed implementation of progress update repository"""
+
+    def __init__(self, db_path: str = "data/whygo.db", events: Optional[EventBus] = None):
+        self.db_path = db_path
+        self.events = events if events is not None else EventBus()
+        self._conn, self._lock = _shared_connection(db_path)
+
+    def record_progress(self, update: ProgressUpdate) -> bool:
+        """Record a progress update (committed immediately)"""
+        try:
+            with _transaction(self._conn, self._lock) as conn:
+                conn.execute(
+                    "INSERT INTO progress_updates (id, outcome_id, recorded_at, data) VALUES (?, ?, ?, ?)",
+                    (update.id, update.outcome_id, update.recorded_at,
+                     json.dumps(progress_update_to_dict(update)))
+                )
+        except sqlite3.Error as e:
+            print(f"Error recording progress update {update.id}: {e}")
+            return False
+        self.events.publish(PROGRESS_RECORDED, update)
+        return True
+
+    def get_updates_for_outcome(self, outcome_id: str) -> List[ProgressUpdate]:
+        """Get all progress updates for a specific outcome"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM progress_updates WHERE outcome_id = ? ORDER BY seq",
+                (outcome_id,)
+            ).fetchall()
+        return [progress_update_from_dict(json.loads(data)) for (data,) in rows]
+
+    def get_all_updates(self) -> List[ProgressUpdate]:
+        """Get all progress updates"""
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM progress_updates ORDER BY seq").fetchall()
+        return [progress_update_from_dict(json.loads(data)) for (data,) in rows]
+
+    def save_all(self) -> bool:
+        """Nothing to do: every update is committed by record_progress()"""
+        return True
+
+
+def migrate_json_to_sqlite(data_dir: str, db_path: str) -> dict:
+    """
+    One-shot import of the JSON data files into a SQLite database
+
+    Existing rows in the target database are replaced. Last-login times
+    from the login log (logins.jsonl) are folded into the people rows.
+
+    Args:
+        data_dir: Directory containing the data/*.json files
+        db_path: SQLite database file to create or overwrite
+
+    Returns:
+        dict of row counts per table
+    """
+    whygo_repo = JsonWhygoRepository(data_dir=data_dir)
+    progress_repo = JsonProgressRepository(data_dir=data_dir)
+    LoginLog(data_dir=data_dir).apply_to(whygo_repo)
+
+    conn = connect(db_path)
+    try:
+        with conn:
+            for table in ('progress_updates', 'outcomes', 'goals', 'departments', 'people'):
+                conn.execute(f"DELETE FROM {table}")
+
+            conn.executemany(
+                "INSERT INTO people (id, email, department_id, manager_id, data) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (p.id, p.email, p.department_id, p.manager_id, json.dumps(person_to_dict(p)))
+                    for p in whygo_repo.get_all_people()
+                ]
+            )
+            conn.executemany(
+                "INSERT INTO departments (id, data) VALUES (?, ?)",
+                [(d.id, json.dumps(department_to_dict(d))) for d in whygo_repo.get_all_departments()]
+            )
+
+            all_goals = (
+                whygo_repo.get_all_company_goals()
+                + whygo_repo.get_all_department_goals()
+                + whygo_repo.get_all_individual_goals()
+            )
+            positions = {}
+            goal_rows, outcome_rows = [], []
+            for goal in all_goals:
+                position = positions.get(goal.level, 0)
+                positions[goal.level] = position + 1
+                goal_rows.append((
+                    goal.id, goal.level, position,
+                    getattr(goal, 'department_id', None), getattr(goal, 'person_id', None),
+                    goal.status, _goal_document(goal)
+                ))
+                outcome_rows.extend(
+                    (o.id, goal.id, idx, o.owner_id, json.dumps(outcome_to_dict(o)))
+                    for idx, o in enumerate(goal.outcomes)
+                )
+
+            conn.executemany(
+                "INSERT INTO goals (id, level, position, department_id, person_id, status, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                goal_rows
+            )
+            conn.executemany(
+                "INSERT INTO outcomes (id, goal_id, position, owner_id, data) VALUES (?, ?, ?, ?, ?)",
+                outcome_rows
+            )
+            conn.executemany(
+                "INSERT INTO progress_updates (id, outcome_id, recorded_at, data) VALUES (?, ?, ?, ?)",
+                [
+                    (u.id, u.outcome_id, u.recorded_at, json.dumps(progress_update_to_dict(u)))
+                    for u in progress_repo.get_all_updates()
+                ]
+            )
+
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ('people', 'departments', 'goals', 'outcomes', 'progress_updates')
+        }
+    finally:
+        conn.close()
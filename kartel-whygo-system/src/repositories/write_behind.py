@@ -0,0 +1,267 @@
+"""
+Write-behind flushing of repository changes
+
+Instead of every request calling save_all() itself, mutations are
+submitted to a WriteBehindFlusher and a background thread writes them
+out: once interval_ms has passed since the first unflushed mutation, or
+as soon as max_mutations have piled up, whichever comes first. Many
+updates then share one write of each changed file.
+
+Callers that need to know their change is on disk can wait for
+durability (wait_durable / wait_durable_async), which also triggers an
+immediate flush.
+
+A repository whose save fails is retried with exponential backoff, up to
+max_retries times; then the flusher gives up on it (logged once) until
+its next submitted change. health() reports repositories whose changes
+are not on disk.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Longest wait between retries of a failing save
+MAX_RETRY_DELAY_S = 30.0
+
+
+class _FlushFailure:
+    """Consecutive failed saves of one repository"""
+
+    __slots__ = ('repo', 'failures', 'last_error', 'retry_at', 'gave_up')
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.failures = 0
+        self.last_error = None
+        self.retry_at = 0.0
+        self.gave_up = False
+
+
+class WriteBehindFlusher:
+    """Background thread coalescing repository saves"""
+
+    def __init__(self, interval_ms: float = 200, max_mutations: int = 100, max_retries: int = 5):
+        """
+        Args:
+            interval_ms: Longest a submitted mutation waits before being flushed
+            max_mutations: Flush immediately once this many mutations are pending
+            max_retries: Retries of a failing save before giving up on it
+        """
+        self.interval_ms = interval_ms
+        self.max_mutations = max_mutations
+        self.max_retries = max_retries
+        self._cond = threading.Condition()
+        # Repositories with submitted but unflushed changes (id -> repo)
+        self._dirty = {}
+        # Repositories whose last save failed (id -> failure state)
+        self._failed: Dict[int, _FlushFailure] = {}
+        self._pending = 0
+        self._first_pending_at = 0.0
+        self._flush_requested = False
+        # Mutation sequence numbers: last submitted, last covered by a
+        # flush attempt, last durably written
+        self._submitted = 0
+        self._attempted = 0
+        self._durable = 0
+        # (sequence number, event loop, future) for async durability waiters
+        self._async_waiters: List[Tuple[int, asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, repo) -> int:
+        """
+        Queue a repository's in-memory changes for the next flush
+
+        Returns:
+            Sequence number of this mutation (see wait_durable)
+        """
+        with self._cond:
+            self._dirty[id(repo)] = repo
+            self._submitted += 1
+            if self._pending == 0:
+                self._first_pending_at = time.monotonic()
+            self._pending += 1
+            self._cond.notify_all()
+            return self._submitted
+
+    def wait_durable(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush now and block until everything submitted so far is on disk
+
+        Returns:
+            True if written, False if the flush failed or timed out
+        """
+        with self._cond:
+            target = self._submitted
+            if self._durable >= target:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: self._attempted >= target, timeout)
+            return self._durable >= target
+
+    async def wait_durable_async(self) -> bool:
+        """wait_durable() for coroutines, without tying up a thread"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._cond:
+            target = self._submitted
+            if self._durable >= target:
+                return True
+            self._async_waiters.append((target, loop, future))
+            self._flush_requested = True
+            self._cond.notify_all()
+        return await future
+
+    def _retrying(self) -> List[_FlushFailure]:
+        return [f for f in self._failed.values() if not f.gave_up and id(f.repo) not in self._dirty]
+
+    def _prune_failures(self):
+        """Forget failures of repositories since saved some other way (caller holds the lock)"""
+        for key, failure in list(self._failed.items()):
+            if hasattr(failure.repo, 'has_unsaved_changes') and not failure.repo.has_unsaved_changes():
+                del self._failed[key]
+
+    def _next_flush_at(self) -> Optional[float]:
+        """Monotonic time the next flush is due, or None if nothing is waiting"""
+        if self._stopping:
+            # stop() queued the failing repositories for one last attempt
+            return 0.0 if self._pending else None
+        retrying = self._retrying()
+        if self._flush_requested:
+            return 0.0 if self._pending or retrying else None
+
+        due = [f.retry_at for f in retrying]
+        if self._pending:
+            if self._pending >= self.max_mutations:
+                return 0.0
+            due.append(self._first_pending_at + self.interval_ms / 1000)
+        return min(due) if due else None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    flush_at = self._next_flush_at()
+                    if flush_at is None:
+                        if self._stopping:
+                            return
+                        self._cond.wait()
+                        continue
+                    remaining = flush_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                target = self._submitted
+                now = time.monotonic()
+                # Failing repositories wait for their backoff unless a flush
+                # was asked for
+                repos = list(self._dirty.values()) + [
+                    f.repo for f in self._retrying() if self._flush_requested or f.retry_at <= now
+                ]
+                self._dirty.clear()
+                self._pending = 0
+                self._flush_requested = False
+
+            errors = {}
+            for repo in repos:
+                try:
+                    if not repo.save_all():
+                        errors[id(repo)] = "save_all() failed"
+                except Exception as e:
+                    print(f"Error flushing {type(repo).__name__}: {e}")
+                    errors[id(repo)] = str(e)
+
+            with self._cond:
+                self._attempted = max(self._attempted, target)
+                for repo in repos:
+                    if id(repo) in errors:
+                        self._record_failure(repo, errors[id(repo)])
+                    else:
+                        self._failed.pop(id(repo), None)
+                # Earlier changes of a repository that is still failing aren't on disk
+                self._prune_failures()
+                if not self._failed:
+                    self._durable = max(self._durable, target)
+                self._cond.notify_all()
+
+                ready = [w for w in self._async_waiters if w[0] <= target]
+                self._async_waiters = [w for w in self._async_waiters if w[0] > target]
+                durable = self._durable
+
+            for sequence, loop, future in ready:
+                loop.call_soon_threadsafe(_resolve, future, durable >= sequence)
+
+    def _record_failure(self, repo, error: str):
+        """Schedule a retry of a failed save, or give up after max_retries (caller holds the lock)"""
+        failure = self._failed.get(id(repo))
+        if failure is None or failure.gave_up:
+            # First failure, or the first since we last gave up
+            failure = self._failed[id(repo)] = _FlushFailure(repo)
+        failure.failures += 1
+        failure.last_error = error
+
+        if failure.failures > self.max_retries:
+            failure.gave_up = True
+            print(
+                f"❌ Giving up on flushing {type(repo).__name__} after {failure.failures} failed saves; "
+                f"its changes stay in memory until the next change is saved ({error})"
+            )
+        else:
+            delay = self.interval_ms / 1000 * 2 ** (failure.failures - 1)
+            failure.retry_at = time.monotonic() + min(delay, MAX_RETRY_DELAY_S)
+
+    def health(self) -> dict:
+        """
+        Repositories whose changes the flusher could not write
+
+        Returns:
+            {'healthy': bool, 'failing': [{'repository', 'failures',
+            'last_error', 'gave_up'}]}; repositories since saved some
+            other way (e.g. by the reloader) are left out
+        """
+        with self._cond:
+            self._prune_failures()
+            return {
+                'healthy': not self._failed,
+                'failing': [
+                    {
+                        'repository': type(f.repo).__name__,
+                        'failures': f.failures,
+                        'last_error': f.last_error,
+                        'gave_up': f.gave_up
+                    }
+                    for f in self._failed.values()
+                ]
+            }
+
+    def start(self):
+        """Start the flusher thread"""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="write-behind-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Flush whatever is pending and stop the thread"""
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            # One last attempt for repositories still failing
+            for failure in self._failed.values():
+                if id(failure.repo) not in self._dirty:
+                    self._dirty[id(failure.repo)] = failure.repo
+                    self._pending += 1
+            self._cond.notify_all()
+        self._thread.join()
+        self._thread = None
+
+
+def _resolve(future: asyncio.Future, result: bool):
+    if not future.done():
+        future.set_result(result)
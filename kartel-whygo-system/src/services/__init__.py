@@ -4,10 +4,21 @@ Service layer for business logic
 Services contain all business logic and coordinate between repositories.
 """
 
-from .progress_service import ProgressService
+from .progress_service import ProgressService, AsyncProgressService
 from .whygo_service import WhygoService
+from .rollup_cache import StatusRollupCache
+from .cascade_rollup import CascadeRollupEngine
+from .org_chart import OrgChart
+from .approval_queue import ApprovalQueue
+from .status_feed import StatusFeed
 
 __all__ = [
     'ProgressService',
-    'WhygoService'
+    'AsyncProgressService',
+    'WhygoService',
+    'StatusRollupCache',
+    'CascadeRollupEngine',
+    'OrgChart',
+    'ApprovalQueue',
+    'StatusFeed'
 ]
@@ -0,0 +1,108 @@
+"""
+Approval Queue - Pending individual goals indexed by who can approve them
+
+Mirrors ValidationService.can_approve_goal:
+- Executives can approve any goal
+- Department heads can approve goals of people in their department
+- A direct manager can approve their reports' goals
+
+Pending goals are bucketed by their owner's manager and department, so an
+approver's queue is read from at most two buckets instead of scanning
+every goal. Call goal_added() after a goal is created and goal_updated()
+after its owner changes; status changes arrive through goal_transitioned(),
+registered as a repository transition listener. A freshly loaded
+repository needs a new queue.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+from ..models.whygo import IndividualWhyGO, Outcome, GoalTransition
+from ..repositories.interfaces import IWhygoRepository
+
+PENDING_STATUS = 'pending_approval'
+
+
+class ApprovalQueue:
+    """Pending-approval goals keyed by approver"""
+
+    def __init__(self, repo: IWhygoRepository):
+        self.repo = repo
+        self._lock = threading.Lock()
+        # goal_id -> goal, in the order goals became pending
+        self._pending: Dict[str, IndividualWhyGO] = {}
+        self._by_manager: Dict[str, Dict[str, IndividualWhyGO]] = {}
+        self._by_department: Dict[str, Dict[str, IndividualWhyGO]] = {}
+        # goal_id -> (manager_id, department_id) it is filed under
+        self._filed: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+        for goal in self.repo.get_all_individual_goals():
+            if goal.status == PENDING_STATUS:
+                self._file(goal)
+
+    def _file(self, goal: IndividualWhyGO):
+        owner = self.repo.get_person(goal.person_id)
+        manager_id = owner.manager_id if owner else None
+        department_id = owner.department_id if owner else None
+
+        self._pending[goal.id] = goal
+        if manager_id:
+            self._by_manager.setdefault(manager_id, {})[goal.id] = goal
+        if department_id:
+            self._by_department.setdefault(department_id, {})[goal.id] = goal
+        self._filed[goal.id] = (manager_id, department_id)
+
+    def _unfile(self, goal_id: str):
+        self._pending.pop(goal_id, None)
+        manager_id, department_id = self._filed.pop(goal_id, (None, None))
+        if manager_id:
+            self._by_manager.get(manager_id, {}).pop(goal_id, None)
+        if department_id:
+            self._by_department.get(department_id, {}).pop(goal_id, None)
+
+    def goal_added(self, goal):
+        """File a newly created goal if it awaits approval"""
+        self.goal_updated(goal)
+
+    def goal_updated(self, goal):
+        """Re-file a goal after its status or owner changed"""
+        if not isinstance(goal, IndividualWhyGO):
+            return
+        with self._lock:
+            self._unfile(goal.id)
+            if goal.status == PENDING_STATUS:
+                self._file(goal)
+
+    def goal_transitioned(self, transition: GoalTransition):
+        """Repository transition listener: re-file a goal after its status changed"""
+        if PENDING_STATUS in (transition.from_status, transition.to_status):
+            self.goal_updated(transition.goal)
+
+    def outcome_updated(self, outcome: Outcome):
+        """Outcome progress doesn't affect approvals"""
+        pass
+
+    def pending_for(self, approver_id: str) -> List[IndividualWhyGO]:
+        """
+        Pending goals the approver may approve
+
+        Returns:
+            Goals in the order they became pending (for department heads,
+            their direct reports' goals first); empty if the approver
+            doesn't exist
+        """
+        approver = self.repo.get_person(approver_id)
+        if not approver:
+            return []
+
+        with self._lock:
+            if approver.level == 'executive':
+                return list(self._pending.values())
+
+            # Direct reports' goals first, then the rest of the department's
+            goals = dict(self._by_manager.get(approver_id, {}))
+            if approver.level == 'department_head':
+                goals.update(self._by_department.get(approver.department_id, {}))
+            return list(goals.values())
+
+    def pending_count(self) -> int:
+        return len(self._pending)
@@ -0,0 +1,309 @@
+"""
+Cascade Rollup Engine - Goal health aggregated through the WhyGO hierarchy
+
+Materializes the goal DAG (IndividualWhyGO.parent_goal_ids ->
+DepartmentWhyGO.parent_goal_ids -> CompanyWhyGO) once, with child lists
+and a topological order, and keeps per-quarter aggregates for every node's
+subtree. When an outcome changes, only the ancestors of its goal are
+updated; when a goal is replaced (new parents or outcomes), only the
+subtrees of its old and new ancestors are recomputed.
+
+Scoring per outcome and quarter:
+- [+] = 1.0, [~] = 0.5, [-] = 0.0, no status = not scored
+- health   = score sum / scored outcomes (None if nothing scored)
+- coverage = scored outcomes / total outcomes
+Every outcome carries equal weight, so a goal with more outcomes under it
+weighs more in its parent's health. A goal that ladders to several parents
+counts towards each of them, and once towards any goal further up however
+many paths lead there.
+"""
+
+import threading
+from typing import Dict, List, Optional, Set
+from ..repositories.interfaces import IWhygoRepository
+from ..repositories.events import ChangeEvent, GOAL_UPDATED
+from ..models.whygo import Outcome
+
+QUARTERS = ('Q1', 'Q2', 'Q3', 'Q4')
+STATUS_SCORES = {'+': 1.0, '~': 0.5, '-': 0.0}
+
+
+def _contribution(outcomes) -> List[List[float]]:
+    """Per quarter [score sum, scored count, total count] for a set of outcomes"""
+    totals = [[0.0, 0, 0] for _ in QUARTERS]
+    for outcome in outcomes:
+        statuses = (outcome.status_q1, outcome.status_q2, outcome.status_q3, outcome.status_q4)
+        for q, status in enumerate(statuses):
+            totals[q][2] += 1
+            score = STATUS_SCORES.get(status)
+            if score is not None:
+                totals[q][0] += score
+                totals[q][1] += 1
+    return totals
+
+
+class _Node:
+    """One goal in the cascade"""
+
+    __slots__ = ('goal_id', 'level', 'parents', 'children', 'own', 'subtree')
+
+    def __init__(self, goal_id: str, level: str, parents: List[str]):
+        self.goal_id = goal_id
+        self.level = level
+        self.parents = parents
+        self.children: List[str] = []
+        # Per quarter [score sum, scored, total] for this goal's own outcomes
+        # and for the goal plus everything that ladders up to it
+        self.own = [[0.0, 0, 0] for _ in QUARTERS]
+        self.subtree = [[0.0, 0, 0] for _ in QUARTERS]
+
+
+class CascadeRollupEngine:
+    """
+    Health and coverage for every goal including the goals beneath it
+
+    Call outcome_updated() after an outcome's statuses change and
+    goal_added() after a goal is created. Replaced goals arrive through the
+    repository's EventBus; close() stops following it.
+    """
+
+    def __init__(self, repo: IWhygoRepository):
+        self.repo = repo
+        self._lock = threading.Lock()
+        self._build()
+        self._subscription = None
+        if repo.events is not None:
+            self._subscription = repo.events.subscribe(self._on_event, kinds=(GOAL_UPDATED,))
+
+    def _build(self):
+        self._nodes: Dict[str, _Node] = {}
+        # outcome_id -> (goal_id, per-quarter contribution last applied)
+        self._outcomes: Dict[str, tuple] = {}
+        self.topological_order: List[str] = []
+        self._external_version = self.repo.external_version()
+
+        goals = (
+            self.repo.get_all_company_goals()
+            + self.repo.get_all_department_goals()
+            + self.repo.get_all_individual_goals()
+        )
+
+        for goal in goals:
+            self._nodes[goal.id] = _Node(goal.id, goal.level, list(getattr(goal, 'parent_goal_ids', [])))
+            for outcome in goal.outcomes:
+                self._outcomes[outcome.id] = (goal.id, _contribution([outcome]))
+            self._nodes[goal.id].own = _contribution(goal.outcomes)
+
+        # Link children, dropping references to goals that don't exist
+        for node in self._nodes.values():
+            node.parents = [p for p in dict.fromkeys(node.parents) if p in self._nodes and p != node.goal_id]
+            for parent_id in node.parents:
+                self._nodes[parent_id].children.append(node.goal_id)
+
+        self.topological_order = self._topological_sort()
+
+        # Each goal's outcomes count once towards every distinct ancestor, so
+        # a goal reached along two paths (a diamond) isn't counted twice
+        for node in self._nodes.values():
+            node.subtree = [[0.0, 0, 0] for _ in QUARTERS]
+        for goal_id, node in self._nodes.items():
+            for ancestor_id in self._ancestors(goal_id):
+                self._add(self._nodes[ancestor_id].subtree, node.own)
+
+    def _on_event(self, event: ChangeEvent):
+        self.goal_updated(event.data)
+
+    def _refresh(self):
+        """Rebuild if another process changed the data (caller holds the lock)"""
+        if self.repo.external_version() != self._external_version:
+            self._build()
+
+    @staticmethod
+    def _add(totals: List[List[float]], delta: List[List[float]], sign: int = 1):
+        for q in range(4):
+            for i in range(3):
+                totals[q][i] += sign * delta[q][i]
+
+    def _related(self, goal_id: str, links: str) -> Set[str]:
+        """A goal plus everything reachable through its parents or children"""
+        seen = {goal_id}
+        stack = [goal_id]
+        while stack:
+            for related_id in getattr(self._nodes[stack.pop()], links):
+                if related_id not in seen:
+                    seen.add(related_id)
+                    stack.append(related_id)
+        return seen
+
+    def _ancestors(self, goal_id: str) -> Set[str]:
+        """A goal and every distinct goal it ladders up to"""
+        return self._related(goal_id, 'parents')
+
+    def _descendants(self, goal_id: str) -> Set[str]:
+        """A goal and every distinct goal laddering up to it"""
+        return self._related(goal_id, 'children')
+
+    def _topological_sort(self) -> List[str]:
+        """Order goals so every goal appears after all goals laddering up to it"""
+        pending_children = {goal_id: len(node.children) for goal_id, node in self._nodes.items()}
+        ready = [goal_id for goal_id, count in pending_children.items() if count == 0]
+        order = []
+
+        while ready:
+            goal_id = ready.pop()
+            order.append(goal_id)
+            for parent_id in self._nodes[goal_id].parents:
+                pending_children[parent_id] -= 1
+                if pending_children[parent_id] == 0:
+                    ready.append(parent_id)
+
+        if len(order) != len(self._nodes):
+            # A cycle in parent_goal_ids; break it by dropping the offending edges
+            cyclic = set(self._nodes) - set(order)
+            print(f"⚠️  Goal hierarchy has a cycle through: {sorted(cyclic)}")
+            for goal_id in cyclic:
+                node = self._nodes[goal_id]
+                for parent_id in node.parents:
+                    if parent_id in cyclic:
+                        self._nodes[parent_id].children.remove(goal_id)
+                node.parents = [p for p in node.parents if p not in cyclic]
+            return self._topological_sort()
+
+        return order
+
+    def _propagate(self, goal_id: str, delta: List[List[float]]):
+        """Add a delta to a goal's subtree totals and, once, to every ancestor's"""
+        for ancestor_id in self._ancestors(goal_id):
+            self._add(self._nodes[ancestor_id].subtree, delta)
+
+    def outcome_updated(self, outcome: Outcome):
+        """Re-score one outcome and update its goal's ancestor path"""
+        with self._lock:
+            previous = self._outcomes.get(outcome.id)
+            if previous is None:
+                # Outcome we haven't seen; take its goal as it is now
+                goal = self.repo.get_goal(outcome.goal_id)
+                if goal is None:
+                    return
+                if goal.id in self._nodes:
+                    self._replace_goal(goal)
+                else:
+                    self._add_goal(goal)
+                return
+
+            goal_id, old = previous
+            new = _contribution([outcome])
+            if new == old:
+                return
+
+            delta = [[new[q][i] - old[q][i] for i in range(3)] for q in range(4)]
+            self._add(self._nodes[goal_id].own, delta)
+            self._outcomes[outcome.id] = (goal_id, new)
+            self._propagate(goal_id, delta)
+
+    def goal_added(self, goal):
+        """Attach a newly created goal under its parents"""
+        with self._lock:
+            if goal.id not in self._nodes:
+                self._add_goal(goal)
+
+    def goal_updated(self, goal):
+        """Re-attach a replaced goal under its current parents with its current outcomes"""
+        with self._lock:
+            if goal.id in self._nodes:
+                self._replace_goal(goal)
+            else:
+                self._add_goal(goal)
+
+    def _replace_goal(self, goal):
+        node = self._nodes[goal.id]
+        affected = self._ancestors(goal.id)
+
+        for outcome_id in [o for o, (goal_id, _) in self._outcomes.items() if goal_id == goal.id]:
+            del self._outcomes[outcome_id]
+        for outcome in goal.outcomes:
+            self._outcomes[outcome.id] = (goal.id, _contribution([outcome]))
+        node.own = _contribution(goal.outcomes)
+
+        for parent_id in node.parents:
+            self._nodes[parent_id].children.remove(goal.id)
+        # A parent beneath the goal itself would close a cycle
+        descendants = self._descendants(goal.id)
+        node.parents = [
+            p for p in dict.fromkeys(getattr(goal, 'parent_goal_ids', []))
+            if p in self._nodes and p not in descendants
+        ]
+        for parent_id in node.parents:
+            self._nodes[parent_id].children.append(goal.id)
+
+        # Only the old and new ancestors' subtrees can have changed
+        affected |= self._ancestors(goal.id)
+        for goal_id in affected:
+            subtree = [[0.0, 0, 0] for _ in QUARTERS]
+            for descendant_id in self._descendants(goal_id):
+                self._add(subtree, self._nodes[descendant_id].own)
+            self._nodes[goal_id].subtree = subtree
+        self.topological_order = self._topological_sort()
+
+    def _add_goal(self, goal):
+        parents = [
+            p for p in dict.fromkeys(getattr(goal, 'parent_goal_ids', []))
+            if p in self._nodes and p != goal.id
+        ]
+        node = _Node(goal.id, goal.level, parents)
+        node.own = _contribution(goal.outcomes)
+        self._nodes[goal.id] = node
+        for outcome in goal.outcomes:
+            self._outcomes[outcome.id] = (goal.id, _contribution([outcome]))
+        for parent_id in parents:
+            self._nodes[parent_id].children.append(goal.id)
+
+        # New goals are leaves, so they can go first in the order
+        self.topological_order.insert(0, goal.id)
+        self._propagate(goal.id, node.own)
+
+    def get_children(self, goal_id: str) -> List[str]:
+        """IDs of goals that ladder directly up to a goal"""
+        node = self._nodes.get(goal_id)
+        return list(node.children) if node else []
+
+    def get_goal_health(self, goal_id: str) -> Optional[dict]:
+        """
+        Health and coverage of a goal, its own outcomes and its whole cascade
+
+        Returns:
+            dict with per-quarter figures, or None if the goal is unknown
+        """
+        with self._lock:
+            self._refresh()
+            node = self._nodes.get(goal_id)
+            if node is None:
+                return None
+
+            def figures(totals):
+                score_sum, scored, total = totals
+                return {
+                    'health': round(score_sum / scored, 3) if scored else None,
+                    'coverage': round(scored / total, 3) if total else None,
+                    'scored_outcomes': scored,
+                    'total_outcomes': total
+                }
+
+            return {
+                'goal_id': node.goal_id,
+                'level': node.level,
+                'parent_goal_ids': list(node.parents),
+                'child_goal_ids': list(node.children),
+                'quarters': {
+                    quarter: {
+                        'own': figures(node.own[q]),
+                        'cascade': figures(node.subtree[q])
+                    }
+                    for q, quarter in enumerate(QUARTERS)
+                }
+            }
+
+    def close(self):
+        """Stop following the repository's change events"""
+        if self._subscription is not None:
+            self._subscription.close()
@@ -6,13 +6,16 @@ from typing import Optional
 from datetime import datetime
 from ..models.whygo import Person
 from ..repositories.interfaces import IWhygoRepository
+from .approval_queue import ApprovalQueue
 
 
 class OnboardingService:
     """Service for onboarding flow and context"""
 
-    def __init__(self, repo: IWhygoRepository):
+    def __init__(self, repo: IWhygoRepository, approval_queue: ApprovalQueue):
         self.repo = repo
+        # Shared queue kept current by the repository's transition listener
+        self.approval_queue = approval_queue
 
     def get_onboarding_context(self, person_id: str) -> Optional[dict]:
         """
@@ -25,7 +28,7 @@ class OnboardingService:
         - Company goals (all users see these)
         - Department goals (filtered by user's department)
         - Individual goals (user's own goals)
-        - Pending approvals (if user is a manager/dept head)
+        - Pending approvals the user can approve (if manager/dept head/executive)
 
         Args:
             person_id: Person to get context for
@@ -51,19 +54,11 @@ class OnboardingService:
         individual_goals = self.repo.get_individual_goals_by_person(person_id)
 
         # Get pending approvals if user is a manager/dept head/executive
+        # (executives: all; department heads: their department; managers:
+        # their direct reports - same rules as ValidationService.can_approve_goal)
         pending_approvals = []
         if person.level in ['department_head', 'manager', 'executive']:
-            all_pending = self.repo.get_goals_by_status('pending_approval')
-
-            if person.level == 'executive':
-                # Executives see all pending individual goals
-                pending_approvals = all_pending['individual']
-            else:
-                # Managers/dept heads see their direct reports' pending goals
-                pending_approvals = [
-                    g for g in all_pending['individual']
-                    if self.repo.get_person(g.person_id).manager_id == person_id
-                ]
+            pending_approvals = self.approval_queue.pending_for(person_id)
 
         return {
             'person': person,
@@ -85,6 +80,14 @@ class OnboardingService:
         Returns:
             bool indicating success
         """
+        success = self._mark_started(person_id)
+        if success:
+            self.repo.save_all()
+
+        return success
+
+    def _mark_started(self, person_id: str) -> bool:
+        """Set onboarding to in progress in memory (no save)"""
         person = self.repo.get_person(person_id)
         if not person:
             return False
@@ -96,11 +99,7 @@ class OnboardingService:
         person.onboarding_status = 'in_progress'
         person.onboarding_started_at = datetime.now().isoformat()
 
-        success = self.repo.update_person(person)
-        if success:
-            self.repo.save_all()
-
-        return success
+        return self.repo.update_person(person)
 
     def complete_onboarding(self, person_id: str) -> bool:
         """
@@ -112,6 +111,14 @@ class OnboardingService:
         Returns:
             bool indicating success
         """
+        success = self._mark_completed(person_id)
+        if success:
+            self.repo.save_all()
+
+        return success
+
+    def _mark_completed(self, person_id: str) -> bool:
+        """Set onboarding to completed in memory (no save)"""
         person = self.repo.get_person(person_id)
         if not person:
             return False
@@ -123,11 +130,7 @@ class OnboardingService:
         person.onboarding_status = 'completed'
         person.onboarding_completed_at = datetime.now().isoformat()
 
-        success = self.repo.update_person(person)
-        if success:
-            self.repo.save_all()
-
-        return success
+        return self.repo.update_person(person)
 
     def get_onboarding_status(self, person_id: str) -> Optional[dict]:
         """
@@ -148,3 +151,23 @@ class OnboardingService:
             'started_at': person.onboarding_started_at,
             'completed_at': person.onboarding_completed_at
         }
+
+
+class AsyncOnboardingService(OnboardingService):
+    """OnboardingService for async endpoints (repo is an AsyncWhygoRepository)"""
+
+    async def start_onboarding(self, person_id: str) -> bool:
+        """Async start_onboarding()"""
+        success = self._mark_started(person_id)
+        if success:
+            await self.repo.save_all()
+
+        return success
+
+    async def complete_onboarding(self, person_id: str) -> bool:
+        """Async complete_onboarding()"""
+        success = self._mark_completed(person_id)
+        if success:
+            await self.repo.save_all()
+
+        return success
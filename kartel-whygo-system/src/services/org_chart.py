@@ -0,0 +1,158 @@
+"""
+Org Chart - Precomputed reporting structure
+
+Builds the management tree once from Person.manager_id, falling back to
+Department.reports_to for a department head with no manager recorded.
+Each person gets an Euler-tour interval [tin, tout) over a pre-order walk
+of the tree, so:
+
+- direct reports are a dict lookup
+- "everyone under X" is one contiguous slice of the walk
+- "is A under B" is two integer comparisons
+- ancestor chains follow parent links (depth of the org, not its size)
+
+The chart reflects the repository it was built from; dependencies build
+a new one when the repository is reloaded.
+"""
+
+from typing import Dict, List, Optional
+from ..models.whygo import Person
+from ..repositories.interfaces import IWhygoRepository
+
+
+class _Tree:
+    """One immutable build of the chart (swapped whole on refresh)"""
+
+    __slots__ = ('parent', 'children', 'order', 'tin', 'tout', 'depth')
+
+    def __init__(self, parent, children, order, tin, tout, depth):
+        self.parent = parent
+        self.children = children
+        self.order = order
+        self.tin = tin
+        self.tout = tout
+        self.depth = depth
+
+
+class OrgChart:
+    """Manager/report relationships with O(1) subtree membership checks"""
+
+    def __init__(self, repo: IWhygoRepository):
+        self.repo = repo
+        self.refresh()
+
+    def refresh(self):
+        """Rebuild the chart from the repository's current people and departments"""
+        people = self.repo.get_all_people()
+        person_ids = {p.id for p in people}
+
+        dept_reports_to = {
+            dept.head_id: dept.reports_to
+            for dept in self.repo.get_all_departments()
+            if dept.head_id and dept.reports_to
+        }
+
+        parent: Dict[str, Optional[str]] = {}
+        for person in people:
+            manager_id = person.manager_id or dept_reports_to.get(person.id)
+            if manager_id == person.id or manager_id not in person_ids:
+                manager_id = None
+            parent[person.id] = manager_id
+
+        # A manager_id loop would hide everyone on it from the walk; cut
+        # each loop at the person where it is first detected
+        for person_id in parent:
+            seen = set()
+            current = person_id
+            while current is not None and current not in seen:
+                seen.add(current)
+                current = parent[current]
+            if current is not None:
+                print(f"⚠️  Reporting loop at {current}; treating them as top-level")
+                parent[current] = None
+
+        children: Dict[str, List[str]] = {person_id: [] for person_id in parent}
+        roots = []
+        for person in people:
+            manager_id = parent[person.id]
+            if manager_id is None:
+                roots.append(person.id)
+            else:
+                children[manager_id].append(person.id)
+
+        # Iterative pre-order walk assigning Euler-tour intervals
+        order: List[str] = []
+        tin: Dict[str, int] = {}
+        tout: Dict[str, int] = {}
+        depth: Dict[str, int] = {}
+        for root in roots:
+            depth[root] = 0
+            stack = [(root, False)]
+            while stack:
+                person_id, done = stack.pop()
+                if done:
+                    tout[person_id] = len(order)
+                    continue
+                tin[person_id] = len(order)
+                order.append(person_id)
+                stack.append((person_id, True))
+                for child_id in reversed(children[person_id]):
+                    depth[child_id] = depth[person_id] + 1
+                    stack.append((child_id, False))
+
+        self._tree = _Tree(parent, children, order, tin, tout, depth)
+
+    def manager_of(self, person_id: str) -> Optional[str]:
+        """ID of a person's manager (None at the top or if unknown)"""
+        return self._tree.parent.get(person_id)
+
+    def direct_report_ids(self, person_id: str) -> List[str]:
+        """IDs of the people reporting directly to person_id"""
+        return list(self._tree.children.get(person_id, ()))
+
+    def all_report_ids(self, person_id: str) -> List[str]:
+        """IDs of everyone under person_id, in org-chart order"""
+        tree = self._tree
+        start = tree.tin.get(person_id)
+        if start is None:
+            return []
+        return tree.order[start + 1:tree.tout[person_id]]
+
+    def report_count(self, person_id: str) -> int:
+        """Number of people under person_id (all levels)"""
+        tree = self._tree
+        start = tree.tin.get(person_id)
+        if start is None:
+            return 0
+        return tree.tout[person_id] - start - 1
+
+    def is_under(self, person_id: str, manager_id: str) -> bool:
+        """True if person_id reports to manager_id directly or indirectly"""
+        tree = self._tree
+        if person_id not in tree.tin or manager_id not in tree.tin:
+            return False
+        return tree.tin[manager_id] < tree.tin[person_id] < tree.tout[manager_id]
+
+    def ancestor_ids(self, person_id: str) -> List[str]:
+        """Management chain above a person, nearest manager first"""
+        parent = self._tree.parent
+        chain = []
+        current = parent.get(person_id)
+        while current is not None:
+            chain.append(current)
+            current = parent.get(current)
+        return chain
+
+    def depth(self, person_id: str) -> Optional[int]:
+        """Levels below the top of the org (None if unknown)"""
+        return self._tree.depth.get(person_id)
+
+    def direct_reports(self, person_id: str) -> List[Person]:
+        return self._people(self.direct_report_ids(person_id))
+
+    def all_reports(self, person_id: str) -> List[Person]:
+        return self._people(self.all_report_ids(person_id))
+
+    def _people(self, person_ids: List[str]) -> List[Person]:
+        people = (self.repo.get_person(person_id) for person_id in person_ids)
+        return [p for p in people if p is not None]
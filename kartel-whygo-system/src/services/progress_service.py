@@ -5,18 +5,29 @@ Handles recording actuals, calculating status, and managing progress updates.
 """
 
 from datetime import datetime
-from typing import Literal, Union, Optional
+from typing import Dict, List, Literal, Tuple, Union, Optional
 from ..repositories.interfaces import IWhygoRepository, IProgressRepository
 from ..models.whygo import Outcome, ProgressUpdate
 from ..utils.id_generator import generate_progress_update_id
+from .status_engine import StatusEngine, calculate_status, merge_thresholds
 
 
 class ProgressService:
     """Service for managing progress tracking and status calculation"""
 
-    def __init__(self, whygo_repo: IWhygoRepository, progress_repo: IProgressRepository):
+    def __init__(
+        self,
+        whygo_repo: IWhygoRepository,
+        progress_repo: IProgressRepository,
+        status_observers: Optional[List] = None,
+        status_thresholds: Optional[Dict[str, Tuple[float, float]]] = None
+    ):
         self.whygo_repo = whygo_repo
         self.progress_repo = progress_repo
+        # Derived structures (e.g. StatusRollupCache) told about each changed outcome
+        self.status_observers = status_observers or []
+        # metric_type -> (on-pace %, slightly-off %)
+        self.status_thresholds = merge_thresholds(status_thresholds)
 
     def record_actual(
         self,
@@ -48,6 +59,142 @@ class ProgressService:
             print(f"❌ Outcome not found: {outcome_id}")
             return False
 
+        self._apply_actual(outcome, quarter, actual_value, recorded_by, notes, blocker)
+
+        # Persist changes
+        whygo_saved = self.whygo_repo.save_all()
+        progress_saved = self.progress_repo.save_all()
+
+        return whygo_saved and progress_saved
+
+    def record_actuals(self, batch: List[dict], recorded_by: str) -> dict:
+        """
+        Record actual values for many outcomes with a single flush.
+
+        Every item is validated before anything is applied; if any item is
+        invalid, nothing is changed. Otherwise all items are applied in order
+        (statuses calculated as in record_actual), items naming the same
+        outcome all land on it, and both repositories are saved once.
+
+        Args:
+            batch: Items with keys outcome_id, quarter, actual_value and
+                optionally notes, blocker
+            recorded_by: Person ID recorded for every item
+
+        Returns:
+            {'applied': bool, 'saved': bool, 'results': [per-item dict]}
+            where applied is False if validation rejected the batch, and
+            each result has index, outcome_id, quarter, success, status
+            and error
+        """
+        results, outcomes = self._validate_batch(batch, recorded_by)
+        if any(r['error'] for r in results):
+            return {'applied': False, 'saved': False, 'results': results}
+
+        self._apply_batch(batch, outcomes, results, recorded_by)
+
+        # Persist the whole batch at once
+        whygo_saved = self.whygo_repo.save_all()
+        progress_saved = self.progress_repo.save_all()
+
+        return self._batch_saved(results, whygo_saved and progress_saved)
+
+    def _validate_batch(self, batch: List[dict], recorded_by: str) -> Tuple[List[dict], List]:
+        """
+        Per-item results (error set for invalid items) and the outcomes they name
+
+        Items naming the same outcome share one Outcome object, so a backend
+        that returns a fresh copy per lookup (SQLite) doesn't lose all but
+        the last item's change.
+        """
+        results = []
+        outcomes = []
+        by_id: Dict[str, Optional[Outcome]] = {}
+        for index, item in enumerate(batch):
+            outcome_id = item.get('outcome_id')
+            quarter = item.get('quarter')
+            result = {
+                'index': index,
+                'outcome_id': outcome_id,
+                'quarter': quarter,
+                'success': False,
+                'status': None,
+                'error': None
+            }
+            if outcome_id and outcome_id not in by_id:
+                by_id[outcome_id] = self.whygo_repo.get_outcome(outcome_id)
+            outcome = by_id.get(outcome_id)
+
+            if not outcome:
+                result['error'] = f"Outcome not found: {outcome_id}"
+            elif quarter not in ('Q1', 'Q2', 'Q3', 'Q4'):
+                result['error'] = f"Invalid quarter: {quarter}"
+            elif item.get('actual_value') is None:
+                result['error'] = "Missing actual_value"
+            elif not recorded_by:
+                result['error'] = "Missing recorded_by"
+
+            results.append(result)
+            outcomes.append(outcome)
+
+        return results, outcomes
+
+    def _apply_batch(self, batch: List[dict], outcomes: List[Outcome], results: List[dict], recorded_by: str):
+        """Apply a validated batch in memory (no save)"""
+        for item, outcome, result in zip(batch, outcomes, results):
+            result['status'] = self._set_actual(
+                outcome,
+                item['quarter'],
+                item['actual_value'],
+                recorded_by,
+                item.get('notes'),
+                item.get('blocker')
+            )
+
+        # Each changed outcome is stored and announced once, with all its items applied
+        for outcome in {id(o): o for o in outcomes}.values():
+            self._outcome_changed(outcome)
+
+    @staticmethod
+    def _batch_saved(results: List[dict], saved: bool) -> dict:
+        """Final record_actuals() response once the save has finished"""
+        for result in results:
+            result['success'] = saved
+            if not saved:
+                result['error'] = "Failed to save progress"
+
+        return {'applied': True, 'saved': saved, 'results': results}
+
+    def _apply_actual(
+        self,
+        outcome: Outcome,
+        quarter: str,
+        actual_value: Union[int, float, str],
+        recorded_by: str,
+        notes: Optional[str] = None,
+        blocker: Optional[str] = None
+    ) -> Optional[str]:
+        """Set an actual and its status in memory and record the update (no save)"""
+        status = self._set_actual(outcome, quarter, actual_value, recorded_by, notes, blocker)
+        self._outcome_changed(outcome)
+        return status
+
+    def _outcome_changed(self, outcome: Outcome):
+        """Store a changed outcome in the repository and tell the observers"""
+        self.whygo_repo.update_outcome(outcome)
+        for observer in self.status_observers:
+            observer.outcome_updated(outcome)
+
+    def _set_actual(
+        self,
+        outcome: Outcome,
+        quarter: str,
+        actual_value: Union[int, float, str],
+        recorded_by: str,
+        notes: Optional[str] = None,
+        blocker: Optional[str] = None
+    ) -> Optional[str]:
+        """Set an actual and its status on the outcome object and record the update"""
         # Set actual value
         quarter_lower = quarter.lower()
         setattr(outcome, f'actual_{quarter_lower}', actual_value)
@@ -56,13 +203,10 @@ class ProgressService:
         status = self._calculate_status(outcome, quarter)
         setattr(outcome, f'status_{quarter_lower}', status)
 
-        # Update outcome in repository
-        self.whygo_repo.update_outcome(outcome)
-
         # Create progress update record
         update = ProgressUpdate(
-            id=generate_progress_update_id(outcome_id, quarter),
-            outcome_id=outcome_id,
+            id=generate_progress_update_id(outcome.id, quarter),
+            outcome_id=outcome.id,
             quarter=quarter,
             actual_value=actual_value,
             status=status,
@@ -75,11 +219,7 @@ class ProgressService:
         # Record progress update
         self.progress_repo.record_progress(update)
 
-        # Persist changes
-        whygo_saved = self.whygo_repo.save_all()
-        progress_saved = self.progress_repo.save_all()
-
-        return whygo_saved and progress_saved
+        return status
 
     def _calculate_status(
         self,
@@ -94,6 +234,7 @@ class ProgressService:
           - [+] if actual >= target (100%+)
           - [~] if actual >= 80% of target
           - [-] if actual < 80%
+          (thresholds configurable per metric type)
         - Milestone/Boolean:
           - [+] if actual matches target
           - [-] otherwise
@@ -105,48 +246,37 @@ class ProgressService:
         Returns:
             Status symbol ('+', '~', '-') or None if can't calculate
         """
-        quarter_lower = quarter.lower()
-        target = getattr(outcome, f'target_{quarter_lower}')
-        actual = getattr(outcome, f'actual_{quarter_lower}')
-
-        # Can't calculate if either is missing
-        if target is None or actual is None:
-            return None
-
-        metric_type = outcome.metric_type
-
-        # Number-based metrics (number, currency, percentage)
-        if metric_type in ['number', 'currency', 'percentage']:
-            try:
-                # Convert to float for calculation
-                target_val = float(target) if not isinstance(target, (int, float)) else target
-                actual_val = float(actual) if not isinstance(actual, (int, float)) else actual
-
-                if target_val == 0:
-                    # Avoid division by zero - if target is 0 and actual is 0, that's on track
-                    return '+' if actual_val == 0 else '-'
-
-                percentage = (actual_val / target_val) * 100
-
-                if percentage >= 100:
-                    return '+'
-                elif percentage >= 80:
-                    return '~'
-                else:
-                    return '-'
-            except (ValueError, TypeError):
-                print(f"⚠️  Could not convert values to numbers for calculation: target={target}, actual={actual}")
-                return '-'
-
-        # Milestone/Boolean metrics (exact match required)
-        elif metric_type in ['milestone', 'boolean']:
-            # Convert both to strings for comparison (handles case differences)
-            target_str = str(target).strip().lower()
-            actual_str = str(actual).strip().lower()
-            return '+' if actual_str == target_str else '-'
-
-        # Unknown metric type
-        return '-'
+        return calculate_status(outcome, quarter, self.status_thresholds)
+
+    def recompute_statuses(self, engine: StatusEngine) -> int:
+        """
+        Re-apply status rules to every outcome (e.g. after a threshold change).
+
+        Uses the engine's batch computation to find the outcome-quarters whose
+        status changed, updates only those and saves once.
+
+        Returns:
+            Number of outcome-quarters whose status changed, or -1 if saving failed
+        """
+        changes = engine.changed_statuses()
+        changed_outcomes = {}
+        for outcome_id, quarter, status in changes:
+            outcome = changed_outcomes.get(outcome_id) or self.whygo_repo.get_outcome(outcome_id)
+            if not outcome:
+                continue
+            setattr(outcome, f'status_{quarter.lower()}', status)
+            changed_outcomes[outcome_id] = outcome
+
+        for outcome in changed_outcomes.values():
+            self.whygo_repo.update_outcome(outcome)
+            for observer in self.status_observers:
+                observer.outcome_updated(outcome)
+            engine.outcome_updated(outcome)
+
+        if changed_outcomes and not self.whygo_repo.save_all():
+            return -1
+
+        return len(changes)
 
     def get_outcome_progress_history(self, outcome_id: str) -> dict:
         """
@@ -187,3 +317,48 @@ class ProgressService:
                 }
             }
         }
+
+
+class AsyncProgressService(ProgressService):
+    """
+    ProgressService for async endpoints
+
+    Takes AsyncWhygoRepository/AsyncProgressRepository and awaits their
+    save_all(), so recording progress never blocks the event loop on disk
+    I/O. Reads and status calculation are inherited unchanged.
+    """
+
+    async def record_actual(
+        self,
+        outcome_id: str,
+        quarter: Literal['Q1', 'Q2', 'Q3', 'Q4'],
+        actual_value: Union[int, float, str],
+        recorded_by: str,
+        notes: Optional[str] = None,
+        blocker: Optional[str] = None
+    ) -> bool:
+        """Async record_actual()"""
+        outcome = self.whygo_repo.get_outcome(outcome_id)
+        if not outcome:
+            print(f"❌ Outcome not found: {outcome_id}")
+            return False
+
+        self._apply_actual(outcome, quarter, actual_value, recorded_by, notes, blocker)
+
+        whygo_saved = await self.whygo_repo.save_all()
+        progress_saved = await self.progress_repo.save_all()
+
+        return whygo_saved and progress_saved
+
+    async def record_actuals(self, batch: List[dict], recorded_by: str) -> dict:
+        """Async record_actuals()"""
+        results, outcomes = self._validate_batch(batch, recorded_by)
+        if any(r['error'] for r in results):
+            return {'applied': False, 'saved': False, 'results': results}
+
+        self._apply_batch(batch, outcomes, results, recorded_by)
+
+        whygo_saved = await self.whygo_repo.save_all()
+        progress_saved = await self.progress_repo.save_all()
+
+        return self._batch_saved(results, whygo_saved and progress_saved)
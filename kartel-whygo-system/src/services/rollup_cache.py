@@ -0,0 +1,247 @@
+"""
+Status Rollup Cache - Precomputed dashboard aggregates
+
+Keeps outcome status counts for every quarter per company, department,
+person (outcome owner) and goal. Built once from the repository, then
+updated per outcome as progress is recorded instead of being recomputed
+for every dashboard request.
+
+Goals replaced or transitioned through the repository are re-counted from
+its change events, and the cache rebuilds itself when its repository
+merges or reports another process's changes. A reload that swaps in a new
+repository object is left to the cache's owner, which builds a new cache
+from the current repository.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+from ..repositories.interfaces import IWhygoRepository
+from ..repositories.events import ChangeEvent, GOAL_UPDATED, GOAL_TRANSITIONED, REPOSITORY_RELOADED
+from ..models.whygo import CompanyWhyGO, DepartmentWhyGO, Outcome
+
+QUARTERS = ('Q1', 'Q2', 'Q3', 'Q4')
+STATUS_LABELS = {'+': 'on_pace', '~': 'slightly_off', '-': 'off_pace', None: 'not_recorded'}
+
+COMPANY_SCOPE = ('company',)
+
+
+def department_scope(dept_id: str) -> tuple:
+    return ('department', dept_id)
+
+
+def person_scope(person_id: str) -> tuple:
+    return ('person', person_id)
+
+
+def goal_scope(goal_id: str) -> tuple:
+    return ('goal', goal_id)
+
+
+class _Rollup:
+    """Counters for one scope"""
+
+    __slots__ = ('goals', 'outcomes', 'tracked', 'status')
+
+    def __init__(self):
+        self.goals = 0
+        self.outcomes = 0
+        # Per quarter: outcomes with an actual recorded, and status histogram
+        self.tracked = [0, 0, 0, 0]
+        self.status = [{'+': 0, '~': 0, '-': 0, None: 0} for _ in QUARTERS]
+
+
+def _outcome_snapshot(outcome: Outcome) -> Tuple[tuple, tuple]:
+    """(statuses, tracked flags) for all four quarters"""
+    statuses = (outcome.status_q1, outcome.status_q2, outcome.status_q3, outcome.status_q4)
+    tracked = (
+        outcome.actual_q1 is not None,
+        outcome.actual_q2 is not None,
+        outcome.actual_q3 is not None,
+        outcome.actual_q4 is not None
+    )
+    return statuses, tracked
+
+
+class StatusRollupCache:
+    """
+    Incrementally maintained status counts for dashboards
+
+    Call outcome_updated() after an outcome's actuals/statuses change and
+    goal_added() after a goal is created. With follow_events, goal updates,
+    transitions and merges arrive through the repository's EventBus;
+    close() stops following it. Without, the cache is a snapshot apart
+    from the calls above (for short-lived users such as scripts).
+    """
+
+    def __init__(self, repo: IWhygoRepository, follow_events: bool = True):
+        self.repo = repo
+        self._lock = threading.Lock()
+        self._build()
+        self._subscription = None
+        if follow_events and repo.events is not None:
+            self._subscription = repo.events.subscribe(
+                self._on_event, kinds=(GOAL_UPDATED, GOAL_TRANSITIONED, REPOSITORY_RELOADED)
+            )
+
+    def _build(self):
+        self._rollups: Dict[tuple, _Rollup] = {}
+        # outcome_id -> (scopes, statuses, tracked) as last counted
+        self._outcomes: Dict[str, Tuple[tuple, tuple, tuple]] = {}
+        # goal_id -> (goal scopes, outcome IDs) as last counted
+        self._goals: Dict[str, Tuple[tuple, tuple]] = {}
+        self._external_version = self.repo.external_version()
+
+        goals = (
+            self.repo.get_all_company_goals()
+            + self.repo.get_all_department_goals()
+            + self.repo.get_all_individual_goals()
+        )
+        for goal in goals:
+            self._add_goal(goal)
+
+    def _on_event(self, event: ChangeEvent):
+        if event.kind == REPOSITORY_RELOADED:
+            # Only our own repository merging another process's changes; a
+            # reload publishes the replacement (or, from a save on the
+            # repository being replaced, stale data) and the owner rebuilds
+            if event.data is self.repo:
+                with self._lock:
+                    self._build()
+            return
+
+        goal = event.data.goal if event.kind == GOAL_TRANSITIONED else event.data
+        self.goal_updated(goal)
+
+    def _refresh(self):
+        """Rebuild if another process changed the data (caller holds the lock)"""
+        if self.repo.external_version() != self._external_version:
+            self._build()
+
+    @staticmethod
+    def _goal_scopes(goal) -> tuple:
+        """Scopes whose goal count includes this goal"""
+        if isinstance(goal, CompanyWhyGO):
+            return (COMPANY_SCOPE, goal_scope(goal.id))
+        if isinstance(goal, DepartmentWhyGO):
+            return (department_scope(goal.department_id), goal_scope(goal.id))
+        return (goal_scope(goal.id),)
+
+    def _rollup(self, scope: tuple) -> _Rollup:
+        rollup = self._rollups.get(scope)
+        if rollup is None:
+            rollup = self._rollups[scope] = _Rollup()
+        return rollup
+
+    def _add_goal(self, goal):
+        goal_scopes = self._goal_scopes(goal)
+        for scope in goal_scopes:
+            self._rollup(scope).goals += 1
+        for outcome in goal.outcomes:
+            self._add_outcome(goal_scopes + (person_scope(outcome.owner_id),), outcome)
+        self._goals[goal.id] = (goal_scopes, tuple(o.id for o in goal.outcomes))
+
+    def _remove_goal(self, goal_id: str):
+        entry = self._goals.pop(goal_id, None)
+        if entry is None:
+            return
+        goal_scopes, outcome_ids = entry
+        for scope in goal_scopes:
+            self._rollup(scope).goals -= 1
+        for outcome_id in outcome_ids:
+            previous = self._outcomes.pop(outcome_id, None)
+            if previous is not None:
+                self._apply(*previous, -1)
+
+    def _add_outcome(self, scopes: tuple, outcome: Outcome):
+        statuses, tracked = _outcome_snapshot(outcome)
+        self._apply(scopes, statuses, tracked, 1)
+        self._outcomes[outcome.id] = (scopes, statuses, tracked)
+
+    def _apply(self, scopes: tuple, statuses: tuple, tracked: tuple, sign: int):
+        for scope in scopes:
+            rollup = self._rollup(scope)
+            rollup.outcomes += sign
+            for q in range(4):
+                histogram = rollup.status[q]
+                histogram[statuses[q]] = histogram.get(statuses[q], 0) + sign
+                if tracked[q]:
+                    rollup.tracked[q] += sign
+
+    def outcome_updated(self, outcome: Outcome):
+        """Re-count a single outcome after its actuals, statuses or owner changed"""
+        with self._lock:
+            previous = self._outcomes.get(outcome.id)
+            if previous is None:
+                # Outcome we haven't seen; re-count its goal whole
+                goal = self.repo.get_goal(outcome.goal_id)
+                if goal is not None:
+                    self._remove_goal(goal.id)
+                    self._add_goal(goal)
+                return
+
+            scopes, statuses, tracked = previous
+            goal_scopes = scopes[:-1]
+            new_scopes = goal_scopes + (person_scope(outcome.owner_id),)
+            new_statuses, new_tracked = _outcome_snapshot(outcome)
+
+            if (new_scopes, new_statuses, new_tracked) == previous:
+                return
+
+            self._apply(scopes, statuses, tracked, -1)
+            self._apply(new_scopes, new_statuses, new_tracked, 1)
+            self._outcomes[outcome.id] = (new_scopes, new_statuses, new_tracked)
+
+    def goal_added(self, goal):
+        """Count a newly created goal and its outcomes"""
+        with self._lock:
+            if goal.id in self._goals:
+                return
+            self._add_goal(goal)
+
+    def goal_updated(self, goal):
+        """Re-count a goal whose outcomes, owners or department may have changed"""
+        with self._lock:
+            self._remove_goal(goal.id)
+            self._add_goal(goal)
+
+    def status_count(self, scope: tuple, quarter: str, status: Optional[str]) -> int:
+        """Outcomes in a scope with a given status symbol (None = not recorded) in a quarter"""
+        with self._lock:
+            self._refresh()
+            rollup = self._rollups.get(scope)
+            if rollup is None:
+                return 0
+            return rollup.status[QUARTERS.index(quarter)].get(status, 0)
+
+    def summary(self, scope: tuple) -> dict:
+        """
+        Dashboard summary for a scope (all zeros if nothing is counted there)
+
+        Keeps the original Q1 keys and adds a per-quarter breakdown.
+        """
+        with self._lock:
+            self._refresh()
+            rollup = self._rollups.get(scope) or _Rollup()
+
+            quarters = {}
+            for q, quarter in enumerate(QUARTERS):
+                quarters[quarter] = {
+                    'outcomes_tracked': rollup.tracked[q],
+                    'status': {
+                        label: rollup.status[q][symbol]
+                        for symbol, label in STATUS_LABELS.items()
+                    }
+                }
+
+            return {
+                'total_goals': rollup.goals,
+                'total_outcomes': rollup.outcomes,
+                'outcomes_tracked_q1': quarters['Q1']['outcomes_tracked'],
+                'q1_status': dict(quarters['Q1']['status']),
+                'quarters': quarters
+            }
+
+    def close(self):
+        """Stop following the repository's change events"""
+        if self._subscription is not None:
+            self._subscription.close()
@@ -0,0 +1,268 @@
+"""
+Status Engine - Batch status and percentage computation
+
+Computes '+', '~', '-' status and percent-of-target for every outcome and
+quarter at once from an OutcomeColumns store, where targets and actuals
+have already been parsed to numbers. Uses one NumPy pass per quarter when
+NumPy is installed, and a plain loop over the same columns otherwise.
+
+Rules (same as the original per-outcome calculation):
+- Number/Currency/Percentage: [+] at or above the on-pace threshold
+  (default 100% of target), [~] at or above the slightly-off threshold
+  (default 80%), [-] below that or if a value isn't numeric. A target of
+  0 is [+] only if the actual is 0.
+- Milestone/Boolean: [+] if actual matches target (case-insensitive), [-]
+  otherwise.
+- Unknown metric types: [-]
+- No status when target or actual is missing.
+
+Thresholds can be set per numeric metric type.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+from ..models.whygo import Outcome
+from ..models.outcome_columns import (
+    OutcomeColumns, QUARTERS, STATUS_CODES, STATUS_SYMBOLS, STATUS_NONE,
+    METRIC_TYPE_CODES, METRIC_TYPES, TARGET_PRESENT, ACTUAL_PRESENT,
+    TARGET_NUMERIC, ACTUAL_NUMERIC, TEXT_MATCH, parse_quarter_values
+)
+
+try:
+    import numpy as np
+except ImportError:  # Optional: fall back to a Python loop
+    np = None
+
+NUMERIC_METRIC_TYPES = ('number', 'currency', 'percentage')
+TEXT_METRIC_TYPES = ('milestone', 'boolean')
+
+# metric_type -> (on-pace %, slightly-off %)
+DEFAULT_STATUS_THRESHOLDS: Dict[str, Tuple[float, float]] = {
+    'number': (100.0, 80.0),
+    'currency': (100.0, 80.0),
+    'percentage': (100.0, 80.0),
+}
+
+_ON_PACE = STATUS_CODES['+']
+_SLIGHTLY_OFF = STATUS_CODES['~']
+_OFF_PACE = STATUS_CODES['-']
+
+
+def merge_thresholds(overrides: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Tuple[float, float]]:
+    """Default thresholds with per-metric-type overrides applied"""
+    thresholds = dict(DEFAULT_STATUS_THRESHOLDS)
+    for metric_type, (on_pace, slightly_off) in (overrides or {}).items():
+        thresholds[metric_type] = (float(on_pace), float(slightly_off))
+    return thresholds
+
+
+def _status_code(metric_type: str, flags: int, target: float, actual: float, thresholds) -> int:
+    """Status code for one outcome-quarter from its parsed column values"""
+    if not (flags & TARGET_PRESENT and flags & ACTUAL_PRESENT):
+        return STATUS_NONE
+
+    if metric_type in NUMERIC_METRIC_TYPES:
+        if not (flags & TARGET_NUMERIC and flags & ACTUAL_NUMERIC):
+            return _OFF_PACE
+        if target == 0:
+            return _ON_PACE if actual == 0 else _OFF_PACE
+        on_pace, slightly_off = thresholds.get(metric_type, DEFAULT_STATUS_THRESHOLDS['number'])
+        percentage = actual / target * 100
+        if percentage >= on_pace:
+            return _ON_PACE
+        if percentage >= slightly_off:
+            return _SLIGHTLY_OFF
+        return _OFF_PACE
+
+    if metric_type in TEXT_METRIC_TYPES:
+        return _ON_PACE if flags & TEXT_MATCH else _OFF_PACE
+
+    return _OFF_PACE
+
+
+def _percentage(metric_type: str, flags: int, target: float, actual: float) -> Optional[float]:
+    """Percent of target for one outcome-quarter, None if not applicable"""
+    if metric_type not in NUMERIC_METRIC_TYPES:
+        return None
+    if not (flags & TARGET_NUMERIC and flags & ACTUAL_NUMERIC):
+        return None
+    if target == 0:
+        return 100.0 if actual == 0 else None
+    return round(actual / target * 100, 1)
+
+
+def calculate_status(
+    outcome: Outcome,
+    quarter: str,
+    thresholds: Optional[Dict[str, Tuple[float, float]]] = None
+) -> Optional[str]:
+    """Status symbol for one outcome and quarter"""
+    quarter_lower = quarter.lower()
+    flags, target, actual = parse_quarter_values(
+        getattr(outcome, f'target_{quarter_lower}'),
+        getattr(outcome, f'actual_{quarter_lower}')
+    )
+    code = _status_code(outcome.metric_type, flags, target, actual, thresholds or DEFAULT_STATUS_THRESHOLDS)
+    return STATUS_SYMBOLS[code]
+
+
+def calculate_percentage(target, actual, metric_type: str) -> Optional[float]:
+    """Percent of target for a single target/actual pair"""
+    if target is None or actual is None:
+        return None
+    flags, target_num, actual_num = parse_quarter_values(target, actual)
+    return _percentage(metric_type, flags, target_num, actual_num)
+
+
+class StatusEngine:
+    """
+    Statuses and percentages for all outcomes x quarters
+
+    Results are computed lazily in one pass over the column store and
+    cached until an outcome changes or the thresholds are replaced.
+    """
+
+    def __init__(
+        self,
+        columns: OutcomeColumns,
+        thresholds: Optional[Dict[str, Tuple[float, float]]] = None
+    ):
+        self.columns = columns
+        self.thresholds = merge_thresholds(thresholds)
+        self._lock = threading.Lock()
+        # quarter index -> (status codes, percentages) for every row; NumPy
+        # arrays (NaN for no percentage) or lists (None) without NumPy
+        self._results: Optional[List[tuple]] = None
+
+    @classmethod
+    def from_repository(cls, repo, thresholds=None) -> 'StatusEngine':
+        return cls(OutcomeColumns.from_repository(repo), thresholds)
+
+    def outcome_updated(self, outcome: Outcome):
+        """Keep the column store in sync; results are recomputed on next read"""
+        self.columns.outcome_updated(outcome)
+        self._results = None
+
+    def goal_added(self, goal):
+        self.columns.goal_added(goal)
+        self._results = None
+
+    def set_thresholds(self, thresholds: Dict[str, Tuple[float, float]]):
+        """Replace per-metric-type thresholds and recompute everything"""
+        with self._lock:
+            self.thresholds = merge_thresholds(thresholds)
+            self._results = self._compute()
+
+    def _ensure(self) -> List[tuple]:
+        with self._lock:
+            if self._results is None:
+                self._results = self._compute()
+            return self._results
+
+    def _compute(self) -> List[tuple]:
+        with self.columns.lock:
+            if np is not None:
+                return [self._compute_quarter_numpy(quarter) for quarter in QUARTERS]
+            return [self._compute_quarter_python(quarter) for quarter in QUARTERS]
+
+    def _compute_quarter_numpy(self, quarter: str) -> tuple:
+        columns = self.columns
+        if not len(columns):
+            return [], []
+
+        metric = np.frombuffer(columns.metric_types, dtype=np.int8)
+        flags = np.frombuffer(columns.flags(quarter), dtype=np.int8)
+        target = np.frombuffer(columns.targets(quarter), dtype=np.float64)
+        actual = np.frombuffer(columns.actuals(quarter), dtype=np.float64)
+
+        numeric_codes = [METRIC_TYPE_CODES[m] for m in NUMERIC_METRIC_TYPES]
+        text_codes = [METRIC_TYPE_CODES[m] for m in TEXT_METRIC_TYPES]
+        is_numeric_type = np.isin(metric, numeric_codes)
+        is_text_type = np.isin(metric, text_codes)
+
+        present = ((flags & TARGET_PRESENT) != 0) & ((flags & ACTUAL_PRESENT) != 0)
+        both_numeric = ((flags & TARGET_NUMERIC) != 0) & ((flags & ACTUAL_NUMERIC) != 0)
+        zero_target = target == 0
+
+        # Per-row thresholds looked up by metric type
+        on_pace = np.full(len(metric), 100.0)
+        slightly_off = np.full(len(metric), 80.0)
+        for metric_type, (on, slight) in self.thresholds.items():
+            code = METRIC_TYPE_CODES.get(metric_type)
+            if code is None:
+                continue
+            rows = metric == code
+            on_pace[rows] = on
+            slightly_off[rows] = slight
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentage = actual / target * 100
+
+        numeric_status = np.select(
+            [~both_numeric, zero_target, percentage >= on_pace, percentage >= slightly_off],
+            [_OFF_PACE, np.where(actual == 0, _ON_PACE, _OFF_PACE), _ON_PACE, _SLIGHTLY_OFF],
+            default=_OFF_PACE
+        )
+        text_status = np.where((flags & TEXT_MATCH) != 0, _ON_PACE, _OFF_PACE)
+        status = np.select(
+            [~present, is_numeric_type, is_text_type],
+            [STATUS_NONE, numeric_status, text_status],
+            default=_OFF_PACE
+        )
+
+        # NaN where no percentage applies
+        shown = is_numeric_type & both_numeric & (~zero_target | (actual == 0))
+        percentage = np.where(zero_target, 100.0, np.round(percentage, 1))
+        percentages = np.where(shown, percentage, np.nan)
+
+        return status.astype(np.int8), percentages
+
+    def _compute_quarter_python(self, quarter: str) -> tuple:
+        columns = self.columns
+        metric_types = [METRIC_TYPES.get(code) for code in columns.metric_types]
+        statuses = []
+        percentages = []
+        for metric_type, flags, target, actual in zip(
+            metric_types, columns.flags(quarter), columns.targets(quarter), columns.actuals(quarter)
+        ):
+            statuses.append(_status_code(metric_type, flags, target, actual, self.thresholds))
+            percentages.append(_percentage(metric_type, flags, target, actual))
+        return statuses, percentages
+
+    def status(self, outcome_id: str, quarter: str) -> Optional[str]:
+        """Computed status symbol for one outcome and quarter"""
+        row = self.columns.row(outcome_id)
+        if row is None:
+            return None
+        return STATUS_SYMBOLS[int(self._ensure()[QUARTERS.index(quarter)][0][row])]
+
+    def percentage(self, outcome_id: str, quarter: str) -> Optional[float]:
+        """Computed percent of target for one outcome and quarter"""
+        row = self.columns.row(outcome_id)
+        if row is None:
+            return None
+        value = self._ensure()[QUARTERS.index(quarter)][1][row]
+        if value is None or value != value:  # None or NaN
+            return None
+        return float(value)
+
+    def changed_statuses(self) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Outcome-quarters whose computed status differs from the stored one
+
+        Returns:
+            List of (outcome_id, quarter, new status symbol)
+        """
+        results = self._ensure()
+        changes = []
+        with self.columns.lock:
+            for q, quarter in enumerate(QUARTERS):
+                stored = self.columns.statuses(quarter)
+                computed = results[q][0]
+                if np is not None:
+                    rows = np.flatnonzero(np.frombuffer(stored, dtype=np.int8) != computed).tolist()
+                else:
+                    rows = [row for row, code in enumerate(computed) if stored[row] != code]
+                for row in rows:
+                    changes.append((self.columns.outcome_ids[row], quarter, STATUS_SYMBOLS[int(computed[row])]))
+        return changes
@@ -0,0 +1,114 @@
+"""
+Status Feed - Compact deltas of outcome status changes
+
+Subscribes to a repository EventBus and remembers the last known status of
+every outcome quarter. When an outcome_updated event changes any of them,
+it publishes a STATUS_CHANGED event on the same bus whose data is a small
+dict:
+
+    {"outcome_id": ..., "goal_id": ..., "level": ..., "department_id": ...,
+     "person_id": ..., "status": {"q1": "+"}, "version": ...}
+
+status holds only the quarters that changed; person_id is the owner of an
+individual goal and department_id is the goal's (or its owner's)
+department. Updates that leave every
+status as it was (e.g. a new actual still on pace) publish nothing. The
+diff is done once here, not per listener, so live streams only filter.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+from ..models.whygo import Outcome
+from ..repositories.interfaces import IWhygoRepository
+from ..repositories.events import (
+    EventBus,
+    ChangeEvent,
+    OUTCOME_UPDATED,
+    GOAL_CREATED,
+    REPOSITORY_RELOADED
+)
+
+STATUS_CHANGED = 'status_changed'
+
+QUARTERS = ('q1', 'q2', 'q3', 'q4')
+NO_STATUSES = (None, None, None, None)
+
+
+def _statuses(outcome: Outcome) -> Tuple:
+    return (outcome.status_q1, outcome.status_q2, outcome.status_q3, outcome.status_q4)
+
+
+class StatusFeed:
+    """Turns outcome updates into status-change deltas"""
+
+    def __init__(self, bus: EventBus, repo: IWhygoRepository):
+        self.bus = bus
+        self._lock = threading.Lock()
+        self._load(repo)
+        self._subscription = bus.subscribe(self._on_event, kinds=(OUTCOME_UPDATED, GOAL_CREATED, REPOSITORY_RELOADED))
+
+    def _load(self, repo: IWhygoRepository):
+        """Snapshot every outcome's statuses from a repository"""
+        statuses: Dict[str, Tuple] = {}
+        for goals in (repo.get_all_company_goals(), repo.get_all_department_goals(), repo.get_all_individual_goals()):
+            for goal in goals:
+                for outcome in goal.outcomes:
+                    statuses[outcome.id] = _statuses(outcome)
+        with self._lock:
+            self.repo = repo
+            self._statuses = statuses
+
+    def _on_event(self, event: ChangeEvent):
+        if event.kind == REPOSITORY_RELOADED:
+            if isinstance(event.data, IWhygoRepository):
+                self._load(event.data)
+            return
+        if event.kind == GOAL_CREATED:
+            with self._lock:
+                for outcome in event.data.outcomes:
+                    self._statuses[outcome.id] = _statuses(outcome)
+            return
+
+        outcome = event.data
+        current = _statuses(outcome)
+        with self._lock:
+            previous = self._statuses.get(outcome.id, NO_STATUSES)
+            self._statuses[outcome.id] = current
+            repo = self.repo
+        if previous == current:
+            return
+
+        delta = self._delta(repo, outcome, previous, current, event.version)
+        if delta is not None:
+            self.bus.publish(STATUS_CHANGED, delta, event.version)
+
+    @staticmethod
+    def _delta(repo: IWhygoRepository, outcome: Outcome, previous: Tuple, current: Tuple, version: int) -> Optional[dict]:
+        goal = repo.get_goal(outcome.goal_id)
+        if goal is None:
+            return None
+
+        person_id = getattr(goal, 'person_id', None)
+        department_id = getattr(goal, 'department_id', None)
+        if person_id is not None:
+            # Individual goals count towards their owner's department
+            owner = repo.get_person(person_id)
+            department_id = owner.department_id if owner else None
+
+        return {
+            'outcome_id': outcome.id,
+            'goal_id': goal.id,
+            'level': goal.level,
+            'department_id': department_id,
+            'person_id': person_id,
+            'status': {
+                quarter: status
+                for quarter, old, status in zip(QUARTERS, previous, current)
+                if old != status
+            },
+            'version': version
+        }
+
+    def close(self):
+        """Stop following the bus"""
+        self._subscription.close()
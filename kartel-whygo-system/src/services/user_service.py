@@ -2,17 +2,21 @@
 User Service - Business logic for user/employee operations
 """
 
+from collections.abc import Mapping
 from typing import Optional, List
 from datetime import datetime
 from ..models.whygo import Person, Department
 from ..repositories.interfaces import IWhygoRepository
+from ..repositories.login_log import LoginLog
 
 
 class UserService:
     """Service for user profile and team operations"""
 
-    def __init__(self, repo: IWhygoRepository):
+    def __init__(self, repo: IWhygoRepository, login_log: Optional[LoginLog] = None):
         self.repo = repo
+        # Where logins are recorded; without one, last_login is saved with the people data
+        self.login_log = login_log
 
     def get_user_profile(self, person_id: str) -> Optional[dict]:
         """
@@ -29,8 +33,7 @@ class UserService:
         manager = self.repo.get_person(person.manager_id) if person.manager_id else None
 
         # Get direct reports (people who report to this person)
-        all_people = self.repo.get_all_people()
-        direct_reports = [p for p in all_people if p.manager_id == person_id]
+        direct_reports = self.repo.get_direct_reports(person_id)
 
         return {
             'person': person,
@@ -39,6 +42,18 @@ class UserService:
             'direct_reports': direct_reports
         }
 
+    def get_user_context(self, person_id: str) -> Optional['UserContext']:
+        """
+        Lazy version of get_user_profile() for per-request use
+
+        Returns:
+            UserContext, or None if the person doesn't exist
+        """
+        person = self.repo.get_person(person_id)
+        if not person:
+            return None
+        return UserContext(self.repo, person)
+
     def update_profile(self, person_id: str, **updates) -> bool:
         """
         Update a person's profile fields
@@ -50,6 +65,14 @@ class UserService:
         Returns:
             bool indicating success
         """
+        success = self._apply_profile_updates(person_id, updates)
+        if success:
+            self.repo.save_all()
+
+        return success
+
+    def _apply_profile_updates(self, person_id: str, updates: dict) -> bool:
+        """Update a person's fields in memory (no save)"""
         person = self.repo.get_person(person_id)
         if not person:
             return False
@@ -59,27 +82,40 @@ class UserService:
             if hasattr(person, key):
                 setattr(person, key, value)
 
-        success = self.repo.update_person(person)
-        if success:
-            self.repo.save_all()
-
-        return success
+        return self.repo.update_person(person)
 
     def record_login(self, person_id: str) -> bool:
         """
         Record that a user logged in (updates last_login timestamp)
 
+        With a login log this only appends to the log and updates the
+        person in memory; the data files are not rewritten.
+
         Args:
             person_id: Person who logged in
 
         Returns:
             bool indicating success
         """
+        if self.login_log is not None:
+            return self._log_login(person_id)
+
         return self.update_profile(
             person_id,
             last_login=datetime.now().isoformat()
         )
 
+    def _log_login(self, person_id: str) -> bool:
+        """Record a login in the login log and on the in-memory person"""
+        person = self.repo.get_person(person_id)
+        if not person:
+            return False
+
+        person.last_login = self.login_log.record(person_id)
+        # Not a repository write, but cached responses showing last_login are stale now
+        self.repo.touch()
+        return True
+
     def get_team_members(self, person_id: str) -> List[Person]:
         """
         Get all team members (people in the same department)
@@ -106,5 +142,64 @@ class UserService:
         Returns:
             List of Person objects who report to this manager
         """
-        all_people = self.repo.get_all_people()
-        return [p for p in all_people if p.manager_id == person_id]
+        return self.repo.get_direct_reports(person_id)
+
+
+class UserContext(Mapping):
+    """
+    A user's profile, read like the get_user_profile() dict
+
+    Only the person is loaded up front; department, manager and
+    direct_reports are looked up the first time they are read.
+    """
+
+    KEYS = ('person', 'department', 'manager', 'direct_reports')
+
+    def __init__(self, repo: IWhygoRepository, person: Person):
+        self.repo = repo
+        self._values = {'person': person}
+
+    def _resolve(self, key: str):
+        person = self._values['person']
+        if key == 'department':
+            return self.repo.get_department(person.department_id)
+        if key == 'manager':
+            return self.repo.get_person(person.manager_id) if person.manager_id else None
+        return self.repo.get_direct_reports(person.id)
+
+    def __getitem__(self, key: str):
+        try:
+            return self._values[key]
+        except KeyError:
+            if key not in self.KEYS:
+                raise
+        value = self._values[key] = self._resolve(key)
+        return value
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+
+class AsyncUserService(UserService):
+    """UserService for async endpoints (repo is an AsyncWhygoRepository)"""
+
+    async def update_profile(self, person_id: str, **updates) -> bool:
+        """Async update_profile()"""
+        success = self._apply_profile_updates(person_id, updates)
+        if success:
+            await self.repo.save_all()
+
+        return success
+
+    async def record_login(self, person_id: str) -> bool:
+        """Async record_login()"""
+        if self.login_log is not None:
+            return self._log_login(person_id)
+
+        return await self.update_profile(
+            person_id,
+            last_login=datetime.now().isoformat()
+        )
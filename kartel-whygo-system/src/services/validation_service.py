@@ -3,7 +3,7 @@ Validation Service - Business logic for validating WhyGO rules
 """
 
 from typing import List, Tuple
-from ..models.whygo import IndividualWhyGO, Person
+from ..models.whygo import IndividualWhyGO, Outcome, Person
 from ..repositories.interfaces import IWhygoRepository
 
 
@@ -116,9 +116,8 @@ class ValidationService:
             return (False, "Approver not found")
 
         # Find the goal
-        all_individual = self.repo.get_all_individual_goals()
-        goal = next((g for g in all_individual if g.id == goal_id), None)
-        if not goal:
+        goal = self.repo.get_goal(goal_id)
+        if not isinstance(goal, IndividualWhyGO):
             return (False, "Goal not found")
 
         goal_owner = self.repo.get_person(goal.person_id)
@@ -139,6 +138,34 @@ class ValidationService:
 
         return (False, "Only direct manager, department head, or executive can approve this goal")
 
+    def can_record_progress(self, person_id: str, outcome: Outcome) -> Tuple[bool, str]:
+        """
+        Check if a person may record actuals for an outcome
+
+        Allowed for the outcome's owner and for anyone above the owner in
+        the management chain.
+
+        Args:
+            person_id: Person attempting to record progress
+            outcome: Outcome being recorded
+
+        Returns:
+            Tuple of (can_record, reason_message)
+        """
+        if outcome.owner_id == person_id:
+            return (True, "Outcome owner can record progress")
+
+        # Walk up from the owner; seen guards against a cycle in manager_id
+        seen = set()
+        person = self.repo.get_person(outcome.owner_id)
+        while person and person.manager_id and person.id not in seen:
+            if person.manager_id == person_id:
+                return (True, "Manager of the outcome owner can record progress")
+            seen.add(person.id)
+            person = self.repo.get_person(person.manager_id)
+
+        return (False, f"Only the owner of outcome {outcome.id} or their managers can record its progress")
+
     def check_goal_limit(self, person_id: str) -> Tuple[bool, int]:
         """
         Check if person has reached the 3-goal limit
@@ -4,52 +4,41 @@ WhyGO Service - Business logic for retrieving and displaying WhyGOs
 Handles dashboard data retrieval and rollup calculations.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Union
 from ..repositories.interfaces import IWhygoRepository
 from ..models.whygo import CompanyWhyGO, DepartmentWhyGO, IndividualWhyGO, Outcome
+from .status_engine import calculate_percentage
+from .rollup_cache import (
+    StatusRollupCache,
+    COMPANY_SCOPE,
+    department_scope,
+    person_scope,
+    goal_scope
+)
+
+# Sentinel for "no quarter status filter" (None means "not recorded")
+ANY_STATUS = 'any'
 
 
 class WhygoService:
     """Service for retrieving and formatting WhyGO data"""
 
-    def __init__(self, whygo_repo: IWhygoRepository):
+    def __init__(self, whygo_repo: IWhygoRepository, rollups: Optional[StatusRollupCache] = None):
         self.repo = whygo_repo
+        # Shared, incrementally maintained cache when injected; otherwise a
+        # snapshot for this service instance that doesn't subscribe to events
+        self.rollups = rollups if rollups is not None else StatusRollupCache(whygo_repo, follow_events=False)
 
     def get_company_dashboard_data(self) -> dict:
         """
         Get all company goals with summary statistics.
 
         Returns:
-            Dictionary with company goals and summary stats
+            Dictionary with company goals and summary stats for every quarter
         """
-        goals = self.repo.get_all_company_goals()
-
-        # Calculate summary statistics
-        total_outcomes = sum(len(g.outcomes) for g in goals)
-        outcomes_with_q1_data = sum(
-            1 for g in goals for o in g.outcomes if o.actual_q1 is not None
-        )
-
-        # Calculate status distribution for Q1
-        status_counts = {'+': 0, '~': 0, '-': 0, None: 0}
-        for goal in goals:
-            for outcome in goal.outcomes:
-                status = outcome.status_q1
-                status_counts[status] = status_counts.get(status, 0) + 1
-
         return {
-            'goals': goals,
-            'summary': {
-                'total_goals': len(goals),
-                'total_outcomes': total_outcomes,
-                'outcomes_tracked_q1': outcomes_with_q1_data,
-                'q1_status': {
-                    'on_pace': status_counts.get('+', 0),
-                    'slightly_off': status_counts.get('~', 0),
-                    'off_pace': status_counts.get('-', 0),
-                    'not_recorded': status_counts.get(None, 0)
-                }
-            }
+            'goals': self.repo.get_all_company_goals(),
+            'summary': self.rollups.summary(COMPANY_SCOPE)
         }
 
     def get_department_dashboard_data(self, dept_id: str) -> dict:
@@ -71,35 +60,20 @@ class WhygoService:
                 'summary': {}
             }
 
-        # Calculate summary
-        total_outcomes = sum(len(g.outcomes) for g in goals)
-        outcomes_with_q1_data = sum(
-            1 for g in goals for o in g.outcomes if o.actual_q1 is not None
-        )
-
-        # Calculate status distribution for Q1
-        status_counts = {'+': 0, '~': 0, '-': 0, None: 0}
-        for goal in goals:
-            for outcome in goal.outcomes:
-                status = outcome.status_q1
-                status_counts[status] = status_counts.get(status, 0) + 1
-
         return {
             'department_id': dept_id,
             'goals': goals,
-            'summary': {
-                'total_goals': len(goals),
-                'total_outcomes': total_outcomes,
-                'outcomes_tracked_q1': outcomes_with_q1_data,
-                'q1_status': {
-                    'on_pace': status_counts.get('+', 0),
-                    'slightly_off': status_counts.get('~', 0),
-                    'off_pace': status_counts.get('-', 0),
-                    'not_recorded': status_counts.get(None, 0)
-                }
-            }
+            'summary': self.rollups.summary(department_scope(dept_id))
         }
 
+    def get_person_summary(self, person_id: str) -> dict:
+        """Status summary across all outcomes owned by a person"""
+        return self.rollups.summary(person_scope(person_id))
+
+    def get_goal_summary(self, goal_id: str) -> dict:
+        """Status summary for a single goal's outcomes"""
+        return self.rollups.summary(goal_scope(goal_id))
+
     def get_outcome_details(self, outcome_id: str) -> Optional[Dict]:
         """
         Get detailed information about a specific outcome.
@@ -150,22 +124,48 @@ class WhygoService:
 
     def _calculate_percentage(self, target, actual, metric_type: str) -> Optional[float]:
         """Calculate percentage completion for numeric metrics"""
-        if metric_type not in ['number', 'currency', 'percentage']:
-            return None
+        return calculate_percentage(target, actual, metric_type)
+
+    def filter_goals(
+        self,
+        goals: List,
+        status: Optional[str] = None,
+        owner_id: Optional[str] = None,
+        quarter: Optional[str] = None,
+        quarter_status: Union[str, None] = ANY_STATUS
+    ) -> List:
+        """
+        Filter goals without scanning their outcomes.
 
-        if target is None or actual is None:
-            return None
+        Args:
+            goals: Goals to filter (order is kept)
+            status: Goal status ('draft', 'pending_approval', 'approved', 'archived')
+            owner_id: Keep goals owned by this person or with an outcome they own
+            quarter: Quarter for quarter_status ('Q1'..'Q4')
+            quarter_status: Keep goals with at least one outcome in this status
+                ('+', '~', '-', or None for not recorded) in the quarter
 
-        try:
-            target_val = float(target)
-            actual_val = float(actual)
+        Returns:
+            Matching goals
+        """
+        if status is not None:
+            goals = [g for g in goals if g.status == status]
 
-            if target_val == 0:
-                return 100.0 if actual_val == 0 else None
+        if owner_id is not None:
+            owned = {o.goal_id for o in self.repo.get_outcomes_by_owner(owner_id)}
+            goals = [
+                g for g in goals
+                if g.id in owned or getattr(g, 'owner_id', None) == owner_id
+                or getattr(g, 'person_id', None) == owner_id
+            ]
 
-            return round((actual_val / target_val) * 100, 1)
-        except (ValueError, TypeError):
-            return None
+        if quarter is not None and quarter_status is not ANY_STATUS:
+            goals = [
+                g for g in goals
+                if self.rollups.status_count(goal_scope(g.id), quarter, quarter_status) > 0
+            ]
+
+        return goals
 
     def get_all_outcomes_for_person(self, person_id: str) -> List[Outcome]:
         """
@@ -177,24 +177,4 @@ class WhygoService:
         Returns:
             List of outcomes owned by this person
         """
-        outcomes = []
-
-        # Search company goals
-        for goal in self.repo.get_all_company_goals():
-            for outcome in goal.outcomes:
-                if outcome.owner_id == person_id:
-                    outcomes.append(outcome)
-
-        # Search department goals
-        for goal in self.repo.get_all_department_goals():
-            for outcome in goal.outcomes:
-                if outcome.owner_id == person_id:
-                    outcomes.append(outcome)
-
-        # Search individual goals
-        for goal in self.repo.get_all_individual_goals():
-            for outcome in goal.outcomes:
-                if outcome.owner_id == person_id:
-                    outcomes.append(outcome)
-
-        return outcomes
+        return self.repo.get_outcomes_by_owner(person_id)
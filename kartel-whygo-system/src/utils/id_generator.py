@@ -112,13 +112,15 @@ def extract_key_words(text: str, max_words: int = 3) -> str:
 
 def generate_progress_update_id(outcome_id: str, quarter: str) -> str:
     """
-    Generate progress update ID
-    Example: cg_1_o1_q1_update_20260117
+    Generate progress update ID, unique even for updates recorded in the
+    same instant (e.g. several batch items for one outcome and quarter)
+    Example: cg_1_o1_q1_update_20260117093015123456_3f9a0c1e
     """
     from datetime import datetime
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    from uuid import uuid4
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
     quarter_lower = quarter.lower()
-    return f"{outcome_id}_{quarter_lower}_update_{timestamp}"
+    return f"{outcome_id}_{quarter_lower}_update_{timestamp}_{uuid4().hex[:8]}"
 
 
 def extract_owner_name(text: str) -> str:
@@ -0,0 +1,77 @@
+"""
+Metric Values
+
+Canonical parsing of outcome targets and actuals. Values are stored as
+they were written ("Baseline", "$7M", "1,000", "18+", "MVP", 5, 2.5) so
+they display as entered; numeric_value() gives the number behind a value,
+parsing each distinct string once and caching the result.
+"""
+
+import re
+import threading
+from typing import Dict, Optional, Union
+
+# Values meaning "no number yet"
+NULL_MARKERS = {'baseline', 'tbd', 'n/a', '—', '-', ''}
+
+_SCALES = {'k': 1_000, 'm': 1_000_000, 'b': 1_000_000_000}
+
+# "$7M", "1,000", "18+", "75%", "90%+", "2.5k", "-3"
+_NUMBER_PATTERN = re.compile(
+    r'^\$?\s*([-+]?(?:\d[\d,]*(?:\.\d+)?|\.\d+))\s*([KkMmBb])?\s*[%+]*$'
+)
+
+# raw string -> parsed number (None if not numeric)
+_numeric_cache: Dict[str, Optional[float]] = {}
+_numeric_cache_lock = threading.Lock()
+_MAX_CACHED_VALUES = 100_000
+
+
+def is_null_marker(value: str) -> bool:
+    """True for placeholders such as "Baseline" or "TBD" that mean no value"""
+    return value.strip().lower() in NULL_MARKERS
+
+
+def parse_number(value: str) -> Optional[float]:
+    """
+    Parse a display string into a number (uncached)
+
+    - "Baseline", "TBD", "N/A", "—", "" -> None
+    - "1,000" -> 1000.0, "18+" -> 18.0, "75%" -> 75.0
+    - "$7M" -> 7000000.0, "2.5k" -> 2500.0
+    - Anything else ("MVP", "4/5", "3 weeks") -> None
+    """
+    value = value.strip()
+    if value.lower() in NULL_MARKERS:
+        return None
+
+    match = _NUMBER_PATTERN.match(value)
+    if not match:
+        return None
+
+    number = float(match.group(1).replace(',', ''))
+    if match.group(2):
+        number *= _SCALES[match.group(2).lower()]
+    return number
+
+
+def numeric_value(value: Union[int, float, str, None]) -> Optional[float]:
+    """Number behind a stored target/actual, or None if it isn't numeric"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    try:
+        return _numeric_cache[value]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+
+    number = parse_number(str(value))
+    with _numeric_cache_lock:
+        if len(_numeric_cache) >= _MAX_CACHED_VALUES:
+            _numeric_cache.clear()
+        _numeric_cache[value] = number
+    return number